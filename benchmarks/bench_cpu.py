@@ -0,0 +1,142 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.corpus import synthetic_segments, synthetic_transcript
+from economic_youtube_headline_skill.pipeline import run_pipeline
+from economic_youtube_headline_skill.processor import extract_headlines
+from economic_youtube_headline_skill.render import render_json, render_markdown
+from economic_youtube_headline_skill.result_store import append_daily_result
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.state_machine import classify_transcript_state
+from economic_youtube_headline_skill.youtube import _transcript_segments_to_text
+
+# 1-minute short, 10-minute clip, 1-hour show, 6-hour live stream.
+TRANSCRIPT_MINUTES = (1, 10, 60, 360)
+BATCH_SIZES = (10, 100, 1000)
+
+
+def measure(func: Callable[[], object], min_time: float, repeats: int) -> float:
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / repeats or loops >= 1 << 20:
+            break
+        loops *= 2
+    best = elapsed / loops
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def transcript_cases(language: str) -> list[tuple[str, int, Callable[[], object]]]:
+    cases = []
+    for minutes in TRANSCRIPT_MINUTES:
+        for punctuated in (True, False):
+            text = synthetic_transcript("bench", minutes, language, punctuated)
+            segments = synthetic_segments(text, minutes)
+            tag = f"{language}/{minutes}m/{'punct' if punctuated else 'nopunct'}"
+            cases.append((f"extract_headlines {tag}", len(text), lambda text=text: extract_headlines(text, 5)))
+            cases.append(
+                (
+                    f"classify_transcript_state {tag}",
+                    len(text),
+                    lambda text=text: classify_transcript_state(
+                        was_live=False,
+                        transcript_text=text,
+                        min_transcript_chars=700,
+                        allow_partial=True,
+                    ),
+                )
+            )
+            cases.append(
+                (
+                    f"_transcript_segments_to_text {tag}",
+                    len(text),
+                    lambda segments=segments: _transcript_segments_to_text(segments),
+                )
+            )
+    return cases
+
+
+def batch_cases(result_dir: str) -> list[tuple[str, int, Callable[[], object]]]:
+    cases = []
+    for size in BATCH_SIZES:
+        urls = [f"https://www.youtube.com/watch?v=b{index:010d}" for index in range(size)]
+        settings = Settings(mock_transcript_corpus="lang=ko,minutes=1-30,punct=mixed")
+        batch = run_pipeline(urls, settings, run_id="bench")
+        cases.append((f"BatchResult.to_dict results={size}", size, batch.to_dict))
+        cases.append((f"render_markdown results={size}", size, lambda batch=batch: render_markdown(batch)))
+        cases.append((f"render_json results={size}", size, lambda batch=batch: render_json(batch)))
+        cases.append(
+            (
+                f"append_daily_result results={size}",
+                size,
+                lambda batch=batch: append_daily_result(
+                    result_dir=result_dir,
+                    date_key="20260216",
+                    skill_slug="bench",
+                    payload=batch,
+                ),
+            )
+        )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the CPU-bound paths")
+    parser.add_argument("--language", choices=["ko", "en", "mixed"], default="ko")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds spent per case")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--filter", type=str, default="", help="Only run cases containing this text")
+    parser.add_argument("--save-baseline", type=str, default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=str, default=None, help="Compare against a saved baseline")
+    parser.add_argument("--fail-over", type=float, default=0.0, help="Exit 1 if any case is this % slower")
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["cases"] if args.compare else {}
+    measured: dict[str, dict[str, float]] = {}
+    regressions = []
+    print(f"{'case':<52} {'units':>9} {'per op':>12} {'ns/unit':>10} {'ops/s':>11}  vs base")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, units, func in [*transcript_cases(args.language), *batch_cases(tmp)]:
+            if args.filter and args.filter not in name:
+                continue
+            seconds = measure(func, args.min_time, max(1, args.repeats))
+            ns_per_unit = seconds * 1e9 / max(1, units)
+            measured[name] = {"units": units, "seconds": seconds, "ns_per_unit": ns_per_unit}
+            delta = ""
+            if name in baseline:
+                change = (seconds / baseline[name]["seconds"] - 1) * 100
+                delta = f"{change:+6.1f}%"
+                if args.fail_over and change > args.fail_over:
+                    regressions.append(name)
+            print(f"{name:<52} {units:>9} {seconds * 1e6:>10.1f}us {ns_per_unit:>10.1f} {1 / seconds:>11.1f}  {delta}")
+
+    if args.save_baseline:
+        payload = {"python": platform.python_version(), "machine": platform.machine(), "cases": measured}
+        Path(args.save_baseline).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written: {args.save_baseline}")
+    if regressions:
+        print(f"regressions over {args.fail_over}%: {', '.join(regressions)}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import json
+import math
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.pipeline import run_pipeline
+from economic_youtube_headline_skill.render import render_markdown
+from economic_youtube_headline_skill.result_store import append_daily_result
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.tracing import percentile
+from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels, parse_video_id
+from standin_server import Faults, StandinServer, standin_fetch_text, standin_session
+
+
+def _channels(count: int) -> list[str]:
+    return [f"@bench_channel_{index:02d}" for index in range(count)]
+
+
+def run_once(base_url: str, channels: int, batch: int, workers: int, tls_fail_every: int) -> dict:
+    videos_per_channel = math.ceil(batch / channels)
+    started_at: dict[str, float] = {}
+    latencies: list[float] = []
+
+    def log_event(event: str, payload: dict) -> None:
+        now = time.perf_counter()
+        if event == "video_start":
+            started_at[parse_video_id(payload["url"])] = now
+        elif event == "video_done":
+            latencies.append((now - started_at.pop(payload["video_id"], now)) * 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(
+            transcript_languages="ko",
+            extract_workers=workers,
+            log_dir=tmp,
+            result_dir=tmp,
+        )
+        started = time.perf_counter()
+        urls, warnings = collect_video_urls_from_channels(
+            _channels(channels),
+            videos_per_channel,
+            fetch_text=standin_fetch_text(base_url),
+        )
+        result = run_pipeline(
+            urls[:batch],
+            settings,
+            log_event=log_event,
+            run_id="bench",
+            http_client=standin_session(base_url, tls_fail_every),
+        )
+        render_markdown(result)
+        append_daily_result(result_dir=tmp, date_key="20260216", skill_slug="headline", payload=result)
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    statuses: dict[str, int] = {}
+    for item in result.results:
+        statuses[item.status.value] = statuses.get(item.status.value, 0) + 1
+    peak_kib = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return {
+        "videos": len(result.results),
+        "channel_warnings": len(warnings),
+        "seconds": elapsed,
+        "videos_per_s": len(result.results) / elapsed if elapsed else 0.0,
+        "p95_ms": percentile(latencies, 95),
+        "peak_rss_mib": peak_kib / 1024,
+        "statuses": statuses,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark against a local YouTube stand-in")
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--batch-sizes", type=str, default="10,40")
+    parser.add_argument("--workers", type=str, default="0,2", help="extract_workers levels to compare")
+    parser.add_argument("--latency-ms", type=int, default=5, help="Added latency per stand-in request")
+    parser.add_argument("--burst-every", type=int, default=0, help="Every N requests, end with a 429 burst")
+    parser.add_argument("--burst-length", type=int, default=0, help="Consecutive 429 responses per burst")
+    parser.add_argument("--tls-fail-every", type=int, default=0, help="Fail every Nth verified transcript request")
+    parser.add_argument("--sentences", type=int, default=60, help="Transcript sentences per video")
+    parser.add_argument("--child", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        base_url, batch, workers = args.child.rsplit(",", 2)
+        report = run_once(base_url, args.channels, int(batch), int(workers), args.tls_fail_every)
+        sys.stdout.write(json.dumps(report) + "\n")
+        return
+
+    faults = Faults(args.latency_ms, args.burst_every, args.burst_length, args.tls_fail_every)
+    print(
+        f"channels={args.channels} latency_ms={faults.latency_ms} burst={faults.burst_length}/{faults.burst_every} "
+        f"tls_fail_every={faults.tls_fail_every}"
+    )
+    print(f"{'batch':>6} {'workers':>8} {'videos/s':>10} {'p95 ms':>9} {'peak MiB':>9}  statuses")
+    for batch in [int(item) for item in args.batch_sizes.split(",") if item.strip()]:
+        for workers in [int(item) for item in args.workers.split(",") if item.strip()]:
+            # Each configuration runs in a fresh interpreter so peak RSS is
+            # not inherited from the previous, possibly larger, run.
+            with StandinServer(
+                faults,
+                videos_per_channel=math.ceil(batch / args.channels),
+                transcript_sentences=args.sentences,
+            ) as server:
+                completed = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--channels",
+                        str(args.channels),
+                        "--tls-fail-every",
+                        str(args.tls_fail_every),
+                        "--child",
+                        f"{server.base_url},{batch},{workers}",
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+            report = json.loads(completed.stdout.strip().splitlines()[-1])
+            print(
+                f"{batch:>6} {workers:>8} {report['videos_per_s']:>10.1f} {report['p95_ms']:>9.1f} "
+                f"{report['peak_rss_mib']:>9.1f}  {json.dumps(report['statuses'])}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import serialize
+from economic_youtube_headline_skill.models import (
+    BatchResult,
+    HeadlineResult,
+    PartialInfo,
+    ProcessingStatus,
+    VideoDescriptor,
+)
+
+
+def build_batch(size: int) -> BatchResult:
+    results = []
+    for index in range(size):
+        video_id = f"vid{index:08d}"[:11]
+        results.append(
+            HeadlineResult(
+                status=ProcessingStatus.PARTIAL if index % 3 else ProcessingStatus.COMPLETE,
+                video=VideoDescriptor(
+                    video_id=video_id,
+                    url=f"https://www.youtube.com/watch?v={video_id}",
+                    channel_name=f"경제 채널 {index % 40}",
+                    title=f"오늘의 시장 브리핑 #{index}: 금리와 환율 전망",
+                ),
+                transcript_chars=650 + index % 900,
+                partial=PartialInfo(is_partial=bool(index % 3), coverage_ratio=0.812, reason="below_min_chars"),
+                headlines=[f"헤드라인 {index}-{n}: 연준 금리 동결 가능성이 커지고 있습니다" for n in range(5)],
+                warnings=["Partial transcript detected."],
+            )
+        )
+    return BatchResult(run_id="bench", generated_at="2026-02-16T00:00:00+00:00", results=results)
+
+
+def legacy_to_dict(batch: BatchResult) -> dict:
+    payload = asdict(batch)
+    for item in payload["results"]:
+        item["status"] = item["status"].value
+    return payload
+
+
+def best_of(repeats: int, func) -> float:  # noqa: ANN001
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark contract-v1 batch serialization")
+    parser.add_argument("--results", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    batch = build_batch(args.results)
+    cases = {
+        "asdict + json.dumps (legacy)": lambda: json.dumps(legacy_to_dict(batch), ensure_ascii=False),
+        "to_dict + json.dumps": lambda: json.dumps(batch.to_dict(), ensure_ascii=False),
+        "encode_batch": lambda: serialize.encode_batch(batch),
+        "encode_batch_line": lambda: serialize.encode_batch_line(batch),
+    }
+    print(f"results={args.results} repeats={args.repeats} orjson={'yes' if serialize.orjson else 'no'}")
+    baseline = None
+    for name, func in cases.items():
+        elapsed = best_of(args.repeats, func)
+        baseline = baseline or elapsed
+        print(f"{name:32s} {elapsed * 1000:9.1f} ms  x{baseline / elapsed:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import gzip
+import json
+import threading
+import time
+from dataclasses import dataclass
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+from xml.sax.saxutils import escape
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from economic_youtube_headline_skill import youtube
+
+_YOUTUBE_HOSTS = {"www.youtube.com", "youtube.com", "www.youtube-nocookie.com"}
+_SENTENCES = [
+    "연준이 기준금리를 동결하면서 시장은 하반기 인하 가능성에 주목하고 있습니다.",
+    "원달러 환율이 1400원을 넘어서며 수입 물가 부담이 커지고 있습니다.",
+    "반도체 수출이 예상보다 빠르게 회복되면서 경상수지 흑자 폭이 확대됐습니다.",
+    "국채 금리가 하락하자 성장주 중심으로 매수세가 유입되었습니다.",
+    "부동산 거래량은 여전히 지난해 수준을 밑돌고 있습니다.",
+    "유가 상승이 물가 경로에 다시 부담을 줄 수 있다는 지적이 나옵니다.",
+]
+
+
+@dataclass(slots=True)
+class Faults:
+    latency_ms: int = 0
+    burst_every: int = 0
+    burst_length: int = 0
+    tls_fail_every: int = 0
+
+
+def channel_id_for(handle: str) -> str:
+    return "UC" + sha256(handle.encode("utf-8")).hexdigest()[:22]
+
+
+def video_id_for(channel_id: str, index: int) -> str:
+    return sha256(f"{channel_id}:{index}".encode("utf-8")).hexdigest()[:11]
+
+
+def transcript_xml(video_id: str, sentences: int) -> str:
+    offset = int(video_id[:4], 16)
+    rows = []
+    for index in range(sentences):
+        text = escape(_SENTENCES[(offset + index) % len(_SENTENCES)])
+        rows.append(f'<text start="{index * 4}.0" dur="4.0">{text}</text>')
+    return '<?xml version="1.0" encoding="utf-8" ?><transcript>' + "".join(rows) + "</transcript>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StandinServer"
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, method: str) -> None:
+        if self.server.faults.latency_ms:
+            time.sleep(self.server.faults.latency_ms / 1000)
+        if self.server.next_is_throttled():
+            self._send(429, "Too Many Requests", "text/plain")
+            return
+
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        path = parts.path
+        if method == "POST" and path == "/youtubei/v1/player":
+            length = int(self.headers.get("Content-Length", "0"))
+            video_id = json.loads(self.rfile.read(length) or b"{}").get("videoId", "")
+            self._send(200, json.dumps(self.server.player_response(video_id)), "application/json")
+        elif path == "/watch":
+            self._send(200, '<html><script>ytcfg.set({"INNERTUBE_API_KEY": "standin"});</script></html>', "text/html")
+        elif path == "/api/timedtext":
+            video_id = query.get("v", [""])[0]
+            self._send(200, transcript_xml(video_id, self.server.transcript_sentences), "text/xml")
+        elif path == "/feeds/videos.xml":
+            channel_id = query.get("channel_id", [""])[0]
+            entries = "".join(
+                f"<entry><yt:videoId>{video_id_for(channel_id, index)}</yt:videoId></entry>"
+                for index in range(self.server.videos_per_channel)
+            )
+            self._send(200, f'<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015">{entries}</feed>', "text/xml")
+        elif path.startswith("/@"):
+            channel_id = channel_id_for(path[1:])
+            self._send(200, f'<html><script>var d = {{"channelId":"{channel_id}"}};</script></html>', "text/html")
+        else:
+            self._send(404, "not found", "text/plain")
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._route("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._route("POST")
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        faults: Faults | None = None,
+        videos_per_channel: int = 5,
+        transcript_sentences: int = 60,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.faults = faults or Faults()
+        self.videos_per_channel = videos_per_channel
+        self.transcript_sentences = transcript_sentences
+        self.requests_seen = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_is_throttled(self) -> bool:
+        with self._lock:
+            self.requests_seen += 1
+            seen = self.requests_seen
+        faults = self.faults
+        if faults.burst_every <= 0 or faults.burst_length <= 0:
+            return False
+        return (seen - 1) % faults.burst_every >= faults.burst_every - faults.burst_length
+
+    def player_response(self, video_id: str) -> dict[str, Any]:
+        return {
+            "playabilityStatus": {"status": "OK"},
+            "captions": {
+                "playerCaptionsTracklistRenderer": {
+                    "captionTracks": [
+                        {
+                            "baseUrl": f"https://www.youtube.com/api/timedtext?v={video_id}&lang=ko",
+                            "name": {"runs": [{"text": "Korean (auto-generated)"}]},
+                            "languageCode": "ko",
+                            "kind": "asr",
+                        }
+                    ]
+                }
+            },
+        }
+
+    def __enter__(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="youtube-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _rewrite(url: str, base_url: str) -> str:
+    parts = urlsplit(url)
+    if parts.hostname not in _YOUTUBE_HOSTS:
+        return url
+    base = urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+
+class StandinAdapter(HTTPAdapter):
+    # Routes youtube_transcript_api traffic to the stand-in and fails every
+    # Nth certificate-verified request the way a broken TLS chain would.
+    def __init__(self, base_url: str, tls_fail_every: int = 0) -> None:
+        super().__init__()
+        self.base_url = base_url
+        self.tls_fail_every = tls_fail_every
+        self._verified = 0
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if self.tls_fail_every > 0 and kwargs.get("verify", True) is not False:
+            with self._lock:
+                self._verified += 1
+                fail = self._verified % self.tls_fail_every == 0
+            if fail:
+                raise requests.exceptions.SSLError("[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed")
+        request.url = _rewrite(request.url or "", self.base_url)
+        return super().send(request, **kwargs)
+
+
+def standin_session(base_url: str, tls_fail_every: int = 0) -> requests.Session:
+    session = requests.Session()
+    adapter = StandinAdapter(base_url, tls_fail_every)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def standin_fetch_text(base_url: str) -> Callable[[str], str | None]:
+    def fetch_text(url: str) -> str | None:
+        return youtube._fetch_text(_rewrite(url, base_url), timeout=5)
+
+    return fetch_text
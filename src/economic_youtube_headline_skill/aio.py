@@ -0,0 +1,136 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import aclosing
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable
+
+from economic_youtube_headline_skill.models import BatchResult, HeadlineResult
+from economic_youtube_headline_skill.pipeline import _Fetched, _PipelineRun, new_batch
+from economic_youtube_headline_skill.scheduling import interleave_channels
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.youtube import _collect_channel_entries, _fetch_text
+
+DEFAULT_CONCURRENCY = 4
+
+
+async def _iterate(urls: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(urls, AsyncIterable):
+        async for url in urls:
+            yield url
+    else:
+        for url in urls:
+            yield url
+
+
+async def collect_video_urls_from_channels_async(
+    channel_tokens: list[str],
+    limit_per_channel: int,
+    fetch_text: Callable[[str], str | None] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+) -> tuple[list[str], list[str]]:
+    fetch_text = fetch_text or _fetch_text
+    semaphore = semaphore or asyncio.Semaphore(max(1, concurrency))
+
+    async def collect(token: str) -> tuple[list[tuple[str, str | None]], str | None]:
+        async with semaphore:
+            return await asyncio.to_thread(_collect_channel_entries, token, limit_per_channel, fetch_text)
+
+    # gather keeps token order, so the interleaving matches the sync version.
+    outcomes = await asyncio.gather(*(collect(token) for token in channel_tokens))
+    collected = [entries for entries, reason in outcomes if not reason]
+    warnings = [reason for _entries, reason in outcomes if reason]
+    return interleave_channels(collected), warnings
+
+
+async def iter_pipeline_async(
+    urls: Iterable[str] | AsyncIterable[str],
+    settings: Settings,
+    log_event: Callable[[str, dict[str, Any]], None] | None = None,
+    http_client: Any | None = None,
+    deadline: float | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+) -> AsyncIterator[HeadlineResult]:
+    # Fetches run concurrently on threads, at most `concurrency` ahead of the
+    # consumer; results are settled in input order through the same run
+    # state as iter_pipeline, so the output is identical to the sync path.
+    run = _PipelineRun(settings, log_event=log_event, http_client=http_client)
+    limit = max(1, concurrency)
+    semaphore = semaphore or asyncio.Semaphore(limit)
+    window: deque[tuple[str, "asyncio.Task[_Fetched] | None"]] = deque()
+    settling: "asyncio.Future[list[HeadlineResult]] | None" = None
+
+    async def fetch(url: str) -> _Fetched:
+        async with semaphore:
+            return await asyncio.to_thread(run.fetch, url)
+
+    async def settle(step: Callable[[], Iterable[HeadlineResult]]) -> list[HeadlineResult]:
+        # Analysis may block on the process pool, so it stays off the loop.
+        nonlocal settling
+        settling = asyncio.ensure_future(asyncio.to_thread(lambda: list(step())))
+        results = await asyncio.shield(settling)
+        settling = None
+        return results
+
+    async def settle_next() -> list[HeadlineResult]:
+        url, task = window[0]
+        fetched = await task if task is not None else None
+        window.popleft()
+        if fetched is None:
+            return await settle(lambda: run.skip(url))
+        return await settle(lambda: run.accept(fetched))
+
+    try:
+        index = 0
+        async for url in _iterate(urls):
+            if index > 0 and settings.transcript_request_delay_ms > 0:
+                await asyncio.sleep(settings.transcript_request_delay_ms / 1000)
+            index += 1
+            while len(window) >= limit:
+                for result in await settle_next():
+                    yield result
+            if deadline is not None and time.monotonic() >= deadline:
+                window.append((url, None))
+                continue
+            if log_event:
+                log_event("video_start", {"url": url})
+            window.append((url, asyncio.create_task(fetch(url))))
+        while window:
+            for result in await settle_next():
+                yield result
+        for result in await settle(lambda: run.drain(0)):
+            yield result
+    finally:
+        # Threads cannot be interrupted: cancelled fetches are abandoned, but
+        # the run state is only closed once no settle step is touching it.
+        tasks = [task for _url, task in window if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if settling is not None:
+            await asyncio.gather(settling, return_exceptions=True)
+        await asyncio.to_thread(run.close)
+
+
+async def run_pipeline_async(
+    urls: Iterable[str] | AsyncIterable[str],
+    settings: Settings,
+    log_event: Callable[[str, dict[str, Any]], None] | None = None,
+    run_id: str | None = None,
+    http_client: Any | None = None,
+    deadline: float | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+) -> BatchResult:
+    results = iter_pipeline_async(
+        urls,
+        settings,
+        log_event=log_event,
+        http_client=http_client,
+        deadline=deadline,
+        concurrency=concurrency,
+        semaphore=semaphore,
+    )
+    async with aclosing(results):
+        return new_batch([item async for item in results], run_id=run_id)
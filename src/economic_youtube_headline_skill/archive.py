@@ -0,0 +1,214 @@
+import gzip
+import json
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from economic_youtube_headline_skill.state_files import atomic_write_json, load_json_object
+
+ARCHIVE_DIRNAME = "archive"
+_DAILY_NAME_RE = re.compile(r"^(?P<slug>[A-Za-z0-9_-]+)-(?P<date>\d{8})(?P<suffix>\.jsonl|\.log)$")
+_ARCHIVE_NAME_RE = re.compile(r"^(?P<slug>[A-Za-z0-9_-]+)-(?P<month>\d{6})(?P<suffix>\.jsonl|\.log)\.gz$")
+
+
+def _index_path(archive_path: Path) -> Path:
+    return archive_path.with_name(f"{archive_path.name}.idx.json")
+
+
+def _record_keys(record: dict[str, Any]) -> dict[str, set[str]]:
+    keys: dict[str, set[str]] = {"run_id": set(), "video_id": set()}
+    if record.get("run_id"):
+        keys["run_id"].add(str(record["run_id"]))
+    for item in record.get("results") or []:
+        video_id = (item.get("video") or {}).get("video_id")
+        if video_id:
+            keys["video_id"].add(str(video_id))
+    payload = record.get("payload")
+    if isinstance(payload, dict) and payload.get("video_id"):
+        keys["video_id"].add(str(payload["video_id"]))
+    return keys
+
+
+def _load_index(archive_path: Path) -> dict[str, Any]:
+    index = load_json_object(_index_path(archive_path))
+    index.setdefault("version", 1)
+    index.setdefault("blocks", [])
+    index.setdefault("sources", {})
+    index.setdefault("keys", {})
+    index["keys"].setdefault("run_id", {})
+    index["keys"].setdefault("video_id", {})
+    return index
+
+
+def _append_daily_file(archive_path: Path, index: dict[str, Any], source: Path, block_bytes: int) -> None:
+    blocks = index["blocks"]
+    end = blocks[-1]["offset"] + blocks[-1]["length"] if blocks else 0
+    with archive_path.open("ab") as out:
+        # Drop a tail left behind by an interrupted compaction the index never recorded.
+        out.truncate(end)
+        out.seek(end)
+
+        lines: list[bytes] = []
+        size = 0
+        keys: dict[str, set[str]] = {"run_id": set(), "video_id": set()}
+
+        def flush() -> None:
+            nonlocal lines, size, keys
+            if not lines:
+                return
+            member = gzip.compress(b"".join(lines), mtime=0)
+            block_id = len(blocks)
+            blocks.append({"offset": out.tell(), "length": len(member), "source": source.name, "lines": len(lines)})
+            out.write(member)
+            for kind, values in keys.items():
+                for value in values:
+                    refs = index["keys"][kind].setdefault(value, [])
+                    if not refs or refs[-1] != block_id:
+                        refs.append(block_id)
+            lines, size, keys = [], 0, {"run_id": set(), "video_id": set()}
+
+        with source.open("rb") as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                try:
+                    record_keys = _record_keys(json.loads(line))
+                except ValueError:
+                    record_keys = {}
+                for kind, values in record_keys.items():
+                    keys[kind].update(values)
+                lines.append(line)
+                size += len(line)
+                if size >= block_bytes:
+                    flush()
+        flush()
+        out.flush()
+        os.fsync(out.fileno())
+
+
+def compact_daily_files(
+    directory: str | Path,
+    *,
+    older_than_days: int = 7,
+    today: date | None = None,
+    block_bytes: int = 1 << 20,
+) -> list[Path]:
+    root = Path(directory)
+    # Daily file keys are UTC dates (Settings.date_key), so the cutoff is too.
+    cutoff = (today or datetime.now(timezone.utc).date()) - timedelta(days=max(0, older_than_days))
+    eligible: list[tuple[str, Path]] = []
+    for path in sorted(root.glob("*-????????.*")):
+        match = _DAILY_NAME_RE.match(path.name)
+        if not match or not path.is_file():
+            continue
+        day = datetime.strptime(match.group("date"), "%Y%m%d").date()
+        if day < cutoff:
+            archive_name = f"{match.group('slug')}-{match.group('date')[:6]}{match.group('suffix')}.gz"
+            eligible.append((archive_name, path))
+
+    compacted: list[Path] = []
+    for archive_name, source in eligible:
+        archive_path = root / ARCHIVE_DIRNAME / archive_name
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        index = _load_index(archive_path)
+        size = source.stat().st_size
+        archived = index["sources"].get(source.name)
+        if archived is None and any(block["source"] == source.name for block in index["blocks"]):
+            archived = size  # Indexed before source sizes were recorded.
+        if archived is None:
+            _append_daily_file(archive_path, index, source, max(1, block_bytes))
+            index["sources"][source.name] = size
+            atomic_write_json(_index_path(archive_path), index)
+        elif archived != size:
+            # Written to again after it was archived; leave it for a person to sort out.
+            continue
+        # A crash between the index write and the unlink leaves an already
+        # archived file behind; the rerun only removes it.
+        source.unlink()
+        compacted.append(source)
+    return compacted
+
+
+def _iter_block(fp: Any, block: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    fp.seek(block["offset"])
+    for line in gzip.decompress(fp.read(block["length"])).splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
+def lookup_archive(
+    archive_path: str | Path,
+    *,
+    run_id: str | None = None,
+    video_id: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    path = Path(archive_path)
+    index = _load_index(path)
+    block_ids: set[int] | None = None
+    for kind, value in (("run_id", run_id), ("video_id", video_id)):
+        if value is None:
+            continue
+        refs = set(index["keys"][kind].get(value, []))
+        block_ids = refs if block_ids is None else block_ids & refs
+    if block_ids is None:
+        block_ids = set(range(len(index["blocks"])))
+
+    with path.open("rb") as fp:
+        for block_id in sorted(block_ids):
+            for record in _iter_block(fp, index["blocks"][block_id]):
+                keys = _record_keys(record)
+                if run_id is not None and run_id not in keys["run_id"]:
+                    continue
+                if video_id is not None and video_id not in keys["video_id"]:
+                    continue
+                yield record
+
+
+def iter_archived_day(directory: str | Path, daily_name: str) -> Iterator[dict[str, Any]]:
+    match = _DAILY_NAME_RE.match(daily_name)
+    if not match:
+        return
+    archive_name = f"{match.group('slug')}-{match.group('date')[:6]}{match.group('suffix')}.gz"
+    archive_path = Path(directory) / ARCHIVE_DIRNAME / archive_name
+    if not archive_path.exists():
+        return
+    index = _load_index(archive_path)
+    with archive_path.open("rb") as fp:
+        for block in index["blocks"]:
+            if block["source"] == daily_name:
+                yield from _iter_block(fp, block)
+
+
+def iter_daily_records(directory: str | Path, daily_name: str) -> Iterator[dict[str, Any]]:
+    path = Path(directory) / daily_name
+    if not path.exists():
+        yield from iter_archived_day(directory, daily_name)
+        return
+    with path.open(encoding="utf-8") as fp:
+        for line in fp:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_history(directory: str | Path, slug: str = "headline", suffix: str = ".jsonl") -> Iterator[dict[str, Any]]:
+    root = Path(directory)
+    sources: list[tuple[str, Path]] = []
+    for path in (root / ARCHIVE_DIRNAME).glob(f"{slug}-??????{suffix}.gz"):
+        match = _ARCHIVE_NAME_RE.match(path.name)
+        if match:
+            sources.append((match.group("month"), path))
+    for path in root.glob(f"{slug}-????????{suffix}"):
+        match = _DAILY_NAME_RE.match(path.name)
+        if match:
+            sources.append((match.group("date"), path))
+
+    for _, path in sorted(sources):
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as fp:
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
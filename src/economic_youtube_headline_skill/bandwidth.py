@@ -0,0 +1,138 @@
+import threading
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any, BinaryIO, Callable
+from urllib.parse import urlsplit
+
+from economic_youtube_headline_skill.metrics import HTTP_DECODED_BYTES, HTTP_WIRE_BYTES
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+CHUNK_BYTES = 64 * 1024
+
+
+def request_kind(url: str) -> str:
+    parts = urlsplit(url)
+    if parts.path.startswith("/feeds/"):
+        return "feed"
+    if parts.path.startswith("/youtubei/"):
+        return "player"
+    if "timedtext" in parts.path:
+        return "timedtext"
+    if parts.path.startswith("/watch"):
+        return "watch"
+    return "channel"
+
+
+def proxy_label(proxy_url: str | None) -> str:
+    if not proxy_url:
+        return "direct"
+    parts = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    # Credentials must never end up in metric labels or logs.
+    return f"{parts.hostname}:{parts.port}" if parts.port else str(parts.hostname)
+
+
+def urllib_proxy(url: str) -> str | None:
+    from urllib.request import getproxies, proxy_bypass
+
+    parts = urlsplit(url)
+    if parts.hostname and proxy_bypass(parts.hostname):
+        return None
+    return getproxies().get(parts.scheme)
+
+
+def _decoder(encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]] | None:
+    encoding = encoding.strip().lower()
+    if encoding in {"gzip", "x-gzip", "deflate"}:
+        # 32 + MAX_WBITS accepts both gzip and zlib framing.
+        inflater = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        return inflater.decompress, inflater.flush
+    if encoding == "br" and brotli is not None:
+        return brotli.Decompressor().process, bytes
+    if encoding in {"", "identity"}:
+        return None
+    raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+def read_decoded(stream: BinaryIO, content_encoding: str | None) -> tuple[int, bytes]:
+    decoder = _decoder(content_encoding or "")
+    feed, flush = decoder or (bytes, bytes)
+    wire = 0
+    parts: list[bytes] = []
+    while True:
+        chunk = stream.read(CHUNK_BYTES)
+        if not chunk:
+            break
+        wire += len(chunk)
+        parts.append(feed(chunk))
+    parts.append(flush())
+    return wire, b"".join(parts)
+
+
+@dataclass(slots=True)
+class Usage:
+    kind: str
+    host: str
+    proxy: str
+    requests: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+
+
+class BandwidthLedger:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._usage: dict[tuple[str, str, str], Usage] = {}
+
+    def record(self, url: str, proxy: str | None, wire_bytes: int, decoded_bytes: int) -> None:
+        kind, host, label = request_kind(url), urlsplit(url).hostname or "", proxy_label(proxy)
+        with self._lock:
+            usage = self._usage.setdefault((kind, host, label), Usage(kind, host, label))
+            usage.requests += 1
+            usage.wire_bytes += wire_bytes
+            usage.decoded_bytes += decoded_bytes
+        HTTP_WIRE_BYTES.inc(wire_bytes, kind=kind, host=host, proxy=label)
+        HTTP_DECODED_BYTES.inc(decoded_bytes, kind=kind, host=host, proxy=label)
+
+    def snapshot(self) -> dict[tuple[str, str, str], tuple[int, int, int]]:
+        with self._lock:
+            return {key: (item.requests, item.wire_bytes, item.decoded_bytes) for key, item in self._usage.items()}
+
+    def since(self, snapshot: dict[tuple[str, str, str], tuple[int, int, int]]) -> list[Usage]:
+        rows = []
+        for key, (requests, wire, decoded) in sorted(self.snapshot().items()):
+            before = snapshot.get(key, (0, 0, 0))
+            if requests > before[0]:
+                rows.append(Usage(*key, requests - before[0], wire - before[1], decoded - before[2]))
+        return sorted(rows, key=lambda item: item.wire_bytes, reverse=True)
+
+
+LEDGER = BandwidthLedger()
+
+
+def summarize(rows: list[Usage]) -> dict[str, Any]:
+    return {
+        "requests": sum(item.requests for item in rows),
+        "wire_bytes": sum(item.wire_bytes for item in rows),
+        "decoded_bytes": sum(item.decoded_bytes for item in rows),
+        "by_request": [asdict(item) for item in rows],
+    }
+
+
+def account_response(response: Any, *_args: Any, **kwargs: Any) -> Any:
+    from requests.utils import select_proxy
+
+    # requests response hook: force the body so the raw stream has counted
+    # every byte that came off the socket before it is read elsewhere.
+    decoded = len(response.content or b"")
+    try:
+        wire = int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError, OSError):
+        wire = decoded
+    proxy = select_proxy(response.url, kwargs.get("proxies") or {})
+    LEDGER.record(response.url, proxy, wire or decoded, decoded)
+    return response
@@ -0,0 +1,198 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import requests
+from requests.hooks import dispatch_hook
+from requests.structures import CaseInsensitiveDict
+
+from economic_youtube_headline_skill.youtube import _fetch_text
+
+CASSETTE_VERSION = 1
+_KEPT_HEADERS = ("Content-Type", "Content-Language")
+
+
+class CassetteMiss(LookupError):
+    pass
+
+
+def _body_digest(body: Any) -> str:
+    if not body:
+        return ""
+    raw = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+    return hashlib.sha1(raw).hexdigest()[:16]  # noqa: S324
+
+
+def _key(kind: str, method: str, url: str, body: Any = None) -> str:
+    return f"{kind} {method} {url} {_body_digest(body)}".rstrip()
+
+
+class Cassette:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.interactions: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def add(self, interaction: dict[str, Any], started: float) -> None:
+        interaction["offset_ms"] = round((started - self._started) * 1000, 3)
+        interaction["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "interactions": len(self.interactions),
+        }
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as fp:
+            fp.write(json.dumps(header) + "\n")
+            for interaction in self.interactions:
+                fp.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+        tmp_path.replace(self.path)
+        return self.path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        cassette = cls(path)
+        with gzip.open(cassette.path, "rt", encoding="utf-8") as fp:
+            header = json.loads(fp.readline())
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+            cassette.interactions = [json.loads(line) for line in fp if line.strip()]
+        return cassette
+
+
+class Recorder:
+    def __init__(self, path: str | Path, base_fetch_text: Callable[[str], str | None] = _fetch_text) -> None:
+        self.cassette = Cassette(path)
+        self._base_fetch_text = base_fetch_text
+
+    def fetch_text(self, url: str) -> str | None:
+        started = time.perf_counter()
+        text = self._base_fetch_text(url)
+        self.cassette.add({"key": _key("text", "GET", url), "text": text}, started)
+        return text
+
+    def session(self, base_client: requests.Session | None = None) -> requests.Session:
+        return _RecordingSession(self.cassette, base_client)
+
+    def close(self) -> Path:
+        return self.cassette.save()
+
+
+# Both cassette sessions hook in at Session.send(). YouTubeTranscriptApi
+# replaces the mounted adapters whenever a proxy config retries on blocks
+# (always the case for Webshare), so adapter-level hooks would be bypassed.
+class _RecordingSession(requests.Session):
+    def __init__(self, cassette: Cassette, base_client: requests.Session | None = None) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.base_client = base_client
+
+    def derive(self) -> "_RecordingSession":
+        return _RecordingSession(self.cassette, self.base_client)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        started = time.perf_counter()
+        interaction: dict[str, Any] = {"key": _key("http", request.method or "GET", request.url or "", request.body)}
+        try:
+            # A caller's client is the transport, whatever got mounted here.
+            send = self.base_client.send if self.base_client is not None else super().send
+            response = send(request, **kwargs)
+            content = response.content
+        except Exception as exc:
+            interaction["error"] = {"type": exc.__class__.__name__, "message": str(exc)}
+            self.cassette.add(interaction, started)
+            raise
+        interaction["status"] = response.status_code
+        interaction["reason"] = response.reason
+        interaction["headers"] = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        interaction["body_b64"] = base64.b64encode(content).decode("ascii")
+        self.cassette.add(interaction, started)
+        return response
+
+
+class Player:
+    # Identical requests are served in recorded order; once a key runs out
+    # its last response keeps being replayed.
+    def __init__(self, path: str | Path, speed: float = 1.0) -> None:
+        self.speed = speed
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        for interaction in Cassette.load(path).interactions:
+            self._queues.setdefault(interaction["key"], deque()).append(interaction)
+
+    def _next(self, key: str) -> dict[str, Any]:
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMiss(f"No recorded interaction for {key}")
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.speed > 0:
+            time.sleep(interaction.get("elapsed_ms", 0.0) / 1000 / self.speed)
+        return interaction
+
+    def fetch_text(self, url: str) -> str | None:
+        try:
+            return self._next(_key("text", "GET", url)).get("text")
+        except CassetteMiss:
+            return None
+
+    def session(self) -> requests.Session:
+        return _ReplaySession(self)
+
+    def close(self) -> None:
+        return None
+
+
+def _replayed_error(error: dict[str, str], request: requests.PreparedRequest) -> Exception:
+    # Same class as recorded, so retry/transient checks take the live path.
+    exc_type = getattr(requests.exceptions, error["type"], None)
+    if not (isinstance(exc_type, type) and issubclass(exc_type, requests.exceptions.RequestException)):
+        exc_type = requests.exceptions.ConnectionError
+    return exc_type(error["message"], request=request)
+
+
+class _ReplaySession(requests.Session):
+    def __init__(self, player: Player) -> None:
+        super().__init__()
+        self.player = player
+
+    def derive(self) -> "_ReplaySession":
+        return _ReplaySession(self.player)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        interaction = self.player._next(_key("http", request.method or "GET", request.url or "", request.body))
+        error = interaction.get("error")
+        if error:
+            raise _replayed_error(error, request)
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction.get("reason") or ""
+        response.headers = CaseInsensitiveDict(interaction.get("headers") or {})
+        response._content = base64.b64decode(interaction.get("body_b64") or "")
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url or ""
+        response.request = request
+        return dispatch_hook("response", request.hooks, response, **kwargs)
+
+
+def open_cassette(mode: str, path: str, speed: float = 1.0) -> Recorder | Player | None:
+    if not mode or not path:
+        return None
+    if mode == "record":
+        return Recorder(path)
+    if mode == "replay":
+        return Player(path, speed=speed)
+    raise ValueError(f"Unknown cassette mode: {mode} (expected record or replay)")
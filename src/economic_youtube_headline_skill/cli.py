@@ -1,38 +1,14 @@
 import argparse
+import json
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
-from uuid import uuid4
 
-from economic_youtube_headline_skill.pipeline import run_pipeline
-from economic_youtube_headline_skill.render import render_json, render_markdown
-from economic_youtube_headline_skill.result_store import append_daily_result
-from economic_youtube_headline_skill.session_logger import SessionLogger
+from economic_youtube_headline_skill.cli_support import open_output, wants_compact_warnings
 from economic_youtube_headline_skill.settings import Settings
-from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
 
-
-def _collect_urls(settings: Settings, video_urls: list[str], input_file: str | None) -> tuple[list[str], list[str]]:
-    collected: list[str] = []
-    collected.extend(video_urls)
-    if input_file:
-        lines = [line.strip() for line in Path(input_file).read_text(encoding="utf-8").splitlines()]
-        collected.extend([line for line in lines if line and not line.startswith("#")])
-
-    if not collected and settings.channels():
-        channel_urls, warnings = collect_video_urls_from_channels(
-            settings.channels(),
-            settings.channel_video_limit,
-        )
-        collected.extend(channel_urls)
-    else:
-        warnings = []
-
-    deduped = list(dict.fromkeys(collected))
-    if not deduped:
-        raise ValueError(
-            "No input videos found. Provide --video-url/--input-file or set EYT_HEADLINE_TARGET_CHANNELS."
-        )
-    return deduped, warnings
+# Subcommand modules are imported inside their run_* functions so `--help`
+# and light commands do not pay for requests, the process pool or sqlite.
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -41,66 +17,173 @@ def build_parser() -> argparse.ArgumentParser:
 
     generate = sub.add_parser("generate", help="Generate per-video headlines")
     generate.add_argument("--video-url", action="append", default=[], help="Repeatable YouTube URL")
-    generate.add_argument("--input-file", type=str, default=None, help="File with one URL per line")
-    generate.add_argument("--output-format", choices=["markdown", "json"], default="markdown")
+    generate.add_argument(
+        "--input-file",
+        type=str,
+        default=None,
+        help="File with one URL per line (gzip allowed, - for stdin)",
+    )
+    generate.add_argument(
+        "--output-format",
+        choices=["markdown", "json", "ndjson", "csv"],
+        default="markdown",
+    )
     generate.add_argument("--out", type=str, default=None, help="Output file path")
+    generate.add_argument(
+        "--warning-format",
+        choices=["full", "compact"],
+        default=None,
+        help="compact adds warning codes and shortens long warnings (EYT_HEADLINE_WARNING_FORMAT)",
+    )
+    generate.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write cProfile and tracemalloc artifacts next to the daily log",
+    )
+    generate.add_argument("--profile-top", type=int, default=15, help="Rows in the profile summary")
+    generate.add_argument(
+        "--deadline",
+        type=str,
+        default=None,
+        help="Stop starting new videos at HH:MM local time or after a budget like 25m (EYT_HEADLINE_RUN_DEADLINE)",
+    )
+
+    query = sub.add_parser("query", help="Query the indexed result store")
+    query.add_argument("--db", type=str, default=None, help="SQLite index path (EYT_HEADLINE_RESULT_INDEX_PATH)")
+    query.add_argument("--video-id", type=str, default=None)
+    query.add_argument("--channel", type=str, default=None, help="Exact channel name")
+    query.add_argument("--since", type=str, default=None, help="First date key (YYYYMMDD)")
+    query.add_argument("--until", type=str, default=None, help="Last date key (YYYYMMDD)")
+    query.add_argument("--status", type=str, default=None)
+    query.add_argument("--run-id", type=str, default=None)
+    query.add_argument("--limit", type=int, default=100)
+    query.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Index every headline-YYYYMMDD.jsonl in the result dir before querying",
+    )
+
+    report = sub.add_parser("report", help="Merge one day's runs into a per-video brief")
+    report.add_argument("--date", type=str, default=None, help="Date key (YYYYMMDD), defaults to today (UTC)")
+    report.add_argument(
+        "--output-format",
+        choices=["markdown", "json", "ndjson", "csv"],
+        default="markdown",
+    )
+    report.add_argument("--out", type=str, default=None, help="Output file path")
+    report.add_argument("--warning-format", choices=["full", "compact"], default=None)
+
+    compact = sub.add_parser("compact", help="Roll old daily result/log files into compressed monthly archives")
+    compact.add_argument("--older-than-days", type=int, default=7)
+    compact.add_argument("--kind", choices=["all", "results", "logs"], default="all")
+    compact.add_argument("--block-kb", type=int, default=1024, help="Uncompressed bytes per gzip block")
+
+    stats = sub.add_parser("stats", help="Summarise traced stage latencies from the daily logs")
+    stats.add_argument("--date", type=str, default=None, help="Last date key (YYYYMMDD), defaults to today (UTC)")
+    stats.add_argument("--days", type=int, default=1, help="Number of days ending at --date")
+    stats.add_argument("--output-format", choices=["table", "json"], default="table")
     return parser
 
 
 def run_generate(args: argparse.Namespace) -> int:
-    settings = Settings.from_env()
-    run_id = uuid4().hex[:10]
-    date_key = settings.date_key()
-    log_path = Path(settings.log_dir) / f"headline-{date_key}.log"
-    logger = SessionLogger(
-        repo="economic-youtube-headline-skill",
-        run_id=run_id,
-        session_id=date_key,
-        log_path=log_path,
-    )
+    from economic_youtube_headline_skill.generate import run_generate as run
 
-    logger.info(
-        "run_start",
-        {
-            "input_video_urls": len(args.video_url),
-            "used_input_file": bool(args.input_file),
-            "configured_channels": settings.channels(),
-        },
-    )
+    return run(args)
 
-    urls, warnings = _collect_urls(settings, args.video_url, args.input_file)
-    logger.info("videos_collected", {"count": len(urls)})
 
-    batch = run_pipeline(
-        urls,
-        settings,
-        log_event=logger.info,
-        run_id=run_id,
-    )
-    result_path = append_daily_result(
-        result_dir=settings.result_dir,
-        date_key=date_key,
-        skill_slug="headline",
-        payload=batch.to_dict(),
-    )
-    for warning in warnings:
-        print(f"[warn] {warning}", file=sys.stderr)
-        logger.warn("channel_warning", {"message": warning})
+def run_query(args: argparse.Namespace) -> int:
+    from economic_youtube_headline_skill.result_index import index_daily_files, query_results
 
-    rendered = render_markdown(batch) if args.output_format == "markdown" else render_json(batch)
+    settings = Settings.from_env()
+    db_path = args.db or settings.result_index_path
+    if not db_path:
+        print("[error] Set --db or EYT_HEADLINE_RESULT_INDEX_PATH.", file=sys.stderr)
+        return 2
+    if args.backfill:
+        count = index_daily_files(db_path, sorted(Path(settings.result_dir).glob("headline-*.jsonl")))
+        print(f"[index] {count} runs from {settings.result_dir}", file=sys.stderr)
+    try:
+        rows = query_results(
+            db_path,
+            video_id=args.video_id,
+            channel_name=args.channel,
+            since=args.since,
+            until=args.until,
+            status=args.status,
+            run_id=args.run_id,
+            limit=args.limit,
+        )
+    except FileNotFoundError as exc:
+        print(f"[error] {exc}", file=sys.stderr)
+        return 2
+    for row in rows:
+        sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return 0
+
+
+def run_report(args: argparse.Namespace) -> int:
+    from economic_youtube_headline_skill.pipeline import new_batch
+    from economic_youtube_headline_skill.render import STREAM_WRITERS, write_json
+    from economic_youtube_headline_skill.report import iter_daily_batches, merge_latest_results
+
+    settings = Settings.from_env()
+    date_key = args.date or settings.date_key()
+    results = merge_latest_results(iter_daily_batches(settings.result_dir, date_key))
+    batch = new_batch(results, run_id=f"report-{date_key}")
+    compact = wants_compact_warnings(args, settings)
+    with open_output(args.out) as fp:
+        if args.output_format == "json":
+            write_json(batch, fp, compact)
+        else:
+            STREAM_WRITERS[args.output_format](batch.results, fp, batch.run_id, compact)
     if args.out:
-        out = Path(args.out)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(rendered, encoding="utf-8")
-        print(f"Written: {out}")
-        logger.info("run_complete", {"output_format": args.output_format, "output_file": str(out)})
-        print(f"[log] {log_path}", file=sys.stderr)
-        print(f"[result] {result_path}", file=sys.stderr)
+        print(f"Written: {args.out}")
+    return 0
+
+
+def run_compact(args: argparse.Namespace) -> int:
+    from economic_youtube_headline_skill.archive import compact_daily_files
+
+    settings = Settings.from_env()
+    directories = {"results": settings.result_dir, "logs": settings.log_dir}
+    for kind, directory in directories.items():
+        if args.kind not in {"all", kind} or not Path(directory).is_dir():
+            continue
+        compacted = compact_daily_files(
+            directory,
+            older_than_days=args.older_than_days,
+            block_bytes=max(1, args.block_kb) * 1024,
+        )
+        for path in compacted:
+            print(f"[compact] {path}", file=sys.stderr)
+    return 0
+
+
+def run_stats(args: argparse.Namespace) -> int:
+    from economic_youtube_headline_skill.archive import iter_daily_records
+    from economic_youtube_headline_skill.tracing import stage_stats
+
+    settings = Settings.from_env()
+    last_day = datetime.strptime(args.date or settings.date_key(), "%Y%m%d")
+    date_keys = [(last_day - timedelta(days=offset)).strftime("%Y%m%d") for offset in range(max(1, args.days))]
+    rows = (
+        row
+        for date_key in reversed(date_keys)
+        for row in iter_daily_records(settings.log_dir, f"headline-{date_key}.log")
+    )
+    stats = stage_stats(rows)
+    if args.output_format == "json":
+        sys.stdout.write(json.dumps(stats, ensure_ascii=False, indent=2) + "\n")
         return 0
-    print(rendered)
-    logger.info("run_complete", {"output_format": args.output_format, "output_file": None})
-    print(f"[log] {log_path}", file=sys.stderr)
-    print(f"[result] {result_path}", file=sys.stderr)
+    if not stats:
+        print("[stats] no traced spans found; set EYT_HEADLINE_TRACE=true", file=sys.stderr)
+        return 0
+    sys.stdout.write(f"{'stage':<26}{'count':>8}{'p50':>11}{'p95':>11}{'p99':>11}{'max':>11}\n")
+    for stage, row in stats.items():
+        sys.stdout.write(
+            f"{stage:<26}{int(row['count']):>8}{row['p50']:>11.2f}{row['p95']:>11.2f}"
+            f"{row['p99']:>11.2f}{row['max']:>11.2f}\n"
+        )
     return 0
 
 
@@ -109,6 +192,14 @@ def app() -> None:
     args = parser.parse_args()
     if args.command == "generate":
         raise SystemExit(run_generate(args))
+    if args.command == "query":
+        raise SystemExit(run_query(args))
+    if args.command == "report":
+        raise SystemExit(run_report(args))
+    if args.command == "compact":
+        raise SystemExit(run_compact(args))
+    if args.command == "stats":
+        raise SystemExit(run_stats(args))
     parser.print_help()
     raise SystemExit(0)
 
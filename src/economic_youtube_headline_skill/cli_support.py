@@ -0,0 +1,26 @@
+import argparse
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from economic_youtube_headline_skill.settings import Settings
+
+
+@contextmanager
+def open_output(out: str | None) -> Iterator[TextIO]:
+    if not out:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    path = Path(out)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        yield fp
+
+
+def wants_compact_warnings(args: argparse.Namespace, settings: Settings) -> bool:
+    warning_format = args.warning_format or settings.warning_format
+    if warning_format not in {"full", "compact"}:
+        raise ValueError(f"Unknown warning format: {warning_format} (expected full or compact)")
+    return warning_format == "compact"
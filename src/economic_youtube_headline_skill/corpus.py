@@ -0,0 +1,135 @@
+import hashlib
+import random
+import re
+from dataclasses import dataclass
+from typing import Any
+
+CHARS_PER_MINUTE = {"ko": 320, "en": 850}
+SEGMENT_SECONDS = 4
+
+_SUBJECTS = {
+    "ko": ["연준", "한국은행", "코스피", "원달러 환율", "미국 국채 금리", "국제 유가", "반도체 수출", "소비자물가", "부동산 시장", "고용 지표"],
+    "en": [
+        "The Fed",
+        "The Bank of Korea",
+        "The KOSPI",
+        "The won-dollar rate",
+        "The 10-year Treasury yield",
+        "Brent crude",
+        "Chip exports",
+        "Consumer prices",
+        "The housing market",
+        "Payroll growth",
+    ],
+}
+_PREDICATES = {
+    "ko": [
+        "{n}% 상승하며 시장 예상을 웃돌았습니다",
+        "{n}% 하락해 투자 심리가 위축됐습니다",
+        "동결 기조를 유지하면서 하반기 인하 가능성이 거론되고 있습니다",
+        "{n}개월 만에 최고치를 기록했습니다",
+        "변동성이 커지며 외국인 자금이 {n}조 원 순유출됐습니다",
+        "예상보다 빠르게 회복되면서 경기 연착륙 기대가 커졌습니다",
+    ],
+    "en": [
+        "rose {n}% and beat market expectations",
+        "fell {n}% as risk appetite faded",
+        "held steady while traders priced in a cut later this year",
+        "hit a {n}-month high",
+        "turned volatile with {n} billion dollars of foreign outflows",
+        "recovered faster than expected, lifting soft-landing hopes",
+    ],
+}
+_FILLERS = {
+    "ko": ["자 그러면", "네", "그러니까", "사실", "여기서 중요한 건", "말씀드린 것처럼"],
+    "en": ["So", "Well", "Now", "Basically", "What matters here is", "As I mentioned"],
+}
+_PUNCTUATION_RE = re.compile(r"[.!?,]")
+
+
+@dataclass(slots=True)
+class CorpusSpec:
+    language: str = "ko"
+    min_minutes: int = 1
+    max_minutes: int = 60
+    punctuation: str = "yes"
+
+    @classmethod
+    def parse(cls, raw: str) -> "CorpusSpec":
+        spec = cls()
+        for part in raw.split(","):
+            if not part.strip():
+                continue
+            key, _, value = part.partition("=")
+            key, value = key.strip().lower(), value.strip().lower()
+            if key == "lang":
+                if value not in {"ko", "en", "mixed"}:
+                    raise ValueError(f"Unsupported corpus language: {value}")
+                spec.language = value
+            elif key == "minutes":
+                low, _, high = value.partition("-")
+                spec.min_minutes = max(1, int(low))
+                spec.max_minutes = max(spec.min_minutes, int(high or low))
+            elif key == "punct":
+                if value not in {"yes", "no", "mixed"}:
+                    raise ValueError(f"Unsupported corpus punctuation mode: {value}")
+                spec.punctuation = value
+            else:
+                raise ValueError(f"Unknown corpus option: {key}")
+        return spec
+
+
+def _seed(*parts: object) -> int:
+    return int.from_bytes(hashlib.sha256(":".join(map(str, parts)).encode("utf-8")).digest()[:8], "big")
+
+
+def _sentence(rng: random.Random, language: str) -> str:
+    subject = rng.choice(_SUBJECTS[language])
+    predicate = rng.choice(_PREDICATES[language]).format(n=rng.randint(1, 12))
+    if language == "ko":
+        has_final = (ord(subject[-1]) - 0xAC00) % 28 != 0
+        particle = ("이", "은") if has_final else ("가", "는")
+        sentence = f"{subject}{rng.choice(particle)} {predicate}."
+    else:
+        sentence = f"{subject} {predicate}."
+    if rng.random() < 0.25:
+        lead = sentence[0].lower() if language == "en" else sentence[0]
+        sentence = f"{rng.choice(_FILLERS[language])}, {lead}{sentence[1:]}"
+    return sentence
+
+
+def synthetic_transcript(
+    seed: str,
+    minutes: int,
+    language: str = "ko",
+    punctuated: bool = True,
+) -> str:
+    rng = random.Random(_seed(seed, minutes, language, punctuated))
+    target = minutes * CHARS_PER_MINUTE["en" if language == "en" else "ko"]
+    parts: list[str] = []
+    size = 0
+    while size < target:
+        sentence_language = rng.choice(("ko", "en")) if language == "mixed" else language
+        sentence = _sentence(rng, sentence_language)
+        if not punctuated:
+            sentence = _PUNCTUATION_RE.sub("", sentence)
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)
+
+
+def synthetic_segments(text: str, minutes: int) -> list[dict[str, Any]]:
+    count = max(1, minutes * 60 // SEGMENT_SECONDS)
+    words = text.split(" ")
+    per_segment = max(1, len(words) // count)
+    return [
+        {"text": " ".join(words[start : start + per_segment]), "start": float(index * SEGMENT_SECONDS), "duration": 4.0}
+        for index, start in enumerate(range(0, len(words), per_segment))
+    ]
+
+
+def transcript_for_video(video_id: str, spec: CorpusSpec) -> str:
+    rng = random.Random(_seed("video", video_id))
+    minutes = rng.randint(spec.min_minutes, spec.max_minutes)
+    punctuated = spec.punctuation == "yes" or (spec.punctuation == "mixed" and rng.random() < 0.5)
+    return synthetic_transcript(video_id, minutes, spec.language, punctuated)
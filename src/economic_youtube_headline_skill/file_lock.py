@@ -0,0 +1,35 @@
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - advisory locks are POSIX-only
+    fcntl = None
+
+
+def open_append_fd(path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def write_appending(fd: int, data: bytes, lock: bool = False) -> None:
+    # Holding an exclusive flock for the whole (possibly multi-syscall) write
+    # keeps lines from concurrent processes from interleaving.
+    locked = lock and fcntl is not None
+    if locked:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def append_bytes(path: Path, data: bytes, lock: bool = False) -> None:
+    fd = open_append_fd(path)
+    try:
+        write_appending(fd, data, lock=lock)
+    finally:
+        os.close(fd)
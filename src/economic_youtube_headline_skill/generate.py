@@ -0,0 +1,272 @@
+import argparse
+import sys
+import time
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+from uuid import uuid4
+
+from economic_youtube_headline_skill.bandwidth import LEDGER, summarize
+from economic_youtube_headline_skill.cli_support import open_output, wants_compact_warnings
+from economic_youtube_headline_skill.metrics import (
+    REGISTRY,
+    RUN_DURATION_SECONDS,
+    RUN_LAST_SUCCESS,
+    RUN_VIDEOS,
+    TextfileExporter,
+)
+from economic_youtube_headline_skill.models import HeadlineResult, ProcessingStatus
+from economic_youtube_headline_skill.pipeline import iter_pipeline, new_batch
+from economic_youtube_headline_skill.render import STREAM_WRITERS, write_json
+from economic_youtube_headline_skill.result_index import index_batch
+from economic_youtube_headline_skill.result_store import append_daily_result
+from economic_youtube_headline_skill.scheduling import parse_deadline
+from economic_youtube_headline_skill.session_logger import SessionLogger
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.tracing import collect_spans, span
+from economic_youtube_headline_skill.url_input import dedupe_video_urls, iter_input_lines
+from economic_youtube_headline_skill.warning_codes import warning_catalog
+from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
+
+
+def _iter_urls(
+    settings: Settings,
+    video_urls: list[str],
+    input_file: str | None,
+    fetch_text: Callable[[str], str | None] | None = None,
+) -> tuple[Iterator[str], list[str]]:
+    # Input files can hold millions of archived URLs, so rows are streamed
+    # into the pipeline and deduplicated by video id as they are read.
+    direct: Iterator[str] = chain(video_urls, iter_input_lines(input_file) if input_file else ())
+    first = next(direct, None)
+    if first is not None:
+        return dedupe_video_urls(chain([first], direct)), []
+
+    warnings: list[str] = []
+    channel_urls: list[str] = []
+    if settings.channels():
+        channel_urls, warnings = collect_video_urls_from_channels(
+            settings.channels(),
+            settings.channel_video_limit,
+            fetch_text=fetch_text,
+        )
+    if not channel_urls:
+        raise ValueError(
+            "No input videos found. Provide --video-url/--input-file or set EYT_HEADLINE_TARGET_CHANNELS."
+        )
+    return dedupe_video_urls(channel_urls), warnings
+
+
+def _collect_urls(
+    settings: Settings,
+    video_urls: list[str],
+    input_file: str | None,
+    fetch_text: Callable[[str], str | None] | None = None,
+) -> tuple[list[str], list[str]]:
+    urls, warnings = _iter_urls(settings, video_urls, input_file, fetch_text=fetch_text)
+    return list(urls), warnings
+
+
+def _counting(urls: Iterable[str], counter: list[int]) -> Iterator[str]:
+    for url in urls:
+        counter[0] += 1
+        RUN_VIDEOS.set(counter[0])
+        yield url
+
+
+def _collecting(
+    results: Iterable[HeadlineResult],
+    sink: list[HeadlineResult],
+    exporter: TextfileExporter | None = None,
+) -> Iterator[HeadlineResult]:
+    for item in results:
+        sink.append(item)
+        if exporter is not None:
+            exporter.tick()
+        yield item
+
+
+def run_generate(args: argparse.Namespace) -> int:
+    settings = Settings.from_env()
+    try:
+        budget_s = parse_deadline(args.deadline if args.deadline is not None else settings.run_deadline)
+    except ValueError as exc:
+        print(f"[error] {exc}", file=sys.stderr)
+        return 2
+    run_id = uuid4().hex[:10]
+    date_key = settings.date_key()
+    log_path = Path(settings.log_dir) / f"headline-{date_key}.log"
+    logger = SessionLogger(
+        repo="economic-youtube-headline-skill",
+        run_id=run_id,
+        session_id=date_key,
+        log_path=log_path,
+        buffered=settings.log_buffered,
+        flush_interval_ms=settings.log_flush_interval_ms,
+        flush_max_events=settings.log_flush_max_events,
+        fsync=settings.log_fsync,
+        lock=settings.multi_writer_lock,
+    )
+    exporter = TextfileExporter(REGISTRY, settings.metrics_textfile_path, settings.metrics_interval_s)
+    started = time.monotonic()
+    deadline = started + budget_s if budget_s is not None else None
+    try:
+        with logger:
+            if not args.profile:
+                status = _generate(args, settings, logger, run_id, date_key, log_path, exporter, deadline)
+            else:
+                stem = f"headline-{date_key}-{run_id}"
+                from economic_youtube_headline_skill.profiling import print_summary, profile_run
+
+                with profile_run(log_path.parent, stem, top_n=max(1, args.profile_top)) as artifacts:
+                    status = _generate(args, settings, logger, run_id, date_key, log_path, exporter, deadline)
+                logger.info(
+                    "profile_written",
+                    {
+                        "cpu_path": str(artifacts.cpu_path),
+                        "alloc_path": str(artifacts.alloc_path),
+                        "peak_bytes": artifacts.peak_bytes,
+                    },
+                )
+                print_summary(artifacts, sys.stderr)
+        RUN_LAST_SUCCESS.set(time.time())
+        return status
+    finally:
+        RUN_DURATION_SECONDS.set(time.monotonic() - started)
+        try:
+            exporter.write()
+        except OSError as exc:
+            # Must not replace the run's own exception or fail a finished run.
+            print(f"[metrics] textfile write failed: {exc}", file=sys.stderr)
+
+
+def _format_bytes(count: int) -> str:
+    if count < 1024:
+        return f"{count} B"
+    size = count / 1024
+    for unit in ("KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _format_bandwidth(bandwidth: dict[str, object]) -> str:
+    wire = int(bandwidth["wire_bytes"])  # type: ignore[arg-type]
+    by_kind: dict[str, int] = {}
+    for row in bandwidth["by_request"]:  # type: ignore[union-attr]
+        by_kind[row["kind"]] = by_kind.get(row["kind"], 0) + row["wire_bytes"]
+    shares = ", ".join(
+        f"{kind} {value * 100 // max(1, wire)}%" for kind, value in sorted(by_kind.items(), key=lambda item: -item[1])
+    )
+    return (
+        f"{bandwidth['requests']} requests, wire {_format_bytes(wire)}, "
+        f"decoded {_format_bytes(int(bandwidth['decoded_bytes']))} ({shares})"  # type: ignore[arg-type]
+    )
+
+
+def _generate(
+    args: argparse.Namespace,
+    settings: Settings,
+    logger: SessionLogger,
+    run_id: str,
+    date_key: str,
+    log_path: Path,
+    exporter: TextfileExporter | None = None,
+    deadline: float | None = None,
+) -> int:
+    logger.info(
+        "run_start",
+        {
+            "input_video_urls": len(args.video_url),
+            "used_input_file": bool(args.input_file),
+            "configured_channels": settings.channels(),
+            "deadline_s": round(deadline - time.monotonic(), 3) if deadline is not None else None,
+        },
+    )
+
+    compact = wants_compact_warnings(args, settings)
+    bandwidth_before = LEDGER.snapshot()
+    cassette = None
+    if settings.cassette_mode:
+        # The cassette sessions subclass requests.Session; only load them when asked.
+        from economic_youtube_headline_skill.cassette import open_cassette
+
+        cassette = open_cassette(
+            settings.cassette_mode,
+            settings.cassette_path,
+            speed=settings.cassette_replay_speed,
+        )
+    with collect_spans(settings.trace) as spans:
+        try:
+            with span("collect_urls"):
+                urls, warnings = _iter_urls(
+                    settings,
+                    args.video_url,
+                    args.input_file,
+                    fetch_text=cassette.fetch_text if cassette else None,
+                )
+            collected = [0]
+            RUN_VIDEOS.set(0)
+
+            results: list[HeadlineResult] = []
+            stream = _collecting(
+                iter_pipeline(
+                    _counting(urls, collected),
+                    settings,
+                    log_event=logger.info,
+                    http_client=cassette.session() if cassette else None,
+                    deadline=deadline,
+                ),
+                results,
+                exporter,
+            )
+            with span("pipeline"), open_output(args.out) as fp:
+                if args.output_format == "json":
+                    batch = new_batch(list(stream), run_id=run_id)
+                    write_json(batch, fp, compact)
+                else:
+                    STREAM_WRITERS[args.output_format](stream, fp, run_id, compact)
+                    batch = new_batch(results, run_id=run_id)
+            logger.info("videos_collected", {"count": collected[0]})
+        finally:
+            if cassette is not None:
+                saved = cassette.close()
+                if saved is not None:
+                    print(f"[cassette] {saved}", file=sys.stderr)
+        with span("result_append"):
+            result_path = append_daily_result(
+                result_dir=settings.result_dir,
+                date_key=date_key,
+                skill_slug="headline",
+                payload=batch,
+                lock=settings.multi_writer_lock,
+                compact=compact,
+            )
+        if settings.result_index_path:
+            with span("result_index"):
+                index_batch(settings.result_index_path, batch.to_dict(), date_key)
+    if compact:
+        catalog = warning_catalog(item.warnings for item in batch.results)
+        if catalog:
+            logger.info("warning_catalog", catalog)
+    for warning in warnings:
+        print(f"[warn] {warning}", file=sys.stderr)
+        logger.warn("channel_warning", {"message": warning})
+    skipped = sum(1 for item in batch.results if item.status == ProcessingStatus.SKIPPED)
+    if skipped:
+        print(f"[deadline] {skipped} of {len(batch.results)} videos skipped", file=sys.stderr)
+
+    if args.out:
+        print(f"Written: {args.out}")
+    completed: dict[str, object] = {"output_format": args.output_format, "output_file": args.out}
+    if spans is not None:
+        completed["spans_ms"] = spans
+    bandwidth = summarize(LEDGER.since(bandwidth_before))
+    completed["bandwidth"] = bandwidth
+    logger.info("run_complete", completed)
+    if bandwidth["requests"]:
+        print(f"[bandwidth] {_format_bandwidth(bandwidth)}", file=sys.stderr)
+    print(f"[log] {log_path}", file=sys.stderr)
+    print(f"[result] {result_path}", file=sys.stderr)
+    return 0
@@ -0,0 +1,99 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, TypeVar
+
+from economic_youtube_headline_skill.metrics import TRANSCRIPT_HEDGES
+from economic_youtube_headline_skill.tracing import percentile
+
+T = TypeVar("T")
+
+
+class Hedger:
+    # One instance per run: the latency window and the extra-request budget
+    # are shared by every transcript fetch in that run.
+    def __init__(
+        self,
+        hedge_percentile: float = 95.0,
+        max_extra: int = 20,
+        proxy_config: Any | None = None,
+        initial_delay_s: float = 3.0,
+        min_delay_s: float = 0.25,
+        min_samples: int = 10,
+        window: int = 200,
+    ) -> None:
+        self.hedge_percentile = hedge_percentile
+        self.max_extra = max_extra
+        self.proxy_config = proxy_config
+        self.initial_delay_s = initial_delay_s
+        self.min_delay_s = min_delay_s
+        self.min_samples = min_samples
+        self.extra_sent = 0
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.initial_delay_s
+            samples = sorted(self._samples)
+        return max(self.min_delay_s, percentile(samples, self.hedge_percentile))
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.extra_sent >= self.max_extra:
+                return False
+            self.extra_sent += 1
+            return True
+
+    def run(
+        self,
+        primary: Callable[[], T],
+        hedge: Callable[[], T],
+        cancel: Callable[[int], None] | None = None,
+    ) -> T:
+        outcomes: "queue.Queue[tuple[int, bool, Any]]" = queue.Queue()
+
+        def launch(index: int, func: Callable[[], T]) -> None:
+            def target() -> None:
+                try:
+                    outcomes.put((index, True, func()))
+                except BaseException as exc:  # noqa: BLE001
+                    outcomes.put((index, False, exc))
+
+            threading.Thread(target=target, name=f"transcript-attempt-{index}", daemon=True).start()
+
+        started = time.perf_counter()
+        launch(0, primary)
+        try:
+            index, ok, value = outcomes.get(timeout=self.delay())
+        except queue.Empty:
+            if not self._take_budget():
+                TRANSCRIPT_HEDGES.inc(outcome="budget_exhausted")
+                index, ok, value = outcomes.get()
+            else:
+                launch(1, hedge)
+                index, ok, value = outcomes.get()
+                if not ok:
+                    # The first attempt to finish failed; the other may still succeed.
+                    first_error = value
+                    index, ok, value = outcomes.get()
+                    if not ok:
+                        value = first_error
+                TRANSCRIPT_HEDGES.inc(outcome="hedge_won" if ok and index == 1 else "primary_won")
+                if cancel is not None:
+                    cancel(1 - index)
+
+        if not ok:
+            raise value
+        # The window tracks the primary path measured from its start. When
+        # the hedge wins, that is a lower bound (delay plus the hedge's time);
+        # recording only the winner's own time would drag the percentile
+        # down and hedge ever more often.
+        self.observe(time.perf_counter() - started)
+        return value
@@ -0,0 +1,274 @@
+import math
+from abc import ABC, abstractmethod
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+_DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(label_names: tuple[str, ...], labels: dict[str, str]) -> LabelKey:
+    if set(labels) != set(label_names):
+        raise ValueError(f"Expected labels {label_names}, got {tuple(sorted(labels))}")
+    return tuple((name, str(labels[name])) for name in label_names)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = (*key, *extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...], lock: threading.Lock) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = lock
+
+    @abstractmethod
+    def _sample_lines(self) -> Iterator[str]: ...
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}", *self._sample_lines()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...], lock: threading.Lock) -> None:
+        super().__init__(name, help_text, label_names, lock)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(self.label_names, labels), 0.0)
+
+    def _sample_lines(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...],
+        lock: threading.Lock,
+        buckets: tuple[float, ...] = _DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, label_names, lock)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        counts = self._counts.get(_label_key(self.label_names, labels))
+        return counts[-1] if counts else 0
+
+    def _sample_lines(self) -> Iterator[str]:
+        for key, counts in sorted(self._counts.items()):
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                yield f"{self.name}_bucket{_format_labels(key, (('le', _format_value(bound)),))} {count}"
+            yield f"{self.name}_sum{_format_labels(key)} {_format_value(self._sums[key])}"
+            yield f"{self.name}_count{_format_labels(key)} {counts[-1]}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                raise ValueError(f"Metric {metric.name} already registered with a different shape")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names, self._lock))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names, self._lock))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = _DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(  # type: ignore[return-value]
+            Histogram(name, help_text, label_names, self._lock, buckets=buckets)
+        )
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [line for _, metric in sorted(self._metrics.items()) for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path) -> Path:
+        # node-exporter may read the file at any moment, so never expose a
+        # half-written one: write a sibling temp file and rename over it.
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                fp.write(self.render())
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return target
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in self._metrics.values():
+                for attr in ("_values", "_counts", "_sums"):
+                    values = getattr(metric, attr, None)
+                    if values is not None:
+                        values.clear()
+
+
+class TextfileExporter:
+    def __init__(self, registry: MetricsRegistry, path: str, interval_s: float = 0.0) -> None:
+        self.registry = registry
+        self.path = path
+        self.interval_s = interval_s
+        self._last_write = time.monotonic()
+
+    def tick(self) -> None:
+        if not self.path or self.interval_s <= 0:
+            return
+        if time.monotonic() - self._last_write >= self.interval_s:
+            self.write()
+
+    def write(self) -> None:
+        if not self.path:
+            return
+        self.registry.write_textfile(self.path)
+        self._last_write = time.monotonic()
+
+
+REGISTRY = MetricsRegistry()
+
+TRANSCRIPT_FETCHES = REGISTRY.counter(
+    "eyt_transcript_fetch_total",
+    "Transcript fetch attempts by outcome (ok, empty, error, blocked, ssl_error, timeout, memo_skipped).",
+    ("outcome",),
+)
+TRANSCRIPT_SSL_FALLBACKS = REGISTRY.counter(
+    "eyt_transcript_ssl_fallback_total",
+    "Transcript fetches retried with the insecure SSL fallback, by outcome.",
+    ("outcome",),
+)
+TRANSCRIPT_RETRIES = REGISTRY.counter(
+    "eyt_transcript_retries_total",
+    "Transcript fetch retries after transient network errors (timeouts, resets, 5xx).",
+)
+TRANSCRIPT_PROBES = REGISTRY.counter(
+    "eyt_transcript_probes_total",
+    "Transcript track probes by outcome (player_only, watch_page, no_tracks, no_match, doomed_skip, track_failed, fallback).",
+    ("outcome",),
+)
+TRANSCRIPT_HEDGES = REGISTRY.counter(
+    "eyt_transcript_hedges_total",
+    "Slow transcript fetches by hedge outcome (primary_won, hedge_won, budget_exhausted).",
+    ("outcome",),
+)
+TRANSCRIPT_FETCH_SECONDS = REGISTRY.histogram(
+    "eyt_transcript_fetch_seconds",
+    "Wall time of fetch_transcript including any SSL fallback.",
+)
+TRANSCRIPT_CHARS = REGISTRY.counter(
+    "eyt_transcript_chars_total",
+    "Characters of transcript text received.",
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "eyt_http_requests_total",
+    "Channel/feed HTTP requests by outcome (ok, ok_insecure, error).",
+    ("outcome",),
+)
+HTTP_RESPONSE_BYTES = REGISTRY.counter(
+    "eyt_http_response_bytes_total",
+    "Response body bytes read by channel/feed HTTP requests.",
+)
+HTTP_WIRE_BYTES = REGISTRY.counter(
+    "eyt_http_wire_bytes_total",
+    "Response bytes received on the wire (before decompression) by request kind, host and proxy.",
+    ("kind", "host", "proxy"),
+)
+HTTP_DECODED_BYTES = REGISTRY.counter(
+    "eyt_http_decoded_bytes_total",
+    "Response bytes after decompression by request kind, host and proxy.",
+    ("kind", "host", "proxy"),
+)
+VIDEO_RESULTS = REGISTRY.counter(
+    "eyt_video_results_total",
+    "Processed videos by result status.",
+    ("status",),
+)
+MEMO_LOOKUPS = REGISTRY.counter(
+    "eyt_transcript_memo_lookups_total",
+    "Transcript analysis cache lookups (run_hit, memo_hit, miss).",
+    ("result",),
+)
+RUN_VIDEOS = REGISTRY.gauge("eyt_run_videos", "Videos collected for the last run.")
+RUN_DURATION_SECONDS = REGISTRY.gauge("eyt_run_duration_seconds", "Wall time of the last generate run.")
+RUN_LAST_SUCCESS = REGISTRY.gauge(
+    "eyt_run_last_success_timestamp_seconds",
+    "Unix time the last generate run completed.",
+)
@@ -1,5 +1,13 @@
 from enum import Enum
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from typing import Any
+
+from economic_youtube_headline_skill.warning_codes import (
+    compact_warnings,
+    expand_warnings,
+    intern_warning,
+    warning_catalog,
+)
 
 
 class ProcessingStatus(str, Enum):
@@ -8,6 +16,7 @@ class ProcessingStatus(str, Enum):
     ENDED_LIVE = "ended_live"
     UNAVAILABLE = "unavailable"
     ERROR = "error"
+    SKIPPED = "skipped"
 
 
 @dataclass(slots=True)
@@ -35,6 +44,63 @@ class HeadlineResult:
     headlines: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     error: str | None = None
+    duplicate_of: str | None = None
+
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        video = self.video
+        partial = self.partial
+        payload = {
+            "status": self.status.value,
+            "video": {
+                "video_id": video.video_id,
+                "url": video.url,
+                "channel_name": video.channel_name,
+                "title": video.title,
+                "was_live": video.was_live,
+            },
+            "transcript_chars": self.transcript_chars,
+            "partial": {
+                "is_partial": partial.is_partial,
+                "coverage_ratio": partial.coverage_ratio,
+                "reason": partial.reason,
+            },
+            "headlines": list(self.headlines),
+            "warnings": list(self.warnings),
+            "error": self.error,
+            "duplicate_of": self.duplicate_of,
+        }
+        if compact:
+            payload["warnings"], payload["warning_codes"] = compact_warnings(self.warnings)
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "HeadlineResult":
+        video = payload["video"]
+        partial = payload.get("partial") or {}
+        return cls(
+            status=ProcessingStatus(payload["status"]),
+            video=VideoDescriptor(
+                video_id=video["video_id"],
+                url=video["url"],
+                channel_name=video.get("channel_name", "Unknown Channel"),
+                title=video.get("title", "Unknown Title"),
+                was_live=bool(video.get("was_live", False)),
+            ),
+            transcript_chars=int(payload.get("transcript_chars", 0)),
+            partial=PartialInfo(
+                is_partial=bool(partial.get("is_partial", False)),
+                coverage_ratio=partial.get("coverage_ratio"),
+                reason=partial.get("reason"),
+            ),
+            headlines=list(payload.get("headlines", [])),
+            warnings=(
+                expand_warnings(payload.get("warnings", []), payload["warning_codes"])
+                if "warning_codes" in payload
+                else [intern_warning(text) for text in payload.get("warnings", [])]
+            ),
+            error=payload.get("error"),
+            duplicate_of=payload.get("duplicate_of"),
+        )
 
 
 @dataclass(slots=True)
@@ -44,8 +110,13 @@ class BatchResult:
     results: list[HeadlineResult]
     repo: str = "economic-youtube-headline-skill"
 
-    def to_dict(self) -> dict:
-        payload = asdict(self)
-        for item in payload["results"]:
-            item["status"] = item["status"].value
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        payload = {
+            "run_id": self.run_id,
+            "generated_at": self.generated_at,
+            "results": [item.to_dict(compact) for item in self.results],
+            "repo": self.repo,
+        }
+        if compact:
+            payload["warning_catalog"] = warning_catalog(item.warnings for item in self.results)
         return payload
@@ -1,18 +1,36 @@
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 from uuid import uuid4
 
+from economic_youtube_headline_skill.corpus import CorpusSpec, transcript_for_video
+from economic_youtube_headline_skill.hedging import Hedger
+from economic_youtube_headline_skill.metrics import MEMO_LOOKUPS, VIDEO_RESULTS
 from economic_youtube_headline_skill.models import (
     BatchResult,
     HeadlineResult,
+    PartialInfo,
     ProcessingStatus,
     VideoDescriptor,
 )
-from economic_youtube_headline_skill.processor import extract_headlines
+from economic_youtube_headline_skill.processor import ExtractionState, extract_headlines_incremental
 from economic_youtube_headline_skill.settings import Settings
 from economic_youtube_headline_skill.state_machine import classify_transcript_state
+from economic_youtube_headline_skill.transcript_memo import (
+    MemoEntry,
+    ProgressStore,
+    TranscriptMemo,
+    VideoProgress,
+    transcript_hash,
+)
+from economic_youtube_headline_skill.tracing import collect_spans, span
+from economic_youtube_headline_skill.transcript_probe import ChannelLanguageMemo, TranscriptProber
+from economic_youtube_headline_skill.warning_codes import warning
 from economic_youtube_headline_skill.youtube import (
+    _format_exception,
     build_proxy_config,
     fetch_transcript,
     infer_was_live,
@@ -20,6 +38,39 @@ from economic_youtube_headline_skill.youtube import (
 )
 
 
+@dataclass(slots=True)
+class _Analysis:
+    status: ProcessingStatus
+    partial: PartialInfo
+    warnings: list[str]
+    headlines: list[str]
+    extraction: ExtractionState | None = None
+    spans_ms: dict[str, float] | None = None
+
+
+@dataclass(slots=True)
+class _Fetched:
+    url: str
+    video: VideoDescriptor | None = None
+    transcript: str | None = None
+    warnings: list[str] = field(default_factory=list)
+    spans_ms: dict[str, float] | None = None
+    error: Exception | None = None
+
+
+@dataclass(slots=True)
+class _PendingVideo:
+    video: VideoDescriptor
+    transcript: str | None
+    transcript_warnings: list[str]
+    analysis: "Future[_Analysis]"
+    memo_key: str | None = None
+    origin_video_id: str | None = None
+    fresh: bool = False
+    resumed_chars: int = 0
+    spans_ms: dict[str, float] | None = None
+
+
 def _build_video(url: str) -> VideoDescriptor:
     video_id = parse_video_id(url)
     return VideoDescriptor(
@@ -31,89 +82,356 @@ def _build_video(url: str) -> VideoDescriptor:
     )
 
 
+def _skipped_result(url: str) -> HeadlineResult:
+    try:
+        video = _build_video(url)
+    except Exception:
+        video = VideoDescriptor(video_id=url, url=url)
+    return HeadlineResult(
+        status=ProcessingStatus.SKIPPED,
+        video=video,
+        warnings=[warning("deadline_skipped")],
+    )
+
+
+def _error_result(url: str, video: VideoDescriptor | None, exc: Exception) -> HeadlineResult:
+    return HeadlineResult(
+        status=ProcessingStatus.ERROR,
+        video=video or VideoDescriptor(video_id=url, url=url),
+        warnings=[warning("processing_failed", error=_format_exception(exc))],
+        error="processing_error",
+    )
+
+
 def _resolve_transcript(
     video: VideoDescriptor,
     settings: Settings,
     proxy_config: Any | None = None,
+    http_client: Any | None = None,
+    hedger: Hedger | None = None,
+    prober: TranscriptProber | None = None,
 ) -> tuple[str | None, list[str]]:
     if settings.mock_transcript_text:
         return settings.mock_transcript_text, []
+    if settings.mock_transcript_corpus:
+        return transcript_for_video(video.video_id, CorpusSpec.parse(settings.mock_transcript_corpus)), []
     return fetch_transcript(
         video.video_id,
         settings.languages(),
         allow_insecure_ssl_fallback=settings.insecure_ssl_fallback,
         proxy_config=proxy_config,
+        http_client=http_client,
+        hedger=hedger,
+        timeout_s=settings.video_timeout_s,
+        retries=settings.transient_retries,
+        backoff_s=settings.retry_backoff_ms / 1000,
+        prober=prober,
     )
 
 
-def run_pipeline(
-    urls: list[str],
+def _analyze_transcript(
+    transcript: str | None,
+    was_live: bool,
+    min_transcript_chars: int,
+    allow_partial: bool,
+    max_headlines: int,
+    prior_extraction: ExtractionState | None = None,
+    trace: bool = False,
+) -> _Analysis:
+    # May run in a pool worker, so the spans travel back inside the result.
+    with collect_spans(trace) as spans:
+        with span("classify"):
+            status, partial, warnings = classify_transcript_state(
+                was_live=was_live,
+                transcript_text=transcript,
+                min_transcript_chars=min_transcript_chars,
+                allow_partial=allow_partial,
+            )
+        headlines: list[str] = []
+        extraction = None
+        if transcript and status in {ProcessingStatus.COMPLETE, ProcessingStatus.PARTIAL}:
+            with span("extract"):
+                headlines, extraction = extract_headlines_incremental(transcript, max_headlines, prior_extraction)
+    return _Analysis(status, partial, warnings, headlines, extraction, spans)
+
+
+def _completed(analysis: _Analysis) -> "Future[_Analysis]":
+    future: "Future[_Analysis]" = Future()
+    future.set_result(analysis)
+    return future
+
+
+def _memo_key(transcript: str | None, settings: Settings) -> str | None:
+    if not transcript or not transcript.strip():
+        return None
+    return (
+        f"{transcript_hash(transcript)}:{settings.min_transcript_chars}:"
+        f"{int(settings.allow_partial)}:{settings.max_headlines}"
+    )
+
+
+def _submit_analysis(
+    executor: Executor | None,
+    transcript: str | None,
+    video: VideoDescriptor,
     settings: Settings,
-    log_event: Callable[[str, dict[str, Any]], None] | None = None,
-    run_id: str | None = None,
-) -> BatchResult:
-    results: list[HeadlineResult] = []
-    proxy_config = build_proxy_config(
-        proxy_http_url=settings.proxy_http_url,
-        proxy_https_url=settings.proxy_https_url,
-        webshare_proxy_username=settings.webshare_proxy_username,
-        webshare_proxy_password=settings.webshare_proxy_password,
-        webshare_proxy_locations=settings.webshare_proxy_locations,
-        webshare_retries_when_blocked=settings.webshare_retries_when_blocked,
+    prior_extraction: ExtractionState | None = None,
+) -> "Future[_Analysis]":
+    args = (
+        transcript,
+        video.was_live,
+        settings.min_transcript_chars,
+        settings.allow_partial,
+        settings.max_headlines,
+        prior_extraction,
+        settings.trace,
     )
-    for index, url in enumerate(urls):
-        if index > 0 and settings.transcript_request_delay_ms > 0:
-            time.sleep(settings.transcript_request_delay_ms / 1000)
-        if log_event:
-            log_event("video_start", {"url": url})
-        video = _build_video(url)
-        transcript, transcript_warnings = _resolve_transcript(
-            video,
-            settings,
-            proxy_config=proxy_config,
-        )
+    if executor is not None:
+        return executor.submit(_analyze_transcript, *args)
+    future: "Future[_Analysis]" = Future()
+    try:
+        future.set_result(_analyze_transcript(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
 
-        status, partial, state_warnings = classify_transcript_state(
-            was_live=video.was_live,
-            transcript_text=transcript,
-            min_transcript_chars=settings.min_transcript_chars,
-            allow_partial=settings.allow_partial,
-        )
-        warnings = [*transcript_warnings, *state_warnings]
 
-        headlines: list[str] = []
-        error = None
+def _finish_result(item: _PendingVideo, analysis: _Analysis) -> HeadlineResult:
+    partial = analysis.partial
+    duplicate_of = item.origin_video_id if item.origin_video_id != item.video.video_id else None
+    return HeadlineResult(
+        status=analysis.status,
+        video=item.video,
+        transcript_chars=len(item.transcript or ""),
+        partial=PartialInfo(partial.is_partial, partial.coverage_ratio, partial.reason),
+        headlines=list(analysis.headlines),
+        warnings=[*item.transcript_warnings, *analysis.warnings],
+        error="processing_error" if analysis.status == ProcessingStatus.ERROR else None,
+        duplicate_of=duplicate_of,
+    )
 
-        if transcript and status in {ProcessingStatus.COMPLETE, ProcessingStatus.PARTIAL}:
-            headlines = extract_headlines(transcript, settings.max_headlines)
-
-        if status == ProcessingStatus.ERROR:
-            error = "processing_error"
-
-        results.append(
-            HeadlineResult(
-                status=status,
-                video=video,
-                transcript_chars=len(transcript or ""),
-                partial=partial,
-                headlines=headlines,
-                warnings=warnings,
-                error=error,
-            )
-        )
-        if log_event:
-            log_event(
-                "video_done",
-                {
-                    "video_id": video.video_id,
-                    "status": status.value,
-                    "headlines_count": len(headlines),
-                    "warnings_count": len(warnings),
-                },
-            )
 
+def new_batch(results: list[HeadlineResult], run_id: str | None = None) -> BatchResult:
     return BatchResult(
         run_id=run_id or uuid4().hex[:10],
         generated_at=datetime.now(timezone.utc).isoformat(),
         results=results,
     )
+
+
+def run_pipeline(
+    urls: Iterable[str],
+    settings: Settings,
+    log_event: Callable[[str, dict[str, Any]], None] | None = None,
+    run_id: str | None = None,
+    http_client: Any | None = None,
+    deadline: float | None = None,
+) -> BatchResult:
+    results = iter_pipeline(urls, settings, log_event=log_event, http_client=http_client, deadline=deadline)
+    return new_batch(list(results), run_id=run_id)
+
+
+class _PipelineRun:
+    # The state of one pipeline run, shared by the sync and async front ends
+    # so both produce identical results. fetch() is the blocking network step
+    # and may run concurrently on worker threads; accept(), skip() and drain()
+    # must be called one at a time, in input order.
+    def __init__(
+        self,
+        settings: Settings,
+        log_event: Callable[[str, dict[str, Any]], None] | None = None,
+        http_client: Any | None = None,
+    ) -> None:
+        self.settings = settings
+        self.log_event = log_event
+        self.http_client = http_client
+        self.proxy_config = build_proxy_config(
+            proxy_http_url=settings.proxy_http_url,
+            proxy_https_url=settings.proxy_https_url,
+            webshare_proxy_username=settings.webshare_proxy_username,
+            webshare_proxy_password=settings.webshare_proxy_password,
+            webshare_proxy_locations=settings.webshare_proxy_locations,
+            webshare_retries_when_blocked=settings.webshare_retries_when_blocked,
+        )
+        self.hedger = None
+        if settings.hedge_enabled:
+            # The hedge goes through the alternate proxy when one is configured,
+            # otherwise straight out, so it does not share the primary's path.
+            hedge_proxy = settings.hedge_proxy_url.strip()
+            self.hedger = Hedger(
+                hedge_percentile=settings.hedge_percentile,
+                max_extra=settings.hedge_max_extra,
+                proxy_config=build_proxy_config(proxy_http_url=hedge_proxy, proxy_https_url=hedge_proxy),
+            )
+        self.prober = None
+        if settings.transcript_probe:
+            self.prober = TranscriptProber(ChannelLanguageMemo.load(settings.channel_language_memo_path))
+        # Inline mode keeps at most zero results in flight, so every video is
+        # finished before the next fetch starts (the pre-pool behaviour).
+        self.executor: Executor | None = None
+        if settings.extract_workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.executor = ProcessPoolExecutor(settings.extract_workers)
+        self.max_in_flight = max(1, settings.extract_queue_size) if self.executor is not None else 0
+        self.pending: deque[_PendingVideo] = deque()
+        self.memo = TranscriptMemo.load(settings.transcript_memo_path)
+        self.run_memo: dict[str, tuple[str, "Future[_Analysis]"]] = {}
+        self.progress = ProgressStore.load(settings.incremental_state_path)
+
+    def fetch(self, url: str) -> _Fetched:
+        fetched = _Fetched(url)
+        try:
+            with collect_spans(self.settings.trace) as spans:
+                with span("build_video"):
+                    fetched.video = _build_video(url)
+                with span("transcript"):
+                    fetched.transcript, fetched.warnings = _resolve_transcript(
+                        fetched.video,
+                        self.settings,
+                        proxy_config=self.proxy_config,
+                        http_client=self.http_client,
+                        hedger=self.hedger,
+                        prober=self.prober,
+                    )
+            fetched.spans_ms = spans
+        except Exception as exc:
+            fetched.error = exc
+        return fetched
+
+    def accept(self, fetched: _Fetched) -> Iterator[HeadlineResult]:
+        settings = self.settings
+        video, transcript = fetched.video, fetched.transcript
+        try:
+            if fetched.error is not None:
+                raise fetched.error
+            item = _PendingVideo(video, transcript, fetched.warnings, Future(), spans_ms=fetched.spans_ms)
+            item.memo_key = _memo_key(transcript, settings)
+            if item.memo_key in self.run_memo:
+                MEMO_LOOKUPS.inc(result="run_hit")
+                item.origin_video_id, item.analysis = self.run_memo[item.memo_key]
+            elif item.memo_key and (entry := self.memo.get(item.memo_key)) is not None:
+                MEMO_LOOKUPS.inc(result="memo_hit")
+                item.origin_video_id = entry.video_id
+                item.analysis = _completed(_Analysis(entry.status, entry.partial, entry.warnings, entry.headlines))
+            else:
+                if item.memo_key:
+                    MEMO_LOOKUPS.inc(result="miss")
+                prior = self.progress.get(video.video_id) if transcript else None
+                if prior is not None and not prior.resumable_for(transcript, settings.max_headlines):
+                    prior = None
+                item.origin_video_id = video.video_id
+                item.fresh = True
+                item.resumed_chars = prior.extraction.consumed_chars if prior else 0
+                item.analysis = _submit_analysis(
+                    self.executor,
+                    transcript,
+                    video,
+                    settings,
+                    prior_extraction=prior.extraction if prior else None,
+                )
+            if item.memo_key:
+                self.run_memo[item.memo_key] = (item.origin_video_id, item.analysis)
+        except Exception as exc:
+            # One bad URL or fetch must not take the batch down with it.
+            yield from self.drain(0)
+            result = _error_result(fetched.url, video, exc)
+            VIDEO_RESULTS.inc(status=result.status.value)
+            if self.log_event:
+                self.log_event("video_error", {"url": fetched.url, "error": _format_exception(exc)})
+            yield result
+            return
+        self.pending.append(item)
+        yield from self.drain(self.max_in_flight)
+
+    def skip(self, url: str) -> Iterator[HeadlineResult]:
+        # Past the deadline nothing new is started; whatever is already in
+        # flight still finishes ahead of the skips.
+        yield from self.drain(0)
+        result = _skipped_result(url)
+        VIDEO_RESULTS.inc(status=result.status.value)
+        if self.log_event:
+            self.log_event("video_skipped", {"url": url, "reason": "deadline"})
+        yield result
+
+    def drain(self, limit: int) -> Iterator[HeadlineResult]:
+        settings, log_event = self.settings, self.log_event
+        while len(self.pending) > limit:
+            item = self.pending.popleft()
+            waited = time.perf_counter()
+            try:
+                analysis = item.analysis.result()
+            except Exception as exc:
+                analysis = _Analysis(
+                    ProcessingStatus.ERROR,
+                    PartialInfo(),
+                    [warning("processing_failed", error=_format_exception(exc))],
+                    [],
+                )
+            waited_ms = (time.perf_counter() - waited) * 1000
+            result = _finish_result(item, analysis)
+            VIDEO_RESULTS.inc(status=result.status.value)
+            if item.memo_key and item.origin_video_id and analysis.status != ProcessingStatus.ERROR:
+                self.memo.put(
+                    item.memo_key,
+                    MemoEntry(
+                        item.origin_video_id,
+                        analysis.status,
+                        analysis.partial,
+                        analysis.warnings,
+                        analysis.headlines,
+                    ),
+                )
+            if item.fresh and item.transcript and analysis.extraction is not None and self.progress.path:
+                self.progress.put(
+                    item.video.video_id,
+                    VideoProgress.capture(item.transcript, settings.max_headlines, analysis.extraction),
+                )
+            if log_event:
+                payload: dict[str, Any] = {
+                    "video_id": item.video.video_id,
+                    "status": result.status.value,
+                    "headlines_count": len(result.headlines),
+                    "warnings_count": len(result.warnings),
+                    "duplicate_of": result.duplicate_of,
+                    "resumed_chars": item.resumed_chars,
+                }
+                if item.spans_ms is not None:
+                    spans = dict(item.spans_ms)
+                    if item.fresh and analysis.spans_ms:
+                        spans.update(analysis.spans_ms)
+                    spans["analysis_wait"] = round(waited_ms, 3)
+                    payload["spans_ms"] = spans
+                log_event("video_done", payload)
+            yield result
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        self.memo.save()
+        self.progress.save()
+        if self.prober is not None:
+            self.prober.memo.save()
+
+
+def iter_pipeline(
+    urls: Iterable[str],
+    settings: Settings,
+    log_event: Callable[[str, dict[str, Any]], None] | None = None,
+    http_client: Any | None = None,
+    deadline: float | None = None,
+) -> Iterator[HeadlineResult]:
+    run = _PipelineRun(settings, log_event=log_event, http_client=http_client)
+    try:
+        for index, url in enumerate(urls):
+            if index > 0 and settings.transcript_request_delay_ms > 0:
+                time.sleep(settings.transcript_request_delay_ms / 1000)
+            if deadline is not None and time.monotonic() >= deadline:
+                yield from run.skip(url)
+                continue
+            if log_event:
+                log_event("video_start", {"url": url})
+            yield from run.accept(run.fetch(url))
+        yield from run.drain(0)
+    finally:
+        run.close()
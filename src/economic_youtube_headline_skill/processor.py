@@ -1,28 +1,55 @@
 import re
+from dataclasses import dataclass, field
+
+_FRAGMENT_BOUNDARY_RE = re.compile(r"[.!?\n]+")
+
+
+@dataclass(slots=True)
+class ExtractionState:
+    headlines: list[str] = field(default_factory=list)
+    consumed_chars: int = 0
 
 
 def _normalize(line: str) -> str:
     return re.sub(r"\s+", " ", line).strip(" -•\t\r\n")
 
 
-def extract_headlines(transcript_text: str, max_headlines: int) -> list[str]:
-    fragments = re.split(r"[.!?\n]+", transcript_text)
-    normalized: list[str] = []
-    seen: set[str] = set()
-
-    for fragment in fragments:
-        candidate = _normalize(fragment)
-        if len(candidate) < 12:
-            continue
-        if candidate in seen:
-            continue
-        seen.add(candidate)
-        normalized.append(candidate)
-        if len(normalized) >= max_headlines:
-            break
+def extract_headlines_incremental(
+    transcript_text: str,
+    max_headlines: int,
+    state: ExtractionState | None = None,
+) -> tuple[list[str], ExtractionState]:
+    # `state` must come from an earlier call on a prefix of `transcript_text`;
+    # only fragments after `consumed_chars` are segmented again. The trailing
+    # fragment has no terminator yet, so it is never folded into the state.
+    normalized = list(state.headlines) if state else []
+    position = state.consumed_chars if state else 0
+    seen = set(normalized)
+
+    if len(normalized) < max_headlines:
+        for match in _FRAGMENT_BOUNDARY_RE.finditer(transcript_text, position):
+            candidate = _normalize(transcript_text[position : match.start()])
+            position = match.end()
+            if len(candidate) < 12 or candidate in seen:
+                continue
+            seen.add(candidate)
+            normalized.append(candidate)
+            if len(normalized) >= max_headlines:
+                break
+
+    next_state = ExtractionState(headlines=list(normalized), consumed_chars=position)
+    if len(normalized) < max_headlines:
+        tail = _normalize(transcript_text[position:])
+        if len(tail) >= 12 and tail not in seen:
+            normalized.append(tail)
 
     if normalized:
-        return normalized
+        return normalized, next_state
 
     fallback = _normalize(transcript_text[:160])
-    return [fallback] if fallback else []
+    return ([fallback] if fallback else []), next_state
+
+
+def extract_headlines(transcript_text: str, max_headlines: int) -> list[str]:
+    headlines, _ = extract_headlines_incremental(transcript_text, max_headlines)
+    return headlines
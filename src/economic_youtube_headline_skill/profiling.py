@@ -0,0 +1,82 @@
+import cProfile
+import io
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+@dataclass(slots=True)
+class ProfileArtifacts:
+    cpu_path: Path
+    alloc_path: Path
+    peak_bytes: int = 0
+    summary: list[str] = field(default_factory=list)
+
+
+def _cpu_summary(profiler: cProfile.Profile, top_n: int) -> str:
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+    return buffer.getvalue()
+
+
+def _alloc_lines(snapshot: tracemalloc.Snapshot, top_n: int) -> list[str]:
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    lines = []
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+    return lines
+
+
+@contextmanager
+def profile_run(directory: str | Path, stem: str, top_n: int = 15) -> Iterator[ProfileArtifacts]:
+    # Only the calling process is profiled; extraction in pool workers shows
+    # up as time spent waiting on futures.
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    artifacts = ProfileArtifacts(cpu_path=root / f"{stem}.prof", alloc_path=root / f"{stem}.alloc.txt")
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(10)
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield artifacts
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, artifacts.peak_bytes = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+
+        profiler.dump_stats(artifacts.cpu_path)
+        alloc_lines = _alloc_lines(snapshot, top_n)
+        artifacts.alloc_path.write_text(
+            "\n".join([f"peak_bytes {artifacts.peak_bytes}", *alloc_lines]) + "\n",
+            encoding="utf-8",
+        )
+        cpu_lines = [line for line in _cpu_summary(profiler, top_n).splitlines() if line.strip()]
+        artifacts.summary = [
+            f"peak traced memory: {artifacts.peak_bytes / (1024 * 1024):.1f} MiB",
+            "top allocations:",
+            *alloc_lines[: min(top_n, 5)],
+            *cpu_lines,
+        ]
+
+
+def print_summary(artifacts: ProfileArtifacts, stream: TextIO) -> None:
+    print(f"[profile] cpu: {artifacts.cpu_path}", file=stream)
+    print(f"[profile] alloc: {artifacts.alloc_path}", file=stream)
+    for line in artifacts.summary:
+        print(f"[profile] {line}", file=stream)
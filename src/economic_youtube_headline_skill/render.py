@@ -1,33 +1,133 @@
+import csv
+import io
 import json
+from json.encoder import encode_basestring
+from typing import Iterable, TextIO
 
-from economic_youtube_headline_skill.models import BatchResult
+from economic_youtube_headline_skill.models import BatchResult, HeadlineResult
+from economic_youtube_headline_skill.serialize import encode_result
+from economic_youtube_headline_skill.warning_codes import compact_warnings, warning_catalog
+
+CSV_COLUMNS = [
+    "run_id",
+    "video_id",
+    "url",
+    "channel_name",
+    "title",
+    "was_live",
+    "status",
+    "transcript_chars",
+    "is_partial",
+    "coverage_ratio",
+    "partial_reason",
+    "headlines",
+    "warnings",
+    "error",
+    "duplicate_of",
+]
+
+
+def _markdown_block(idx: int, item: HeadlineResult, shown: set[str]) -> list[str]:
+    chunks = [
+        "",
+        f"## {idx}. {item.video.channel_name}",
+        f"### {item.video.title}",
+        f"- 링크: {item.video.url}",
+        f"- 상태: {item.status.value}",
+    ]
+    if item.partial.is_partial and item.partial.reason:
+        chunks.append(f"- 부분처리 사유: {item.partial.reason}")
+    if item.error:
+        chunks.append(f"- 오류: {item.error}")
+
+    chunks.append("#### 헤드라인")
+    # A cross-run memo hit can point at a video outside this brief; only
+    # collapse when the reader can find the origin further up.
+    if item.duplicate_of and item.duplicate_of in shown:
+        chunks.append(f"- (중복 자막: {item.duplicate_of} 영상과 동일하여 생략)")
+    elif item.headlines:
+        chunks.extend([f"- {line}" for line in item.headlines])
+    else:
+        chunks.append("- (추출된 헤드라인 없음)")
+    return chunks
+
+
+def write_markdown(results: Iterable[HeadlineResult], fp: TextIO, run_id: str, compact: bool = False) -> None:
+    # Warnings are not part of the brief, so the warning format does not apply.
+    fp.write(f"# Economic YouTube Headline Brief ({run_id})")
+    shown: set[str] = set()
+    for idx, item in enumerate(results, start=1):
+        fp.write("\n" + "\n".join(_markdown_block(idx, item, shown)))
+        shown.add(item.video.video_id)
+    fp.write("\n")
+
+
+def write_ndjson(results: Iterable[HeadlineResult], fp: TextIO, run_id: str, compact: bool = False) -> None:
+    prefix = f'{{"run_id": {encode_basestring(run_id)}, '
+    for item in results:
+        fp.write(prefix + encode_result(item, compact)[1:] + "\n")
+
+
+def write_csv(results: Iterable[HeadlineResult], fp: TextIO, run_id: str, compact: bool = False) -> None:
+    writer = csv.writer(fp)
+    writer.writerow(CSV_COLUMNS + ["warning_codes"] if compact else CSV_COLUMNS)
+    for item in results:
+        warnings, codes = compact_warnings(item.warnings) if compact else (item.warnings, None)
+        row = [
+            run_id,
+            item.video.video_id,
+            item.video.url,
+            item.video.channel_name,
+            item.video.title,
+            "true" if item.video.was_live else "false",
+            item.status.value,
+            item.transcript_chars,
+            "true" if item.partial.is_partial else "false",
+            "" if item.partial.coverage_ratio is None else item.partial.coverage_ratio,
+            item.partial.reason or "",
+            "\n".join(item.headlines),
+            "\n".join(warnings),
+            item.error or "",
+            item.duplicate_of or "",
+        ]
+        if codes is not None:
+            row.append("\n".join(codes))
+        writer.writerow(row)
+
+
+def write_json(batch: BatchResult, fp: TextIO, compact: bool = False) -> None:
+    fp.write("{\n")
+    fp.write(f'  "run_id": {json.dumps(batch.run_id, ensure_ascii=False)},\n')
+    fp.write(f'  "generated_at": {json.dumps(batch.generated_at, ensure_ascii=False)},\n')
+    if not batch.results:
+        fp.write('  "results": [],\n')
+    else:
+        fp.write('  "results": [\n')
+        for idx, item in enumerate(batch.results):
+            encoded = json.dumps(item.to_dict(compact), ensure_ascii=False, indent=2)
+            fp.write("    " + encoded.replace("\n", "\n    "))
+            fp.write(",\n" if idx < len(batch.results) - 1 else "\n")
+        fp.write("  ],\n")
+    fp.write(f'  "repo": {json.dumps(batch.repo, ensure_ascii=False)}')
+    if compact:
+        catalog = warning_catalog(item.warnings for item in batch.results)
+        encoded = json.dumps(catalog, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+        fp.write(f',\n  "warning_catalog": {encoded}')
+    fp.write("\n}\n")
+
+
+STREAM_WRITERS = {
+    "markdown": write_markdown,
+    "ndjson": write_ndjson,
+    "csv": write_csv,
+}
 
 
 def render_markdown(batch: BatchResult) -> str:
-    chunks: list[str] = [f"# Economic YouTube Headline Brief ({batch.run_id})"]
-    for idx, item in enumerate(batch.results, start=1):
-        chunks.extend(
-            [
-                "",
-                f"## {idx}. {item.video.channel_name}",
-                f"### {item.video.title}",
-                f"- 링크: {item.video.url}",
-                f"- 상태: {item.status.value}",
-            ]
-        )
-        if item.partial.is_partial and item.partial.reason:
-            chunks.append(f"- 부분처리 사유: {item.partial.reason}")
-        if item.error:
-            chunks.append(f"- 오류: {item.error}")
-
-        chunks.append("#### 헤드라인")
-        if item.headlines:
-            chunks.extend([f"- {line}" for line in item.headlines])
-        else:
-            chunks.append("- (추출된 헤드라인 없음)")
-
-    return "\n".join(chunks).strip() + "\n"
-
-
-def render_json(batch: BatchResult) -> str:
-    return json.dumps(batch.to_dict(), ensure_ascii=False, indent=2)
+    buffer = io.StringIO()
+    write_markdown(batch.results, buffer, batch.run_id)
+    return buffer.getvalue()
+
+
+def render_json(batch: BatchResult, compact: bool = False) -> str:
+    return json.dumps(batch.to_dict(compact), ensure_ascii=False, indent=2)
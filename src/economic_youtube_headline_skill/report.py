@@ -0,0 +1,35 @@
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from economic_youtube_headline_skill.archive import iter_daily_records
+from economic_youtube_headline_skill.models import HeadlineResult, ProcessingStatus
+
+_STATUS_RANK = {
+    ProcessingStatus.COMPLETE: 4,
+    ProcessingStatus.PARTIAL: 3,
+    ProcessingStatus.ENDED_LIVE: 2,
+    ProcessingStatus.UNAVAILABLE: 1,
+    ProcessingStatus.ERROR: 0,
+    ProcessingStatus.SKIPPED: -1,
+}
+
+
+def iter_daily_batches(
+    result_dir: str | Path,
+    date_key: str,
+    skill_slug: str = "headline",
+) -> Iterator[dict[str, Any]]:
+    return iter_daily_records(result_dir, f"{skill_slug}-{date_key}.jsonl")
+
+
+def merge_latest_results(batches: Iterable[dict[str, Any]]) -> list[HeadlineResult]:
+    # A later run replaces the kept result unless it is a worse outcome, so a
+    # `complete` brief is not lost to a later blocked/unavailable refetch.
+    latest: dict[str, HeadlineResult] = {}
+    for batch in batches:
+        for payload in batch.get("results") or []:
+            candidate = HeadlineResult.from_dict(payload)
+            current = latest.get(candidate.video.video_id)
+            if current is None or _STATUS_RANK.get(candidate.status, 0) >= _STATUS_RANK.get(current.status, 0):
+                latest[candidate.video.video_id] = candidate
+    return list(latest.values())
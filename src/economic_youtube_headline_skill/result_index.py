@@ -0,0 +1,218 @@
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from economic_youtube_headline_skill.warning_codes import expand_warnings
+
+_DAILY_RESULT_RE = re.compile(r"-(\d{8})\.jsonl$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    generated_at TEXT NOT NULL,
+    date_key TEXT NOT NULL,
+    repo TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS videos (
+    run_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    date_key TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    channel_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    was_live INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    transcript_chars INTEGER NOT NULL,
+    is_partial INTEGER NOT NULL,
+    coverage_ratio REAL,
+    partial_reason TEXT,
+    warnings TEXT NOT NULL,
+    error TEXT,
+    duplicate_of TEXT,
+    PRIMARY KEY (run_id, position)
+);
+CREATE TABLE IF NOT EXISTS headlines (
+    run_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (run_id, position, rank)
+);
+CREATE INDEX IF NOT EXISTS idx_videos_video_id ON videos (video_id, date_key);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel_name, date_key);
+CREATE INDEX IF NOT EXISTS idx_videos_date ON videos (date_key);
+"""
+
+
+def connect(db_path: str | Path, read_only: bool = False) -> sqlite3.Connection:
+    path = Path(db_path)
+    if read_only:
+        # Queries must not create the database: a mistyped --db should fail,
+        # not quietly return nothing.
+        if not path.is_file():
+            raise FileNotFoundError(f"Result index not found: {path}")
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _insert_payload(conn: sqlite3.Connection, payload: dict[str, Any], date_key: str) -> None:
+    run_id = payload["run_id"]
+    conn.execute("DELETE FROM videos WHERE run_id = ?", (run_id,))
+    conn.execute("DELETE FROM headlines WHERE run_id = ?", (run_id,))
+    conn.execute(
+        "INSERT OR REPLACE INTO runs (run_id, generated_at, date_key, repo) VALUES (?, ?, ?, ?)",
+        (run_id, payload["generated_at"], date_key, payload.get("repo", "")),
+    )
+    video_rows = []
+    headline_rows = []
+    for position, item in enumerate(payload.get("results", [])):
+        video = item["video"]
+        partial = item.get("partial") or {}
+        warnings = item.get("warnings", [])
+        if "warning_codes" in item:
+            warnings = expand_warnings(warnings, item["warning_codes"])
+        video_rows.append(
+            (
+                run_id,
+                position,
+                date_key,
+                video["video_id"],
+                video["url"],
+                video["channel_name"],
+                video["title"],
+                int(bool(video.get("was_live"))),
+                item["status"],
+                int(item.get("transcript_chars", 0)),
+                int(bool(partial.get("is_partial"))),
+                partial.get("coverage_ratio"),
+                partial.get("reason"),
+                json.dumps(warnings, ensure_ascii=False),
+                item.get("error"),
+                item.get("duplicate_of"),
+            )
+        )
+        headline_rows.extend(
+            (run_id, position, rank, text) for rank, text in enumerate(item.get("headlines", []))
+        )
+    conn.executemany(
+        "INSERT INTO videos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        video_rows,
+    )
+    conn.executemany("INSERT INTO headlines VALUES (?, ?, ?, ?)", headline_rows)
+
+
+def index_batch(db_path: str | Path, payload: dict[str, Any], date_key: str) -> None:
+    conn = connect(db_path)
+    try:
+        with conn:
+            _insert_payload(conn, payload, date_key)
+    finally:
+        conn.close()
+
+
+def index_daily_files(db_path: str | Path, paths: Iterable[Path]) -> int:
+    conn = connect(db_path)
+    indexed = 0
+    try:
+        for path in paths:
+            match = _DAILY_RESULT_RE.search(path.name)
+            if not match:
+                continue
+            with conn, path.open(encoding="utf-8") as fp:
+                for line in fp:
+                    if not line.strip():
+                        continue
+                    _insert_payload(conn, json.loads(line), match.group(1))
+                    indexed += 1
+    finally:
+        conn.close()
+    return indexed
+
+
+def query_results(
+    db_path: str | Path,
+    *,
+    video_id: str | None = None,
+    channel_name: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    status: str | None = None,
+    run_id: str | None = None,
+    limit: int = 100,
+) -> list[dict[str, Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, value in [
+        ("v.video_id", video_id),
+        ("v.channel_name", channel_name),
+        ("v.status", status),
+        ("v.run_id", run_id),
+    ]:
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if since:
+        clauses.append("v.date_key >= ?")
+        params.append(since)
+    if until:
+        clauses.append("v.date_key <= ?")
+        params.append(until)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = connect(db_path, read_only=True)
+    try:
+        # One statement: the page of videos, then their headlines in rank order.
+        rows = conn.execute(
+            "WITH picked AS ("
+            "SELECT v.run_id, v.position, r.generated_at, v.date_key, v.video_id, v.url, v.channel_name, "
+            "v.title, v.was_live, v.status, v.transcript_chars, v.is_partial, v.coverage_ratio, "
+            "v.partial_reason, v.warnings, v.error, v.duplicate_of "
+            f"FROM videos v JOIN runs r ON r.run_id = v.run_id {where} "
+            "ORDER BY r.generated_at DESC, v.run_id, v.position LIMIT ?) "
+            "SELECT p.*, h.text FROM picked p "
+            "LEFT JOIN headlines h ON h.run_id = p.run_id AND h.position = p.position "
+            "ORDER BY p.generated_at DESC, p.run_id, p.position, h.rank",
+            [*params, max(1, limit)],
+        ).fetchall()
+    finally:
+        conn.close()
+
+    videos: dict[tuple[str, int], tuple[Any, ...]] = {}
+    headlines: dict[tuple[str, int], list[str]] = {}
+    for row in rows:
+        key = (row[0], row[1])
+        videos.setdefault(key, row)
+        texts = headlines.setdefault(key, [])
+        if row[17] is not None:
+            texts.append(row[17])
+
+    return [
+        {
+            "run_id": row[0],
+            "generated_at": row[2],
+            "date_key": row[3],
+            "status": row[9],
+            "video": {
+                "video_id": row[4],
+                "url": row[5],
+                "channel_name": row[6],
+                "title": row[7],
+                "was_live": bool(row[8]),
+            },
+            "transcript_chars": row[10],
+            "partial": {"is_partial": bool(row[11]), "coverage_ratio": row[12], "reason": row[13]},
+            "headlines": headlines[(row[0], row[1])],
+            "warnings": json.loads(row[14]),
+            "error": row[15],
+            "duplicate_of": row[16],
+        }
+        for row in videos.values()
+    ]
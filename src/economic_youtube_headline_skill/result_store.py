@@ -2,16 +2,24 @@ import json
 from pathlib import Path
 from typing import Any
 
+from economic_youtube_headline_skill.file_lock import append_bytes
+from economic_youtube_headline_skill.models import BatchResult
+from economic_youtube_headline_skill.serialize import encode_batch_line
+
 
 def append_daily_result(
     *,
     result_dir: str,
     date_key: str,
     skill_slug: str,
-    payload: dict[str, Any],
+    payload: dict[str, Any] | BatchResult,
+    lock: bool = False,
+    compact: bool = False,
 ) -> Path:
     target = Path(result_dir) / f"{skill_slug}-{date_key}.jsonl"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    with target.open("a", encoding="utf-8") as fp:
-        fp.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    if isinstance(payload, BatchResult):
+        line = encode_batch_line(payload, compact)
+    else:
+        line = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+    append_bytes(target, line, lock=lock)
     return target
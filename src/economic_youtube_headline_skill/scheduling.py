@@ -0,0 +1,51 @@
+import re
+from datetime import datetime, timedelta
+from itertools import zip_longest
+
+_CLOCK_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([smh]?)$")
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_deadline(raw: str, now: datetime | None = None) -> float | None:
+    # Returns the seconds left in the run budget: either a duration
+    # ("1500", "90s", "25m", "1.5h") or a local wall-clock time ("07:30").
+    # A time already passed today means that time tomorrow, so a nightly run
+    # started at 23:00 with "07:30" gets its full budget.
+    value = raw.strip().lower()
+    if not value:
+        return None
+    now = now or datetime.now().astimezone()
+    clock = _CLOCK_RE.match(value)
+    if clock:
+        hour, minute = int(clock.group(1)), int(clock.group(2))
+        if hour > 23 or minute > 59:
+            raise ValueError(f"Invalid deadline time: {raw}")
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return (target - now) / timedelta(seconds=1)
+    duration = _DURATION_RE.match(value)
+    if duration:
+        return float(duration.group(1)) * _UNIT_SECONDS[duration.group(2)]
+    raise ValueError(f"Invalid deadline (use HH:MM or a duration like 25m): {raw}")
+
+
+def _published_key(published: str | None) -> float:
+    if not published:
+        return float("-inf")
+    try:
+        return datetime.fromisoformat(published).timestamp()
+    except ValueError:
+        return float("-inf")
+
+
+def interleave_channels(groups: list[list[tuple[str, str | None]]]) -> list[str]:
+    # Round-robin across channels (each group is one channel's feed,
+    # newest first); within a round the most recently published goes first.
+    ordered: list[str] = []
+    for round_entries in zip_longest(*groups):
+        entries = [entry for entry in round_entries if entry is not None]
+        entries.sort(key=lambda entry: _published_key(entry[1]), reverse=True)
+        ordered.extend(url for url, _ in entries)
+    return list(dict.fromkeys(ordered))
@@ -0,0 +1,72 @@
+from json.encoder import encode_basestring
+
+from economic_youtube_headline_skill.models import BatchResult, HeadlineResult
+from economic_youtube_headline_skill.warning_codes import compact_warnings, warning_catalog
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _string(value: str | None) -> str:
+    return "null" if value is None else encode_basestring(value)
+
+
+def _number(value: int | float | None) -> str:
+    return "null" if value is None else repr(value)
+
+
+def _boolean(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _string_list(values: list[str]) -> str:
+    return f"[{', '.join(map(encode_basestring, values))}]"
+
+
+def _string_map(values: dict[str, str]) -> str:
+    return "{" + ", ".join(f"{encode_basestring(key)}: {encode_basestring(value)}" for key, value in values.items()) + "}"
+
+
+def encode_result(item: HeadlineResult, compact: bool = False) -> str:
+    # Byte-for-byte identical to json.dumps(item.to_dict(compact), ensure_ascii=False).
+    video = item.video
+    partial = item.partial
+    if compact:
+        warnings, codes = compact_warnings(item.warnings)
+        tail = f', "warning_codes": {_string_list(codes)}}}'
+    else:
+        warnings, tail = item.warnings, "}"
+    return (
+        f'{{"status": {_string(item.status.value)}, '
+        f'"video": {{"video_id": {_string(video.video_id)}, "url": {_string(video.url)}, '
+        f'"channel_name": {_string(video.channel_name)}, "title": {_string(video.title)}, '
+        f'"was_live": {_boolean(video.was_live)}}}, '
+        f'"transcript_chars": {_number(item.transcript_chars)}, '
+        f'"partial": {{"is_partial": {_boolean(partial.is_partial)}, '
+        f'"coverage_ratio": {_number(partial.coverage_ratio)}, "reason": {_string(partial.reason)}}}, '
+        f'"headlines": {_string_list(item.headlines)}, "warnings": {_string_list(warnings)}, '
+        f'"error": {_string(item.error)}, "duplicate_of": {_string(item.duplicate_of)}{tail}'
+    )
+
+
+def encode_batch(batch: BatchResult, compact: bool = False) -> str:
+    results = ", ".join(encode_result(item, compact) for item in batch.results)
+    catalog = ""
+    if compact:
+        catalog = f', "warning_catalog": {_string_map(warning_catalog(item.warnings for item in batch.results))}'
+    return (
+        f'{{"run_id": {_string(batch.run_id)}, "generated_at": {_string(batch.generated_at)}, '
+        f'"results": [{results}], "repo": {_string(batch.repo)}{catalog}}}'
+    )
+
+
+def encode_batch_line(batch: BatchResult, compact: bool = False) -> bytes:
+    if orjson is not None:
+        # This does build the to_dict() tree, but orjson walks it in C and
+        # still runs about twice as fast as the string encoder below (10k
+        # results: ~40ms vs ~80ms, benchmarks/bench_serialize.py), so the
+        # intermediate dicts are the cheaper path when orjson is installed.
+        return orjson.dumps(batch.to_dict(compact), option=orjson.OPT_APPEND_NEWLINE)
+    return (encode_batch(batch, compact) + "\n").encode("utf-8")
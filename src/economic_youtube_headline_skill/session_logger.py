@@ -1,9 +1,139 @@
+import atexit
 import json
-from dataclasses import dataclass
+import os
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from economic_youtube_headline_skill.file_lock import append_bytes, open_append_fd, write_appending
+
+_STOP = object()
+
+
+def _report(message: str) -> None:
+    print(f"[session-log] {message}", file=sys.stderr)
+
+
+class _BackgroundWriter:
+    def __init__(
+        self,
+        log_path: Path,
+        flush_interval_ms: int,
+        flush_max_events: int,
+        fsync: bool,
+        queue_size: int,
+        lock: bool = False,
+    ) -> None:
+        self._log_path = log_path
+        self._lock = lock
+        self._flush_interval = max(0, flush_interval_ms) / 1000
+        self._flush_max_events = max(1, flush_max_events)
+        self._fsync = fsync
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, queue_size))
+        self._closed = False
+        self._failed = False
+        self._fallback_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="eyt-session-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _offer(self, item: Any) -> bool:
+        # A dead writer never frees queue space, so never block on it.
+        while self._thread.is_alive() and not self._failed:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def put(self, row: dict[str, Any]) -> None:
+        queued = self._offer(row)
+        if queued and not self._failed:
+            return
+        with self._fallback_lock:
+            self._write_sync(self._leftovers() if queued else [*self._leftovers(), row])
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._offer(_STOP)
+        self._thread.join()
+        with self._fallback_lock:
+            self._write_sync(self._leftovers())
+
+    def _leftovers(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if item is not _STOP:
+                rows.append(item)
+
+    def _encode(self, rows: list[dict[str, Any]]) -> bytes:
+        lines: list[str] = []
+        for row in rows:
+            try:
+                lines.append(json.dumps(row, ensure_ascii=False) + "\n")
+            except (TypeError, ValueError) as exc:
+                _report(f"dropped event {row.get('event')!r}: {exc}")
+        return "".join(lines).encode("utf-8")
+
+    def _write_sync(self, rows: list[dict[str, Any]]) -> None:
+        data = self._encode(rows)
+        if data:
+            append_bytes(self._log_path, data, lock=self._lock)
+
+    def _collect(self, first: Any) -> tuple[list[dict[str, Any]], bool]:
+        if first is _STOP:
+            return [], True
+        rows = [first]
+        deadline = time.monotonic() + self._flush_interval
+        while len(rows) < self._flush_max_events:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return rows, True
+            rows.append(item)
+        return rows, False
+
+    def _run(self) -> None:
+        fd: int | None = None
+        rows: list[dict[str, Any]] = []
+        try:
+            fd = open_append_fd(self._log_path)
+            stopping = False
+            while not stopping:
+                rows, stopping = self._collect(self._queue.get())
+                data = self._encode(rows)
+                if data:
+                    write_appending(fd, data, lock=self._lock)
+                    if self._fsync:
+                        os.fsync(fd)
+                rows = []
+        except Exception as exc:
+            _report(f"background writer failed, falling back to synchronous writes: {exc}")
+            # Keep file order: the batch in hand and everything already queued
+            # go out before put() starts writing synchronously.
+            with self._fallback_lock:
+                self._failed = True
+                self._write_sync(rows + self._leftovers())
+        finally:
+            if fd is not None:
+                os.close(fd)
+
 
 @dataclass(slots=True)
 class SessionLogger:
@@ -11,9 +141,26 @@ class SessionLogger:
     run_id: str
     session_id: str
     log_path: Path
+    buffered: bool = False
+    flush_interval_ms: int = 200
+    flush_max_events: int = 256
+    fsync: bool = False
+    queue_size: int = 10000
+    lock: bool = False
+    _writer: _BackgroundWriter | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.buffered:
+            self._writer = _BackgroundWriter(
+                self.log_path,
+                self.flush_interval_ms,
+                self.flush_max_events,
+                self.fsync,
+                self.queue_size,
+                lock=self.lock,
+            )
 
     def _write(self, level: str, event: str, payload: dict[str, Any]) -> None:
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
         row = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": level,
@@ -23,8 +170,23 @@ class SessionLogger:
             "event": event,
             "payload": payload,
         }
-        with self.log_path.open("a", encoding="utf-8") as fp:
-            fp.write(json.dumps(row, ensure_ascii=False) + "\n")
+        writer = self._writer
+        if writer is not None:
+            writer.put(row)
+            return
+        line = json.dumps(row, ensure_ascii=False) + "\n"
+        append_bytes(self.log_path, line.encode("utf-8"), lock=self.lock)
+
+    def close(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+    def __enter__(self) -> "SessionLogger":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
 
     def info(self, event: str, payload: dict[str, Any] | None = None) -> None:
         self._write("INFO", event, payload or {})
@@ -10,6 +10,9 @@ def _bool_from_env(value: str | None, default: bool) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
 def _load_dotenv_file(path: Path) -> None:
     if not path.exists():
         return
@@ -29,11 +32,10 @@ def _load_dotenv_file(path: Path) -> None:
 
 
 def _load_dotenv() -> None:
-    cwd_dotenv = Path(".env")
-    repo_dotenv = Path(__file__).resolve().parents[2] / ".env"
-    _load_dotenv_file(repo_dotenv)
-    if cwd_dotenv.resolve() != repo_dotenv.resolve():
-        _load_dotenv_file(cwd_dotenv)
+    _load_dotenv_file(_REPO_ROOT / ".env")
+    cwd = Path.cwd()
+    if cwd != _REPO_ROOT:
+        _load_dotenv_file(cwd / ".env")
 
 
 @dataclass(slots=True)
@@ -55,6 +57,34 @@ class Settings:
     log_dir: str = "logs"
     result_dir: str = "results"
     mock_transcript_text: str | None = None
+    mock_transcript_corpus: str = ""
+    extract_workers: int = 0
+    extract_queue_size: int = 8
+    transcript_memo_path: str = ""
+    incremental_state_path: str = ""
+    log_buffered: bool = False
+    log_flush_interval_ms: int = 200
+    log_flush_max_events: int = 256
+    log_fsync: bool = False
+    result_index_path: str = ""
+    multi_writer_lock: bool = False
+    trace: bool = False
+    metrics_textfile_path: str = ""
+    metrics_interval_s: int = 60
+    run_deadline: str = ""
+    video_timeout_s: int = 90
+    transient_retries: int = 2
+    retry_backoff_ms: int = 500
+    hedge_enabled: bool = False
+    hedge_percentile: int = 95
+    hedge_max_extra: int = 20
+    hedge_proxy_url: str = ""
+    warning_format: str = "full"
+    transcript_probe: bool = False
+    channel_language_memo_path: str = ""
+    cassette_mode: str = ""
+    cassette_path: str = ""
+    cassette_replay_speed: float = 1.0
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -94,6 +124,34 @@ class Settings:
             log_dir=common_log_dir or specific_log_dir or "logs",
             result_dir=common_result_dir or specific_result_dir or "results",
             mock_transcript_text=os.getenv("EYT_HEADLINE_MOCK_TRANSCRIPT_TEXT") or None,
+            mock_transcript_corpus=os.getenv("EYT_HEADLINE_MOCK_TRANSCRIPT_CORPUS", ""),
+            extract_workers=min(64, max(0, int(os.getenv("EYT_HEADLINE_EXTRACT_WORKERS", "0")))),
+            extract_queue_size=max(1, int(os.getenv("EYT_HEADLINE_EXTRACT_QUEUE_SIZE", "8"))),
+            transcript_memo_path=os.getenv("EYT_HEADLINE_TRANSCRIPT_MEMO_PATH", ""),
+            incremental_state_path=os.getenv("EYT_HEADLINE_INCREMENTAL_STATE_PATH", ""),
+            log_buffered=_bool_from_env(os.getenv("EYT_HEADLINE_LOG_BUFFERED"), False),
+            log_flush_interval_ms=max(0, int(os.getenv("EYT_HEADLINE_LOG_FLUSH_INTERVAL_MS", "200"))),
+            log_flush_max_events=max(1, int(os.getenv("EYT_HEADLINE_LOG_FLUSH_MAX_EVENTS", "256"))),
+            log_fsync=_bool_from_env(os.getenv("EYT_HEADLINE_LOG_FSYNC"), False),
+            result_index_path=os.getenv("EYT_HEADLINE_RESULT_INDEX_PATH", ""),
+            multi_writer_lock=_bool_from_env(os.getenv("EYT_HEADLINE_MULTI_WRITER_LOCK"), False),
+            trace=_bool_from_env(os.getenv("EYT_HEADLINE_TRACE"), False),
+            metrics_textfile_path=os.getenv("EYT_HEADLINE_METRICS_TEXTFILE", ""),
+            metrics_interval_s=max(0, int(os.getenv("EYT_HEADLINE_METRICS_INTERVAL_S", "60"))),
+            run_deadline=os.getenv("EYT_HEADLINE_RUN_DEADLINE", ""),
+            video_timeout_s=max(0, int(os.getenv("EYT_HEADLINE_VIDEO_TIMEOUT_S", "90"))),
+            transient_retries=max(0, int(os.getenv("EYT_HEADLINE_TRANSIENT_RETRIES", "2"))),
+            retry_backoff_ms=max(0, int(os.getenv("EYT_HEADLINE_RETRY_BACKOFF_MS", "500"))),
+            hedge_enabled=_bool_from_env(os.getenv("EYT_HEADLINE_HEDGE"), False),
+            hedge_percentile=min(99, max(50, int(os.getenv("EYT_HEADLINE_HEDGE_PERCENTILE", "95")))),
+            hedge_max_extra=max(0, int(os.getenv("EYT_HEADLINE_HEDGE_MAX_EXTRA", "20"))),
+            hedge_proxy_url=os.getenv("EYT_HEADLINE_HEDGE_PROXY_URL", ""),
+            warning_format=os.getenv("EYT_HEADLINE_WARNING_FORMAT", "full").strip().lower(),
+            transcript_probe=_bool_from_env(os.getenv("EYT_HEADLINE_TRANSCRIPT_PROBE"), False),
+            channel_language_memo_path=os.getenv("EYT_HEADLINE_CHANNEL_LANGUAGE_MEMO_PATH", ""),
+            cassette_mode=os.getenv("EYT_HEADLINE_CASSETTE_MODE", "").strip().lower(),
+            cassette_path=os.getenv("EYT_HEADLINE_CASSETTE_PATH", ""),
+            cassette_replay_speed=max(0.0, float(os.getenv("EYT_HEADLINE_CASSETTE_REPLAY_SPEED", "1.0"))),
         )
 
     def languages(self) -> list[str]:
@@ -1,4 +1,5 @@
 from economic_youtube_headline_skill.models import PartialInfo, ProcessingStatus
+from economic_youtube_headline_skill.warning_codes import warning
 
 
 def classify_transcript_state(
@@ -13,13 +14,13 @@ def classify_transcript_state(
 
     if not transcript:
         if was_live:
-            warnings.append("Ended live video detected but transcript is unavailable.")
+            warnings.append(warning("live_transcript_pending"))
             return (
                 ProcessingStatus.ENDED_LIVE,
                 PartialInfo(is_partial=True, reason="live_ended_transcript_pending"),
                 warnings,
             )
-        warnings.append("Transcript is unavailable.")
+        warnings.append(warning("transcript_unavailable"))
         return ProcessingStatus.UNAVAILABLE, PartialInfo(is_partial=False), warnings
 
     length = len(transcript)
@@ -27,9 +28,9 @@ def classify_transcript_state(
         ratio = round(length / float(min_transcript_chars), 3)
         reason = "below_min_chars"
         if not allow_partial:
-            warnings.append("Partial transcript detected but partial mode is disabled.")
+            warnings.append(warning("partial_disabled"))
         else:
-            warnings.append("Partial transcript detected.")
+            warnings.append(warning("partial_transcript"))
         return (
             ProcessingStatus.PARTIAL,
             PartialInfo(is_partial=True, coverage_ratio=ratio, reason=reason),
@@ -0,0 +1,78 @@
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Iterable, Iterator
+
+_CURRENT_SPANS: ContextVar[dict[str, float] | None] = ContextVar("eyt_trace_spans", default=None)
+_NOOP = nullcontext()
+
+
+class _Span:
+    __slots__ = ("_spans", "_name", "_started")
+
+    def __init__(self, spans: dict[str, float], name: str) -> None:
+        self._spans = spans
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        self._spans[self._name] = round(self._spans.get(self._name, 0.0) + elapsed_ms, 3)
+
+
+def span(name: str) -> ContextManager[None]:
+    spans = _CURRENT_SPANS.get()
+    return _NOOP if spans is None else _Span(spans, name)
+
+
+def record(name: str, elapsed_ms: float) -> None:
+    spans = _CURRENT_SPANS.get()
+    if spans is not None:
+        spans[name] = round(spans.get(name, 0.0) + elapsed_ms, 3)
+
+
+@contextmanager
+def collect_spans(enabled: bool = True) -> Iterator[dict[str, float] | None]:
+    if not enabled:
+        yield None
+        return
+    spans: dict[str, float] = {}
+    token = _CURRENT_SPANS.set(spans)
+    try:
+        yield spans
+    finally:
+        _CURRENT_SPANS.reset(token)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def stage_stats(log_rows: Iterable[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    samples: dict[str, list[float]] = {}
+    for row in log_rows:
+        spans = (row.get("payload") or {}).get("spans_ms")
+        if not isinstance(spans, dict):
+            continue
+        for stage, value in spans.items():
+            if isinstance(value, (int, float)):
+                samples.setdefault(stage, []).append(float(value))
+
+    stats: dict[str, dict[str, float]] = {}
+    for stage, values in sorted(samples.items()):
+        values.sort()
+        stats[stage] = {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+        }
+    return stats
@@ -0,0 +1,168 @@
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from economic_youtube_headline_skill.models import PartialInfo, ProcessingStatus
+from economic_youtube_headline_skill.processor import ExtractionState
+from economic_youtube_headline_skill.state_files import atomic_write_json, load_json_object
+from economic_youtube_headline_skill.warning_codes import intern_warning
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def transcript_hash(transcript: str) -> str:
+    normalized = _WHITESPACE_RE.sub(" ", transcript).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _raw_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class MemoEntry:
+    video_id: str
+    status: ProcessingStatus
+    partial: PartialInfo
+    warnings: list[str]
+    headlines: list[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "video_id": self.video_id,
+            "status": self.status.value,
+            "partial": {
+                "is_partial": self.partial.is_partial,
+                "coverage_ratio": self.partial.coverage_ratio,
+                "reason": self.partial.reason,
+            },
+            "warnings": list(self.warnings),
+            "headlines": list(self.headlines),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "MemoEntry":
+        partial = payload.get("partial") or {}
+        return cls(
+            video_id=str(payload["video_id"]),
+            status=ProcessingStatus(payload["status"]),
+            partial=PartialInfo(
+                is_partial=bool(partial.get("is_partial", False)),
+                coverage_ratio=partial.get("coverage_ratio"),
+                reason=partial.get("reason"),
+            ),
+            warnings=[intern_warning(str(item)) for item in payload.get("warnings", [])],
+            headlines=[str(item) for item in payload.get("headlines", [])],
+        )
+
+
+@dataclass(slots=True)
+class TranscriptMemo:
+    path: Path | None = None
+    max_entries: int = 10000
+    entries: dict[str, MemoEntry] = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def load(cls, path: str | Path | None, max_entries: int = 10000) -> "TranscriptMemo":
+        if not path:
+            return cls(max_entries=max_entries)
+        memo = cls(path=Path(path), max_entries=max_entries)
+        for key, payload in load_json_object(memo.path).items():
+            try:
+                memo.entries[key] = MemoEntry.from_dict(payload)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return memo
+
+    def get(self, key: str) -> MemoEntry | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, entry: MemoEntry) -> None:
+        self.entries.pop(key, None)
+        self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.pop(next(iter(self.entries)))
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        atomic_write_json(self.path, {key: entry.to_dict() for key, entry in self.entries.items()})
+        self.dirty = False
+
+
+@dataclass(slots=True)
+class VideoProgress:
+    transcript_chars: int
+    transcript_sha256: str
+    max_headlines: int
+    extraction: ExtractionState
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "transcript_chars": self.transcript_chars,
+            "transcript_sha256": self.transcript_sha256,
+            "max_headlines": self.max_headlines,
+            "headlines": list(self.extraction.headlines),
+            "consumed_chars": self.extraction.consumed_chars,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "VideoProgress":
+        return cls(
+            transcript_chars=int(payload["transcript_chars"]),
+            transcript_sha256=str(payload["transcript_sha256"]),
+            max_headlines=int(payload["max_headlines"]),
+            extraction=ExtractionState(
+                headlines=[str(item) for item in payload.get("headlines", [])],
+                consumed_chars=int(payload.get("consumed_chars", 0)),
+            ),
+        )
+
+    @classmethod
+    def capture(cls, transcript: str, max_headlines: int, extraction: ExtractionState) -> "VideoProgress":
+        return cls(len(transcript), _raw_hash(transcript), max_headlines, extraction)
+
+    def resumable_for(self, transcript: str, max_headlines: int) -> bool:
+        if max_headlines != self.max_headlines or len(transcript) < self.transcript_chars:
+            return False
+        return _raw_hash(transcript[: self.transcript_chars]) == self.transcript_sha256
+
+
+@dataclass(slots=True)
+class ProgressStore:
+    path: Path | None = None
+    max_entries: int = 10000
+    entries: dict[str, VideoProgress] = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def load(cls, path: str | Path | None, max_entries: int = 10000) -> "ProgressStore":
+        if not path:
+            return cls(max_entries=max_entries)
+        store = cls(path=Path(path), max_entries=max_entries)
+        for video_id, payload in load_json_object(store.path).items():
+            try:
+                store.entries[video_id] = VideoProgress.from_dict(payload)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return store
+
+    def get(self, video_id: str) -> VideoProgress | None:
+        return self.entries.get(video_id)
+
+    def put(self, video_id: str, progress: VideoProgress) -> None:
+        self.entries.pop(video_id, None)
+        self.entries[video_id] = progress
+        while len(self.entries) > self.max_entries:
+            self.entries.pop(next(iter(self.entries)))
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        atomic_write_json(self.path, {key: item.to_dict() for key, item in self.entries.items()})
+        self.dirty = False
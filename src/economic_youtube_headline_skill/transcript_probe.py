@@ -0,0 +1,217 @@
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from economic_youtube_headline_skill.metrics import TRANSCRIPT_PROBES
+from economic_youtube_headline_skill.state_files import atomic_write_json, load_json_object
+from economic_youtube_headline_skill.youtube import TracksSkipped, _transcript_segments_to_text
+
+# A track that has failed this many times for a channel without ever
+# succeeding is skipped, except for every RECHECK_EVERY-th skip.
+DOOMED_AFTER = 3
+RECHECK_EVERY = 10
+
+
+def track_label(transcript: Any) -> str:
+    return f"{'auto' if transcript.is_generated else 'manual'}:{transcript.language_code}"
+
+
+@dataclass(slots=True)
+class TrackStats:
+    seen: int = 0
+    tried: int = 0
+    ok: int = 0
+    skipped: int = 0
+
+    def admit(self) -> bool:
+        if self.ok or self.tried < DOOMED_AFTER:
+            return True
+        self.skipped += 1
+        return self.skipped % RECHECK_EVERY == 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"seen": self.seen, "tried": self.tried, "ok": self.ok, "skipped": self.skipped}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "TrackStats":
+        return cls(
+            seen=int(payload.get("seen", 0)),
+            tried=int(payload.get("tried", 0)),
+            ok=int(payload.get("ok", 0)),
+            skipped=int(payload.get("skipped", 0)),
+        )
+
+
+@dataclass(slots=True)
+class ChannelLanguageMemo:
+    path: Path | None = None
+    max_entries: int = 10000
+    entries: dict[str, dict[str, TrackStats]] = field(default_factory=dict)
+    dirty: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: str | Path | None, max_entries: int = 10000) -> "ChannelLanguageMemo":
+        if not path:
+            return cls(max_entries=max_entries)
+        memo = cls(path=Path(path), max_entries=max_entries)
+        for channel_id, tracks in load_json_object(memo.path).items():
+            try:
+                memo.entries[channel_id] = {label: TrackStats.from_dict(item) for label, item in tracks.items()}
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return memo
+
+    def _tracks(self, channel_id: str) -> dict[str, TrackStats]:
+        tracks = self.entries.pop(channel_id, None) or {}
+        self.entries[channel_id] = tracks
+        while len(self.entries) > self.max_entries:
+            self.entries.pop(next(iter(self.entries)))
+        self.dirty = True
+        return tracks
+
+    def observe(self, channel_id: str, labels: list[str]) -> None:
+        with self._lock:
+            tracks = self._tracks(channel_id)
+            for label in labels:
+                tracks.setdefault(label, TrackStats()).seen += 1
+
+    def order(self, channel_id: str, candidates: list[Any]) -> list[Any]:
+        # Stable, so tracks the channel has never delivered keep the
+        # requested-language order (manual before auto per language).
+        with self._lock:
+            tracks = self.entries.get(channel_id, {})
+            return sorted(candidates, key=lambda item: -tracks.get(track_label(item), TrackStats()).ok)
+
+    def admit(self, channel_id: str, label: str) -> bool:
+        with self._lock:
+            stats = self.entries.get(channel_id, {}).get(label)
+            if stats is None:
+                return True
+            self.dirty = True
+            return stats.admit()
+
+    def record(self, channel_id: str, label: str, ok: bool) -> None:
+        with self._lock:
+            stats = self._tracks(channel_id).setdefault(label, TrackStats())
+            stats.tried += 1
+            stats.ok += int(ok)
+
+    def save(self) -> None:
+        with self._lock:
+            if self.path is None or not self.dirty:
+                return
+            payload = {
+                channel_id: {label: stats.to_dict() for label, stats in tracks.items()}
+                for channel_id, tracks in self.entries.items()
+            }
+            self.dirty = False
+        atomic_write_json(self.path, payload)
+
+
+class TranscriptProber:
+    # One instance per run. The innertube key found in the first watch page is
+    # reused, so later probes are a single player request instead of a watch
+    # page download plus the player request.
+    def __init__(self, memo: ChannelLanguageMemo | None = None) -> None:
+        self.memo = memo if memo is not None else ChannelLanguageMemo()
+        self._api_key: str | None = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _player_data(self, fetcher: Any, video_id: str) -> dict[str, Any]:
+        from youtube_transcript_api import YouTubeRequestFailed
+
+        with self._lock:
+            api_key = self._api_key
+        if api_key is not None:
+            try:
+                data = fetcher._fetch_innertube_data(video_id, api_key)
+                TRANSCRIPT_PROBES.inc(outcome="player_only")
+                return data
+            except YouTubeRequestFailed:
+                # Rotated or rejected key: learn it again from the watch page.
+                with self._lock:
+                    self._api_key = None
+        html = fetcher._fetch_video_html(video_id)
+        api_key = fetcher._extract_innertube_api_key(html, video_id)
+        with self._lock:
+            self._api_key = api_key
+        TRANSCRIPT_PROBES.inc(outcome="watch_page")
+        return fetcher._fetch_innertube_data(video_id, api_key)
+
+    def _captions(self, fetcher: Any, video_id: str) -> tuple[dict[str, Any], str]:
+        from youtube_transcript_api import RequestBlocked
+
+        data = self._player_data(fetcher, video_id)
+        channel_id = str((data.get("videoDetails") or {}).get("channelId") or "")
+        try:
+            return fetcher._extract_captions_json(data, video_id), channel_id
+        except RequestBlocked as exc:
+            proxy_config = fetcher._proxy_config
+            if proxy_config is None or proxy_config.retries_when_blocked <= 0:
+                raise exc.with_proxy_config(proxy_config)
+            # The library's own path rotates proxy IPs while blocked.
+            return fetcher._fetch_captions_json(video_id), channel_id
+
+    def fetch(self, api: Any, video_id: str, languages: list[str]) -> str | None:
+        if not self._disabled:
+            try:
+                return self._probe(api, video_id, languages)
+            except (AttributeError, TypeError):
+                # The probe relies on youtube-transcript-api internals; if a
+                # release renames or reshapes them, use the public path for
+                # the rest of the run.
+                self._disabled = True
+                TRANSCRIPT_PROBES.inc(outcome="fallback")
+        return _transcript_segments_to_text(api.fetch(video_id, languages=languages))
+
+    def _probe(self, api: Any, video_id: str, languages: list[str]) -> str | None:
+        from youtube_transcript_api import NoTranscriptFound, PoTokenRequired, TranscriptList, TranscriptsDisabled
+
+        fetcher = api._fetcher
+        try:
+            captions, channel_id = self._captions(fetcher, video_id)
+        except TranscriptsDisabled:
+            TRANSCRIPT_PROBES.inc(outcome="no_tracks")
+            raise
+        transcripts = TranscriptList.build(fetcher._http_client, video_id, captions)
+        available = list(transcripts)
+        if channel_id:
+            self.memo.observe(channel_id, [track_label(item) for item in available])
+
+        by_label = {track_label(item): item for item in available}
+        candidates = [
+            by_label[label]
+            for code in languages
+            for label in (f"manual:{code}", f"auto:{code}")
+            if label in by_label
+        ]
+        if not candidates:
+            # The timedtext download would fail anyway; stop after the probe.
+            TRANSCRIPT_PROBES.inc(outcome="no_match")
+            raise NoTranscriptFound(video_id, languages, transcripts)
+
+        failure: Exception | None = None
+        skipped: list[str] = []
+        for transcript in self.memo.order(channel_id, candidates) if channel_id else candidates:
+            label = track_label(transcript)
+            if channel_id and not self.memo.admit(channel_id, label):
+                TRANSCRIPT_PROBES.inc(outcome="doomed_skip")
+                skipped.append(label)
+                continue
+            try:
+                text = _transcript_segments_to_text(transcript.fetch())
+            except PoTokenRequired as exc:
+                text, failure = None, exc
+            if channel_id:
+                self.memo.record(channel_id, label, bool(text))
+            if text:
+                return text
+            TRANSCRIPT_PROBES.inc(outcome="track_failed")
+        if failure is not None:
+            raise failure
+        if len(skipped) == len(candidates):
+            raise TracksSkipped(video_id, skipped)
+        return None
@@ -0,0 +1,67 @@
+import gzip
+import io
+import sys
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from economic_youtube_headline_skill.youtube import _VIDEO_ID_FAST_RE, parse_video_id
+
+_GZIP_MAGIC = b"\x1f\x8b"
+BATCH_SIZE = 4096
+
+
+def _open_text(path: str, stack: ExitStack) -> TextIO:
+    if path == "-":
+        buffer = getattr(sys.stdin, "buffer", None)
+        if buffer is None:
+            return sys.stdin
+        raw: io.BufferedIOBase = buffer
+    else:
+        raw = stack.enter_context(Path(path).open("rb"))
+    if raw.peek(2)[:2] == _GZIP_MAGIC:  # type: ignore[attr-defined]
+        # GzipFile leaves a passed-in fileobj open; the stack closes it.
+        raw = gzip.GzipFile(fileobj=raw)  # type: ignore[assignment]
+    return io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+
+
+def iter_input_lines(path: str) -> Iterator[str]:
+    # `-` reads stdin; gzip input is detected from its magic bytes, not the name.
+    with ExitStack() as stack:
+        stream = _open_text(path, stack)
+        try:
+            for raw_line in stream:
+                line = raw_line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+        finally:
+            if path != "-":
+                stream.close()
+            elif stream is not sys.stdin:
+                # Closing the wrapper would close the process's stdin with it.
+                stream.detach()
+
+
+def _id_key(url: str) -> int | str:
+    match = _VIDEO_ID_FAST_RE.match(url)
+    if match:
+        video_id = match.group(1)
+    else:
+        try:
+            video_id = parse_video_id(url)
+        except ValueError:
+            # Left in so the pipeline records it as an error result.
+            return url
+    # An 88-bit int takes about two thirds of the memory of the 11-char str.
+    return int.from_bytes(video_id.encode("ascii"), "big")
+
+
+def dedupe_video_urls(urls: Iterable[str], batch_size: int = BATCH_SIZE) -> Iterator[str]:
+    seen: set[int | str] = set()
+    iterator = iter(urls)
+    while batch := list(islice(iterator, batch_size)):
+        for url, key in zip(batch, [_id_key(url) for url in batch]):
+            if key not in seen:
+                seen.add(key)
+                yield url
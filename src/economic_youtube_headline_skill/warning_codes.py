@@ -0,0 +1,105 @@
+import sys
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class WarningSpec:
+    code: str
+    template: str
+    short: str | None = None
+
+
+_SPECS = (
+    WarningSpec("transcript_unavailable", "Transcript is unavailable."),
+    WarningSpec("live_transcript_pending", "Ended live video detected but transcript is unavailable."),
+    WarningSpec("partial_transcript", "Partial transcript detected."),
+    WarningSpec("partial_disabled", "Partial transcript detected but partial mode is disabled."),
+    WarningSpec("transcript_fetch_failed", "Transcript fetch failed: {error}"),
+    WarningSpec(
+        "transcript_blocked",
+        "YouTube transcript requests appear blocked/rate-limited. Configure proxy env vars: "
+        "EYT_HEADLINE_WEBSHARE_PROXY_USERNAME/EYT_HEADLINE_WEBSHARE_PROXY_PASSWORD "
+        "(optional EYT_HEADLINE_WEBSHARE_PROXY_LOCATIONS, "
+        "EYT_HEADLINE_WEBSHARE_RETRIES_WHEN_BLOCKED) or "
+        "EYT_HEADLINE_PROXY_HTTP_URL/EYT_HEADLINE_PROXY_HTTPS_URL.",
+        "YouTube transcript requests appear blocked/rate-limited (see warning_catalog).",
+    ),
+    WarningSpec(
+        "ssl_fallback_used",
+        "Transcript fetch SSL verification failed; retrying with insecure SSL fallback (verify=False).",
+    ),
+    WarningSpec(
+        "ssl_fallback_disabled",
+        "Transcript fetch failed due to SSL verification error (fallback disabled): {error}",
+    ),
+    WarningSpec("ssl_fallback_failed", "Transcript fetch failed after insecure SSL fallback: {error}"),
+    WarningSpec("transcript_fetch_retried", "Transcript fetch succeeded after {retries}."),
+    WarningSpec(
+        "transcript_memo_skipped",
+        "Transcript fetch skipped: every matching track has kept failing for this channel ({tracks}).",
+    ),
+    WarningSpec("transcript_fetch_timeout", "Transcript fetch timed out after {seconds}s."),
+    WarningSpec("deadline_skipped", "Skipped: run deadline reached before the transcript fetch started."),
+    WarningSpec("processing_failed", "Processing failed: {error}"),
+)
+SPECS = {spec.code: spec for spec in _SPECS}
+UNKNOWN_CODE = "other"
+
+# Parameterless messages are interned so every result shares one object,
+# including results read back from daily files.
+_STATIC = {spec.template: sys.intern(spec.template) for spec in _SPECS if "{" not in spec.template}
+_STATIC_SPECS = {spec.template: spec for spec in _SPECS if "{" not in spec.template}
+_PREFIXES = sorted(
+    ((spec.template.split("{", 1)[0], spec) for spec in _SPECS if "{" in spec.template),
+    key=lambda item: -len(item[0]),
+)
+
+
+def warning(code: str, **params: object) -> str:
+    spec = SPECS[code]
+    if not params:
+        return _STATIC[spec.template]
+    return spec.template.format(**params)
+
+
+def intern_warning(text: str) -> str:
+    return _STATIC.get(text, text)
+
+
+def spec_for(text: str) -> WarningSpec | None:
+    spec = _STATIC_SPECS.get(text)
+    if spec is not None:
+        return spec
+    for prefix, candidate in _PREFIXES:
+        if text.startswith(prefix):
+            return candidate
+    return None
+
+
+def compact_warnings(warnings: Iterable[str]) -> tuple[list[str], list[str]]:
+    messages: list[str] = []
+    codes: list[str] = []
+    for text in warnings:
+        spec = spec_for(text)
+        codes.append(spec.code if spec else UNKNOWN_CODE)
+        messages.append(spec.short if spec and spec.short else text)
+    return messages, codes
+
+
+def expand_warnings(messages: Iterable[str], codes: Iterable[str]) -> list[str]:
+    expanded: list[str] = []
+    for text, code in zip(messages, codes):
+        spec = SPECS.get(code)
+        expanded.append(_STATIC[spec.template] if spec and spec.short == text else intern_warning(text))
+    return expanded
+
+
+def warning_catalog(warning_lists: Iterable[Iterable[str]]) -> dict[str, str]:
+    catalog: dict[str, str] = {}
+    for warnings in warning_lists:
+        for text in warnings:
+            spec = spec_for(text)
+            if spec is not None and spec.short:
+                catalog[spec.code] = spec.template
+    return catalog
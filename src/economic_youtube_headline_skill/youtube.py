@@ -1,25 +1,76 @@
+import contextvars
+import queue
+import random
 import re
-import ssl
-from typing import Any, Callable
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import parse_qs, quote_plus, urlparse
-from urllib.request import Request, urlopen
 
+from economic_youtube_headline_skill.bandwidth import (
+    ACCEPT_ENCODING,
+    LEDGER,
+    account_response,
+    read_decoded,
+    urllib_proxy,
+)
+from economic_youtube_headline_skill.metrics import (
+    HTTP_REQUESTS,
+    HTTP_RESPONSE_BYTES,
+    TRANSCRIPT_CHARS,
+    TRANSCRIPT_FETCH_SECONDS,
+    TRANSCRIPT_FETCHES,
+    TRANSCRIPT_RETRIES,
+    TRANSCRIPT_SSL_FALLBACKS,
+)
+from economic_youtube_headline_skill.scheduling import interleave_channels
+from economic_youtube_headline_skill.tracing import span
+from economic_youtube_headline_skill.warning_codes import warning
+
+if TYPE_CHECKING:
+    import ssl
+    from urllib.request import Request
 
 _YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+# Canonical watch/live/shorts/embed/youtu.be URLs; anything else takes the
+# urlparse path below, which this must agree with. A query value ends at
+# `&`/`#` only, while a path segment may also be followed by `/` or `?`.
+_VIDEO_ID_FAST_RE = re.compile(
+    r"https?://(?:(?:www\.|m\.)?youtube\.com/"
+    r"(?:watch\?v=(?=[A-Za-z0-9_-]{11}(?:$|[&#]))|(?:live|shorts|embed)/(?=[A-Za-z0-9_-]{11}(?:$|[/?&#])))"
+    r"|youtu\.be/(?=[A-Za-z0-9_-]{11}(?:$|[/?&#])))"
+    r"([A-Za-z0-9_-]{11})(?![^#]*[?&]v=)"
+)
 _CHANNEL_ID_RE = re.compile(r"^UC[A-Za-z0-9_-]{22}$")
 _HANDLE_RE = re.compile(r"^@[A-Za-z0-9._-]{3,30}$")
 _CHANNEL_ID_IN_HTML_RE = re.compile(r'"channelId":"(UC[A-Za-z0-9_-]{22})"')
 _VIDEO_ID_IN_FEED_RE = re.compile(r"<yt:videoId>([A-Za-z0-9_-]{11})</yt:videoId>")
-_BLOCKED_TRANSCRIPT_WARNING = (
-    "YouTube transcript requests appear blocked/rate-limited. Configure proxy env vars: "
-    "EYT_HEADLINE_WEBSHARE_PROXY_USERNAME/EYT_HEADLINE_WEBSHARE_PROXY_PASSWORD "
-    "(optional EYT_HEADLINE_WEBSHARE_PROXY_LOCATIONS, "
-    "EYT_HEADLINE_WEBSHARE_RETRIES_WHEN_BLOCKED) or "
-    "EYT_HEADLINE_PROXY_HTTP_URL/EYT_HEADLINE_PROXY_HTTPS_URL."
-)
+_PUBLISHED_IN_FEED_RE = re.compile(r"<published>([^<]+)</published>")
+_SERVER_ERROR_RE = re.compile(r"\b5\d\d (?:server error|service unavailable|bad gateway|gateway time-?out)", re.IGNORECASE)
+_TRANSIENT_ERROR_NAMES = {
+    "Timeout",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "ConnectionError",
+    "ChunkedEncodingError",
+    "ProtocolError",
+    "ProxyError",
+    "RemoteDisconnected",
+    "IncompleteRead",
+}
+_BLOCKED_TRANSCRIPT_WARNING = warning("transcript_blocked")
+
+
+class TracksSkipped(LookupError):
+    def __init__(self, video_id: str, tracks: list[str]) -> None:
+        super().__init__(f"Every matching track for {video_id} was skipped by the channel language memo: {tracks}")
+        self.tracks = tracks
 
 
 def parse_video_id(url: str) -> str:
+    fast = _VIDEO_ID_FAST_RE.match(url)
+    if fast:
+        return fast.group(1)
     parsed = urlparse(url)
     if parsed.hostname in {"youtu.be"}:
         video_id = parsed.path.lstrip("/")
@@ -43,18 +94,33 @@ def infer_was_live(url: str) -> bool:
     return "/live/" in lowered or "live_stream" in lowered
 
 
+def _read_text_body(request: "Request", timeout: int, context: "ssl.SSLContext | None" = None) -> bytes:
+    from urllib.request import urlopen
+
+    with urlopen(request, timeout=timeout, context=context) as response:  # noqa: S310
+        wire, body = read_decoded(response, response.headers.get("Content-Encoding"))
+    LEDGER.record(request.full_url, urllib_proxy(request.full_url), wire, len(body))
+    return body
+
+
 def _fetch_text(url: str, timeout: int = 15) -> str | None:
-    request = Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    import ssl
+    from urllib.request import Request
+
+    request = Request(url, headers={"User-Agent": "Mozilla/5.0", "Accept-Encoding": ACCEPT_ENCODING})
     try:
-        with urlopen(request, timeout=timeout) as response:  # noqa: S310
-            return response.read().decode("utf-8", errors="ignore")
+        body = _read_text_body(request, timeout)
+        outcome = "ok"
     except Exception:
         try:
-            insecure_context = ssl._create_unverified_context()
-            with urlopen(request, timeout=timeout, context=insecure_context) as response:  # noqa: S310
-                return response.read().decode("utf-8", errors="ignore")
+            body = _read_text_body(request, timeout, ssl._create_unverified_context())
+            outcome = "ok_insecure"
         except Exception:
+            HTTP_REQUESTS.inc(outcome="error")
             return None
+    HTTP_REQUESTS.inc(outcome=outcome)
+    HTTP_RESPONSE_BYTES.inc(len(body))
+    return body.decode("utf-8", errors="ignore")
 
 
 def _extract_channel_id_from_html(html: str | None) -> str | None:
@@ -113,28 +179,39 @@ def _resolve_channel_id_with_reason(
     return None, "could not resolve channel id"
 
 
-def _list_upload_video_urls_with_reason(
+def _list_upload_entries_with_reason(
     channel_id: str,
     limit_per_channel: int,
     fetch_text: Callable[[str], str | None] = _fetch_text,
-) -> tuple[list[str], str | None]:
+) -> tuple[list[tuple[str, str | None]], str | None]:
     feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
     xml = fetch_text(feed_url)
     if not xml:
         return [], "no uploads feed"
 
-    urls: list[str] = []
+    entries: list[tuple[str, str | None]] = []
     seen: set[str] = set()
-    for video_id in _VIDEO_ID_IN_FEED_RE.findall(xml):
-        if video_id in seen:
-            continue
-        seen.add(video_id)
-        urls.append(f"https://www.youtube.com/watch?v={video_id}")
-        if len(urls) >= limit_per_channel:
-            break
-    if not urls:
+    for chunk in xml.split("<entry>")[1:] or [xml]:
+        for video_id in _VIDEO_ID_IN_FEED_RE.findall(chunk):
+            if video_id in seen:
+                continue
+            seen.add(video_id)
+            published = _PUBLISHED_IN_FEED_RE.search(chunk)
+            entries.append((f"https://www.youtube.com/watch?v={video_id}", published.group(1) if published else None))
+            if len(entries) >= limit_per_channel:
+                return entries, None
+    if not entries:
         return [], "no videos in uploads feed"
-    return urls, None
+    return entries, None
+
+
+def _list_upload_video_urls_with_reason(
+    channel_id: str,
+    limit_per_channel: int,
+    fetch_text: Callable[[str], str | None] = _fetch_text,
+) -> tuple[list[str], str | None]:
+    entries, reason = _list_upload_entries_with_reason(channel_id, limit_per_channel, fetch_text=fetch_text)
+    return [url for url, _ in entries], reason
 
 
 def list_upload_video_urls(
@@ -146,33 +223,43 @@ def list_upload_video_urls(
     return urls
 
 
+def _collect_channel_entries(
+    token: str,
+    limit_per_channel: int,
+    fetch_text: Callable[[str], str | None],
+) -> tuple[list[tuple[str, str | None]], str | None]:
+    with span("channel_resolve"):
+        channel_id, resolve_reason = _resolve_channel_id_with_reason(token, fetch_text=fetch_text)
+    if not channel_id:
+        return [], f"Channel token '{token}': {resolve_reason or 'could not resolve channel id'}."
+    with span("feed_download"):
+        entries, uploads_reason = _list_upload_entries_with_reason(
+            channel_id,
+            limit_per_channel,
+            fetch_text=fetch_text,
+        )
+    if not entries:
+        return [], f"Channel token '{token}' (channel_id={channel_id}): {uploads_reason or 'no uploads feed'}."
+    return entries, None
+
+
 def collect_video_urls_from_channels(
     channel_tokens: list[str],
     limit_per_channel: int,
-    fetch_text: Callable[[str], str | None] = _fetch_text,
+    fetch_text: Callable[[str], str | None] | None = None,
 ) -> tuple[list[str], list[str]]:
-    collected: list[str] = []
+    fetch_text = fetch_text or _fetch_text
+    collected: list[list[tuple[str, str | None]]] = []
     warnings: list[str] = []
 
     for token in channel_tokens:
-        channel_id, resolve_reason = _resolve_channel_id_with_reason(token, fetch_text=fetch_text)
-        if not channel_id:
-            warnings.append(f"Channel token '{token}': {resolve_reason or 'could not resolve channel id'}.")
-            continue
-        urls, uploads_reason = _list_upload_video_urls_with_reason(
-            channel_id,
-            limit_per_channel,
-            fetch_text=fetch_text,
-        )
-        if not urls:
-            warnings.append(
-                f"Channel token '{token}' (channel_id={channel_id}): {uploads_reason or 'no uploads feed'}."
-            )
-            continue
-        collected.extend(urls)
+        entries, reason = _collect_channel_entries(token, limit_per_channel, fetch_text)
+        if reason:
+            warnings.append(reason)
+        else:
+            collected.append(entries)
 
-    deduped = list(dict.fromkeys(collected))
-    return deduped, warnings
+    return interleave_channels(collected), warnings
 
 
 def _short_exception_message(exc: Exception, max_len: int = 200) -> str:
@@ -225,6 +312,29 @@ def _is_blocked_request_error(exc: Exception) -> bool:
     return False
 
 
+def _is_transient_error(exc: Exception) -> bool:
+    # Blocks and certificate failures have their own handling; retrying them
+    # here would only burn proxy bandwidth.
+    if _is_blocked_request_error(exc) or _is_ssl_verification_error(exc):
+        return False
+    current: Exception | None = exc
+    seen: set[int] = set()
+    while current and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (TimeoutError, ConnectionError)):
+            return True
+        if current.__class__.__name__ in _TRANSIENT_ERROR_NAMES:
+            return True
+        status_code = getattr(getattr(current, "response", None), "status_code", None)
+        if isinstance(status_code, int) and status_code >= 500:
+            return True
+        if _SERVER_ERROR_RE.search(str(current)):
+            return True
+        next_exc = current.__cause__ or current.__context__
+        current = next_exc if isinstance(next_exc, Exception) else None
+    return False
+
+
 def build_proxy_config(
     proxy_http_url: str | None = None,
     proxy_https_url: str | None = None,
@@ -277,26 +387,104 @@ def _fetch_transcript_default(
     video_id: str,
     languages: list[str],
     proxy_config: Any | None = None,
+    http_client: Any | None = None,
+    prober: Any | None = None,
 ) -> str | None:
+    import requests
     from youtube_transcript_api import YouTubeTranscriptApi
 
-    segments = YouTubeTranscriptApi(proxy_config=proxy_config).fetch(video_id, languages=languages)
-    return _transcript_segments_to_text(segments)
+    http_client = requests.Session() if http_client is None else http_client
+    if account_response not in http_client.hooks["response"]:
+        http_client.hooks["response"].append(account_response)
+    api = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=http_client)
+    if prober is not None:
+        return prober.fetch(api, video_id, languages)
+    return _transcript_segments_to_text(api.fetch(video_id, languages=languages))
+
+
+def _derived_session(base_client: Any | None = None) -> Any:
+    import requests
+
+    # Only the adapters of a caller's client are borrowed, so per-attempt
+    # settings (timeouts, proxies mounted by YouTubeTranscriptApi) stay local.
+    # Clients that intercept at send() (cassettes) hand out a fresh session of
+    # their own kind, since YouTubeTranscriptApi may replace mounted adapters.
+    derive = getattr(base_client, "derive", None)
+    session = derive() if derive is not None else requests.Session()
+    if base_client is not None:
+        for prefix, adapter in base_client.adapters.items():
+            session.mount(prefix, adapter)
+    return session
+
+
+def _transcript_session(base_client: Any | None = None, timeout_s: float | None = None) -> Any:
+    session = _derived_session(base_client)
+    session.hooks["response"].append(account_response)
+    if timeout_s:
+        original_request = session.request
+
+        def request_with_timeout(method: str, url: str, *args: Any, **kwargs: Any):  # noqa: ANN202
+            kwargs.setdefault("timeout", timeout_s)
+            return original_request(method, url, *args, **kwargs)
+
+        session.request = request_with_timeout  # type: ignore[assignment]
+    return session
+
+
+def _fetch_transcript_hedged(
+    video_id: str,
+    languages: list[str],
+    proxy_config: Any | None,
+    http_client: Any | None,
+    hedger: Any,
+    timeout_s: float | None = None,
+    prober: Any | None = None,
+) -> str | None:
+    # Each attempt gets its own session so the loser's connections can be
+    # closed. Adapters borrowed from a caller's client are shared, so those
+    # attempts are abandoned rather than closed.
+    sessions = [_transcript_session(http_client, timeout_s) for _ in range(2)]
+
+    def cancel(index: int) -> None:
+        if http_client is None:
+            sessions[index].close()
+
+    return hedger.run(
+        lambda: _fetch_transcript_default(
+            video_id,
+            languages,
+            proxy_config=proxy_config,
+            http_client=sessions[0],
+            prober=prober,
+        ),
+        lambda: _fetch_transcript_default(
+            video_id,
+            languages,
+            proxy_config=hedger.proxy_config,
+            http_client=sessions[1],
+            prober=prober,
+        ),
+        cancel=cancel,
+    )
 
 
 def _fetch_transcript_insecure(
     video_id: str,
     languages: list[str],
     proxy_config: Any | None = None,
+    base_client: Any | None = None,
+    timeout_s: float | None = None,
 ) -> str | None:
-    import requests
     from youtube_transcript_api import YouTubeTranscriptApi
 
-    with requests.Session() as http_client:
+    with _derived_session(base_client) as http_client:
+        http_client.hooks["response"].append(account_response)
         original_request = http_client.request
 
         def insecure_request(method: str, url: str, *args: Any, **kwargs: Any):  # noqa: ANN202
             kwargs["verify"] = False
+            if timeout_s:
+                kwargs.setdefault("timeout", timeout_s)
             if url.startswith("https://www.youtube.com/api/timedtext"):
                 url = url.replace(
                     "https://www.youtube.com/api/timedtext",
@@ -313,42 +501,175 @@ def _fetch_transcript_insecure(
     return _transcript_segments_to_text(segments)
 
 
+def _count_transcript(text: str | None) -> str | None:
+    TRANSCRIPT_FETCHES.inc(outcome="ok" if text else "empty")
+    if text:
+        TRANSCRIPT_CHARS.inc(len(text))
+    return text
+
+
+def _count_failure(blocked: bool) -> None:
+    TRANSCRIPT_FETCHES.inc(outcome="blocked" if blocked else "error")
+
+
+def _run_with_timeout(func: Callable[[], Any], timeout_s: float) -> Any:
+    # The worker cannot be killed; on timeout it is abandoned and its own
+    # per-request socket timeouts bound how long it lingers.
+    outcome: "queue.Queue[tuple[bool, Any]]" = queue.Queue(maxsize=1)
+    context = contextvars.copy_context()
+
+    def target() -> None:
+        try:
+            outcome.put((True, context.run(func)))
+        except BaseException as exc:  # noqa: BLE001
+            outcome.put((False, exc))
+
+    threading.Thread(target=target, name="transcript-fetch", daemon=True).start()
+    try:
+        ok, value = outcome.get(timeout=timeout_s)
+    except queue.Empty:
+        raise TimeoutError(f"Transcript fetch timed out after {timeout_s:g}s") from None
+    if not ok:
+        raise value
+    return value
+
+
+def _with_transient_retries(
+    func: Callable[[], Any],
+    retries: int,
+    backoff_s: float,
+    deadline: float | None,
+) -> tuple[Any, int]:
+    attempt = 0
+    while True:
+        try:
+            return func(), attempt
+        except Exception as exc:
+            delay = backoff_s * (2**attempt) * random.uniform(0.5, 1.5)
+            if attempt >= retries or not _is_transient_error(exc):
+                raise
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise
+            TRANSCRIPT_RETRIES.inc()
+            attempt += 1
+            time.sleep(delay)
+
+
 def fetch_transcript(
     video_id: str,
     languages: list[str],
     allow_insecure_ssl_fallback: bool = True,
     proxy_config: Any | None = None,
+    http_client: Any | None = None,
+    hedger: Any | None = None,
+    timeout_s: float = 0,
+    retries: int = 0,
+    backoff_s: float = 0.5,
+    prober: Any | None = None,
+) -> tuple[str | None, list[str]]:
+    started = time.perf_counter()
+    deadline = time.monotonic() + timeout_s if timeout_s > 0 else None
+
+    def fetch() -> tuple[str | None, list[str]]:
+        return _fetch_transcript_with_fallback(
+            video_id,
+            languages,
+            allow_insecure_ssl_fallback=allow_insecure_ssl_fallback,
+            proxy_config=proxy_config,
+            http_client=http_client,
+            hedger=hedger,
+            timeout_s=timeout_s or None,
+            retries=retries,
+            backoff_s=backoff_s,
+            deadline=deadline,
+            prober=prober,
+        )
+
+    try:
+        if deadline is None:
+            return fetch()
+        try:
+            return _run_with_timeout(fetch, timeout_s)
+        except TimeoutError:
+            TRANSCRIPT_FETCHES.inc(outcome="timeout")
+            return None, [warning("transcript_fetch_timeout", seconds=f"{timeout_s:g}")]
+    finally:
+        TRANSCRIPT_FETCH_SECONDS.observe(time.perf_counter() - started)
+
+
+def _fetch_transcript_with_fallback(
+    video_id: str,
+    languages: list[str],
+    allow_insecure_ssl_fallback: bool,
+    proxy_config: Any | None,
+    http_client: Any | None = None,
+    hedger: Any | None = None,
+    timeout_s: float | None = None,
+    retries: int = 0,
+    backoff_s: float = 0.5,
+    deadline: float | None = None,
+    prober: Any | None = None,
 ) -> tuple[str | None, list[str]]:
     warnings: list[str] = []
+
+    def attempt() -> str | None:
+        with span("transcript_fetch"):
+            if hedger is not None:
+                return _fetch_transcript_hedged(
+                    video_id, languages, proxy_config, http_client, hedger, timeout_s, prober=prober
+                )
+            return _fetch_transcript_default(
+                video_id,
+                languages,
+                proxy_config=proxy_config,
+                http_client=_transcript_session(http_client, timeout_s) if timeout_s else http_client,
+                prober=prober,
+            )
+
     try:
-        return _fetch_transcript_default(video_id, languages, proxy_config=proxy_config), warnings
+        text, retried = _with_transient_retries(attempt, retries, backoff_s, deadline)
+        if retried:
+            warnings.append(
+                warning("transcript_fetch_retried", retries=f"{retried} retr{'y' if retried == 1 else 'ies'}")
+            )
+        return _count_transcript(text), warnings
+    except TracksSkipped as exc:
+        # Not a YouTube miss: the memo suppressed the fetch, so say so.
+        TRANSCRIPT_FETCHES.inc(outcome="memo_skipped")
+        warnings.append(warning("transcript_memo_skipped", tracks=", ".join(exc.tracks)))
+        return None, warnings
     except Exception as exc:
         if _is_ssl_verification_error(exc):
             diagnostic = _format_exception(exc)
             if not allow_insecure_ssl_fallback:
-                warnings.append(
-                    f"Transcript fetch failed due to SSL verification error (fallback disabled): {diagnostic}"
-                )
+                TRANSCRIPT_FETCHES.inc(outcome="ssl_error")
+                warnings.append(warning("ssl_fallback_disabled", error=diagnostic))
                 return None, warnings
 
-            warnings.append(
-                "Transcript fetch SSL verification failed; retrying with insecure SSL fallback (verify=False)."
-            )
+            warnings.append(warning("ssl_fallback_used"))
             try:
-                return _fetch_transcript_insecure(
-                    video_id,
-                    languages,
-                    proxy_config=proxy_config,
-                ), warnings
+                with span("transcript_fetch_insecure"):
+                    text = _fetch_transcript_insecure(
+                        video_id,
+                        languages,
+                        proxy_config=proxy_config,
+                        base_client=http_client,
+                        timeout_s=timeout_s,
+                    )
+                TRANSCRIPT_SSL_FALLBACKS.inc(outcome="ok")
+                return _count_transcript(text), warnings
             except Exception as fallback_exc:
-                warnings.append(
-                    f"Transcript fetch failed after insecure SSL fallback: {_format_exception(fallback_exc)}"
-                )
-                if _is_blocked_request_error(fallback_exc):
+                TRANSCRIPT_SSL_FALLBACKS.inc(outcome="error")
+                warnings.append(warning("ssl_fallback_failed", error=_format_exception(fallback_exc)))
+                blocked = _is_blocked_request_error(fallback_exc)
+                _count_failure(blocked)
+                if blocked:
                     warnings.append(_BLOCKED_TRANSCRIPT_WARNING)
                 return None, warnings
 
-        warnings.append(f"Transcript fetch failed: {_format_exception(exc)}")
-        if _is_blocked_request_error(exc):
+        warnings.append(warning("transcript_fetch_failed", error=_format_exception(exc)))
+        blocked = _is_blocked_request_error(exc)
+        _count_failure(blocked)
+        if blocked:
             warnings.append(_BLOCKED_TRANSCRIPT_WARNING)
         return None, warnings
@@ -0,0 +1,91 @@
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.archive import compact_daily_files, iter_history, lookup_archive
+
+
+def _batch_line(run_id: str, video_ids: list[str]) -> str:
+    return json.dumps(
+        {"run_id": run_id, "results": [{"video": {"video_id": video_id}} for video_id in video_ids]}
+    )
+
+
+class ArchiveTest(unittest.TestCase):
+    def test_compaction_moves_old_days_into_indexed_monthly_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "headline-20260201.jsonl").write_text(
+                "\n".join(_batch_line(f"run-{n}", [f"video{n:06d}"]) for n in range(30)) + "\n",
+                encoding="utf-8",
+            )
+            (root / "headline-20260202.jsonl").write_text(_batch_line("run-x", ["dQw4w9WgXcQ"]) + "\n")
+            (root / "headline-20260215.jsonl").write_text(_batch_line("run-today", ["oHg5SJYRHA0"]) + "\n")
+
+            compacted = compact_daily_files(root, older_than_days=7, today=date(2026, 2, 16), block_bytes=200)
+
+            archive = root / "archive" / "headline-202602.jsonl.gz"
+            self.assertEqual([path.name for path in compacted], ["headline-20260201.jsonl", "headline-20260202.jsonl"])
+            self.assertFalse((root / "headline-20260201.jsonl").exists())
+            self.assertTrue((root / "headline-20260215.jsonl").exists())
+
+            index = json.loads((root / "archive" / "headline-202602.jsonl.gz.idx.json").read_text())
+            self.assertGreater(len(index["blocks"]), 2)
+            with gzip.open(archive, "rt") as fp:
+                self.assertEqual(len(fp.read().splitlines()), 31)
+
+            by_video = list(lookup_archive(archive, video_id="video000017"))
+            by_run = list(lookup_archive(archive, run_id="run-x"))
+            history = [record["run_id"] for record in iter_history(root)]
+
+        self.assertEqual([record["run_id"] for record in by_video], ["run-17"])
+        self.assertEqual(by_run[0]["results"][0]["video"]["video_id"], "dQw4w9WgXcQ")
+        self.assertEqual(history, [f"run-{n}" for n in range(30)] + ["run-x", "run-today"])
+
+    def test_recompaction_appends_and_drops_unindexed_tail(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "headline-20260101.log").write_text(json.dumps({"run_id": "a", "payload": {}}) + "\n")
+            compact_daily_files(root, older_than_days=0, today=date(2026, 2, 1))
+            archive = root / "archive" / "headline-202601.log.gz"
+            with archive.open("ab") as fp:
+                fp.write(b"partial write from a crashed compaction")
+
+            (root / "headline-20260102.log").write_text(
+                json.dumps({"run_id": "b", "payload": {"video_id": "dQw4w9WgXcQ"}}) + "\n"
+            )
+            compact_daily_files(root, older_than_days=0, today=date(2026, 2, 1))
+
+            records = list(iter_history(root, suffix=".log"))
+            by_video = list(lookup_archive(archive, video_id="dQw4w9WgXcQ"))
+
+        self.assertEqual([record["run_id"] for record in records], ["a", "b"])
+        self.assertEqual([record["run_id"] for record in by_video], ["b"])
+
+    def test_rerun_after_a_crash_before_unlink_does_not_duplicate(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            source = root / "headline-20260101.log"
+            line = json.dumps({"run_id": "a", "payload": {}}) + "\n"
+            source.write_text(line)
+            compact_daily_files(root, older_than_days=0, today=date(2026, 2, 1))
+            source.write_text(line)  # As if the unlink never happened.
+
+            compacted = compact_daily_files(root, older_than_days=0, today=date(2026, 2, 1))
+            records = list(iter_history(root, suffix=".log"))
+
+        self.assertEqual([path.name for path in compacted], ["headline-20260101.log"])
+        self.assertEqual([record["run_id"] for record in records], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
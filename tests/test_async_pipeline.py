@@ -0,0 +1,196 @@
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import aio, pipeline, youtube
+from economic_youtube_headline_skill.settings import Settings
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. 수출 회복세가 이어집니다. " * 30
+URLS = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "not a youtube url",
+    "https://youtu.be/aqz-KE-bpKQ",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+]
+
+
+async def _as_async(items: list[str]):  # noqa: ANN202
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class AsyncPipelineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.original_resolve = pipeline._resolve_transcript
+
+    def tearDown(self) -> None:
+        pipeline._resolve_transcript = self.original_resolve
+
+    def test_async_results_match_sync_results(self) -> None:
+        settings = Settings(mock_transcript_text=TRANSCRIPT)
+        sync_events: list[str] = []
+        async_events: list[str] = []
+        expected = pipeline.run_pipeline(URLS, settings, log_event=lambda event, _p: sync_events.append(event))
+        actual = asyncio.run(
+            aio.run_pipeline_async(
+                _as_async(URLS),
+                settings,
+                log_event=lambda event, _p: async_events.append(event),
+                concurrency=3,
+            )
+        )
+        self.assertEqual([item.to_dict() for item in actual.results], [item.to_dict() for item in expected.results])
+        self.assertEqual(sorted(async_events), sorted(sync_events))
+
+    def test_fetch_concurrency_is_bounded_and_order_is_kept(self) -> None:
+        lock = threading.Lock()
+        active = peak = 0
+
+        def resolve(video, *_args, **_kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Earlier videos finish last, so ordering cannot come from timing.
+            time.sleep(0.05 if video.video_id.endswith("0") else 0.01)
+            with lock:
+                active -= 1
+            return f"{video.video_id} {TRANSCRIPT}", []
+
+        pipeline._resolve_transcript = resolve
+        urls = [f"https://www.youtube.com/watch?v=abcdefghij{index}" for index in range(8)]
+        started = time.perf_counter()
+        batch = asyncio.run(aio.run_pipeline_async(urls, Settings(), concurrency=4))
+        elapsed = time.perf_counter() - started
+        self.assertEqual([item.video.url for item in batch.results], urls)
+        self.assertLessEqual(peak, 4)
+        self.assertGreater(peak, 1)
+        self.assertLess(elapsed, 8 * 0.05)
+
+    def test_shared_semaphore_bounds_fetches_across_runs(self) -> None:
+        lock = threading.Lock()
+        active = peak = 0
+
+        def resolve(video, *_args, **_kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return TRANSCRIPT, []
+
+        pipeline._resolve_transcript = resolve
+        urls = [f"https://www.youtube.com/watch?v=abcdefghij{index}" for index in range(6)]
+
+        async def main() -> list:  # noqa: ANN202
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                aio.run_pipeline_async(urls, Settings(), concurrency=4, semaphore=semaphore),
+                aio.run_pipeline_async(urls, Settings(), concurrency=4, semaphore=semaphore),
+            )
+
+        batches = asyncio.run(main())
+        self.assertEqual([len(batch.results) for batch in batches], [6, 6])
+        self.assertLessEqual(peak, 2)
+
+    def test_cancellation_closes_the_run(self) -> None:
+        release = threading.Event()
+        closed: list[bool] = []
+        original_close = pipeline._PipelineRun.close
+
+        def resolve(video, *_args, **_kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            release.wait(5)
+            return TRANSCRIPT, []
+
+        def close(run) -> None:  # noqa: ANN001
+            closed.append(True)
+            original_close(run)
+
+        pipeline._resolve_transcript = resolve
+        pipeline._PipelineRun.close = close
+        urls = [f"https://www.youtube.com/watch?v=abcdefghij{index}" for index in range(4)]
+
+        async def main() -> None:
+            task = asyncio.create_task(aio.run_pipeline_async(urls, Settings(), concurrency=2))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            release.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        try:
+            asyncio.run(main())
+        finally:
+            pipeline._PipelineRun.close = original_close
+        self.assertEqual(closed, [True])
+
+    def test_early_aclose_stops_and_closes(self) -> None:
+        closed: list[bool] = []
+        original_close = pipeline._PipelineRun.close
+
+        def close(run) -> None:  # noqa: ANN001
+            closed.append(True)
+            original_close(run)
+
+        pipeline._PipelineRun.close = close
+        urls = [f"https://www.youtube.com/watch?v=abcdefghij{index}" for index in range(6)]
+
+        async def main() -> list:  # noqa: ANN202
+            results = aio.iter_pipeline_async(urls, Settings(mock_transcript_text=TRANSCRIPT), concurrency=2)
+            first = await anext(results)
+            await results.aclose()
+            return [first]
+
+        try:
+            seen = asyncio.run(main())
+        finally:
+            pipeline._PipelineRun.close = original_close
+        self.assertEqual(seen[0].video.url, urls[0])
+        self.assertEqual(closed, [True])
+
+    def test_deadline_skips_remaining_videos(self) -> None:
+        batch = asyncio.run(
+            aio.run_pipeline_async(URLS[:2], Settings(mock_transcript_text=TRANSCRIPT), deadline=time.monotonic() - 1)
+        )
+        self.assertEqual([item.status.value for item in batch.results], ["skipped", "skipped"])
+
+
+class AsyncChannelCollectionTest(unittest.TestCase):
+    def test_matches_sync_collection(self) -> None:
+        feeds = {
+            "UCaaaaaaaaaaaaaaaaaaaaaa": ["aaaaaaaaaa1", "aaaaaaaaaa2"],
+            "UCbbbbbbbbbbbbbbbbbbbbbb": ["bbbbbbbbbb1", "bbbbbbbbbb2"],
+        }
+
+        def fetch_text(url: str) -> str | None:
+            for channel_id, video_ids in feeds.items():
+                if channel_id in url:
+                    entries = "".join(
+                        f"<entry><yt:videoId>{video_id}</yt:videoId>"
+                        f"<published>2026-01-0{index + 1}T00:00:00+00:00</published></entry>"
+                        for index, video_id in enumerate(video_ids)
+                    )
+                    return f'<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015">{entries}</feed>'
+            return None
+
+        tokens = [*feeds, "@missing"]
+        expected = youtube.collect_video_urls_from_channels(tokens, 2, fetch_text=fetch_text)
+        actual = asyncio.run(aio.collect_video_urls_from_channels_async(tokens, 2, fetch_text=fetch_text))
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(actual[0]), 4)
+        self.assertEqual(len(actual[1]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
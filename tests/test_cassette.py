@@ -0,0 +1,136 @@
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+BENCHMARKS = ROOT / "benchmarks"
+for path in (SRC, BENCHMARKS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from economic_youtube_headline_skill.cassette import Cassette, Player, Recorder, open_cassette
+from economic_youtube_headline_skill.pipeline import run_pipeline
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
+from standin_server import Faults, StandinServer, standin_fetch_text, standin_session
+
+CHANNELS = ["@bench_a", "@bench_b"]
+
+
+class _DirectSession(requests.Session):
+    # Sends straight to the stand-in even when a proxy config set proxies.
+    def __init__(self, base_client: requests.Session) -> None:
+        super().__init__()
+        self.base_client = base_client
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # noqa: ANN003
+        kwargs["proxies"] = {}
+        return self.base_client.send(request, **kwargs)
+
+
+class _FailingSession(requests.Session):
+    def __init__(self, errors: list[Exception]) -> None:
+        super().__init__()
+        self.errors = errors
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # noqa: ANN003
+        raise self.errors.pop(0)
+
+
+def _run(cassette: Recorder | Player, tmp: str, http_client=None, **overrides):  # noqa: ANN001, ANN003, ANN202
+    urls, _ = collect_video_urls_from_channels(CHANNELS, 2, fetch_text=cassette.fetch_text)
+    return run_pipeline(
+        urls,
+        Settings(transcript_languages="ko", log_dir=tmp, result_dir=tmp, **overrides),
+        run_id="cassette",
+        http_client=http_client or cassette.session(),
+    )
+
+
+class CassetteTest(unittest.TestCase):
+    def test_replay_reproduces_a_recorded_run_offline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run.cassette.jsonl.gz"
+            with StandinServer(Faults(latency_ms=20, tls_fail_every=3), videos_per_channel=2) as server:
+                recorder = Recorder(path, base_fetch_text=standin_fetch_text(server.base_url))
+                session = recorder.session(base_client=standin_session(server.base_url, server.faults.tls_fail_every))
+                recorded = _run(recorder, tmp, http_client=session)
+                recorder.close()
+
+            cassette = Cassette.load(path)
+            self.assertTrue(any("error" in item for item in cassette.interactions))
+            self.assertTrue(all(item["elapsed_ms"] >= 0 for item in cassette.interactions))
+
+            started = time.perf_counter()
+            replayed = _run(Player(path, speed=0), tmp)
+            self.assertLess(time.perf_counter() - started, 1.0)
+
+        self.assertEqual(
+            [(item.video.video_id, item.status, item.headlines, item.warnings) for item in replayed.results],
+            [(item.video.video_id, item.status, item.headlines, item.warnings) for item in recorded.results],
+        )
+        self.assertTrue(any(item.warnings for item in recorded.results))
+
+    def test_webshare_proxy_config_does_not_bypass_the_cassette(self) -> None:
+        # Webshare retries on blocks, so YouTubeTranscriptApi mounts its own
+        # adapters over whatever the client had.
+        webshare = {"webshare_proxy_username": "user", "webshare_proxy_password": "secret"}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "webshare.cassette.jsonl.gz"
+            with StandinServer(Faults(), videos_per_channel=2) as server:
+                recorder = Recorder(path, base_fetch_text=standin_fetch_text(server.base_url))
+                base_client = _DirectSession(standin_session(server.base_url))
+                recorded = _run(recorder, tmp, http_client=recorder.session(base_client), **webshare)
+                recorder.close()
+
+            interactions = Cassette.load(path).interactions
+            self.assertTrue(any(item["key"].startswith("http POST") for item in interactions))
+            self.assertTrue(any("timedtext" in item["key"] for item in interactions))
+
+            replayed = _run(Player(path, speed=0), tmp, **webshare)
+
+        self.assertTrue(all(item.headlines for item in recorded.results))
+        self.assertEqual(
+            [(item.video.video_id, item.status, item.headlines) for item in replayed.results],
+            [(item.video.video_id, item.status, item.headlines) for item in recorded.results],
+        )
+
+    def test_recorded_errors_replay_with_their_original_type(self) -> None:
+        errors = [
+            requests.exceptions.ReadTimeout("read timed out"),
+            requests.exceptions.ProxyError("proxy refused"),
+            requests.exceptions.SSLError("bad certificate"),
+            OSError("socket closed"),
+        ]
+        expected = [type(exc) for exc in errors[:3]] + [requests.exceptions.ConnectionError]
+        urls = [f"https://www.youtube.com/api/timedtext?v=dQw4w9WgXcQ&n={index}" for index in range(len(errors))]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "errors.cassette.jsonl.gz"
+            recorder = Recorder(path)
+            session = recorder.session(_FailingSession(list(errors)))
+            for url in urls:
+                with self.assertRaises(Exception):
+                    session.get(url)
+            recorder.close()
+
+            session = Player(path, speed=0).session()
+            replayed = []
+            for url in urls:
+                with self.assertRaises(requests.exceptions.RequestException) as caught:
+                    session.get(url)
+                replayed.append(type(caught.exception))
+        self.assertEqual(replayed, expected)
+
+    def test_unknown_mode_is_rejected(self) -> None:
+        self.assertIsNone(open_cassette("", "x.gz"))
+        with self.assertRaises(ValueError):
+            open_cassette("rewind", "x.gz")
+
+
+if __name__ == "__main__":
+    unittest.main()
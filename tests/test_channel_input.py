@@ -7,7 +7,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from economic_youtube_headline_skill import cli
+from economic_youtube_headline_skill import generate
 from economic_youtube_headline_skill.settings import Settings
 from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
 
@@ -40,14 +40,14 @@ class ChannelInputTest(unittest.TestCase):
 
     def test_cli_uses_target_channels_when_no_direct_urls(self) -> None:
         settings = Settings(target_channels="@sample-channel", channel_video_limit=1)
-        original = cli.collect_video_urls_from_channels
+        original = generate.collect_video_urls_from_channels
         try:
-            cli.collect_video_urls_from_channels = (
-                lambda channels, limit: (["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], [])
+            generate.collect_video_urls_from_channels = (
+                lambda channels, limit, **_kwargs: (["https://www.youtube.com/watch?v=dQw4w9WgXcQ"], [])
             )
-            urls, warnings = cli._collect_urls(settings, video_urls=[], input_file=None)
+            urls, warnings = generate._collect_urls(settings, video_urls=[], input_file=None)
         finally:
-            cli.collect_video_urls_from_channels = original
+            generate.collect_video_urls_from_channels = original
 
         self.assertEqual(urls, ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"])
         self.assertEqual(warnings, [])
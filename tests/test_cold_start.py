@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+
+# Generous enough for slow CI; importing everything eagerly took ~170ms.
+CLI_IMPORT_BUDGET_US = 100_000
+HEAVY_MODULES = {
+    "requests",
+    "urllib3",
+    "urllib.request",
+    "sqlite3",
+    "concurrent.futures.process",
+    "cProfile",
+    "economic_youtube_headline_skill.generate",
+    "economic_youtube_headline_skill.pipeline",
+    "economic_youtube_headline_skill.youtube",
+}
+
+
+def _importtime(*args: str) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        timeout=60,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, total_us, name = line[len("import time:") :].split("|")
+        if total_us.strip().isdigit():
+            cumulative[name.strip()] = int(total_us)
+    return proc, cumulative
+
+
+class ColdStartTest(unittest.TestCase):
+    def test_cli_import_stays_light(self) -> None:
+        proc, modules = _importtime("-c", "import economic_youtube_headline_skill.cli")
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        self.assertEqual(HEAVY_MODULES & set(modules), set())
+        self.assertLess(modules["economic_youtube_headline_skill.cli"], CLI_IMPORT_BUDGET_US)
+
+    def test_help_does_not_load_subcommands(self) -> None:
+        proc, modules = _importtime("-m", "economic_youtube_headline_skill.cli", "--help")
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        self.assertIn("generate", proc.stdout)
+        self.assertEqual(HEAVY_MODULES & set(modules), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
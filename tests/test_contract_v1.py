@@ -13,6 +13,8 @@ class ContractTest(unittest.TestCase):
             root / "contracts/v1/examples/valid.complete.json",
             root / "contracts/v1/examples/valid.partial.json",
             root / "contracts/v1/examples/valid.ended_live.json",
+            root / "contracts/v1/examples/valid.skipped.json",
+            root / "contracts/v1/examples/valid.compact_warnings.json",
         ]
         for example_path in examples:
             instance = json.loads(example_path.read_text(encoding="utf-8"))
@@ -21,7 +23,7 @@ class ContractTest(unittest.TestCase):
             self.assertIsInstance(instance["results"], list)
             self.assertTrue(instance["results"])
             first = instance["results"][0]
-            self.assertIn(first["status"], {"complete", "partial", "ended_live", "unavailable", "error"})
+            self.assertIn(first["status"], {"complete", "partial", "ended_live", "unavailable", "error", "skipped"})
             self.assertIn("video", first)
             self.assertIn("url", first["video"])
 
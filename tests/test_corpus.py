@@ -0,0 +1,61 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.corpus import (
+    CHARS_PER_MINUTE,
+    CorpusSpec,
+    synthetic_segments,
+    synthetic_transcript,
+    transcript_for_video,
+)
+from economic_youtube_headline_skill.models import ProcessingStatus
+from economic_youtube_headline_skill.pipeline import run_pipeline
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.youtube import _transcript_segments_to_text
+
+
+class SyntheticCorpusTest(unittest.TestCase):
+    def test_transcripts_are_deterministic_and_sized_by_duration(self) -> None:
+        short = synthetic_transcript("seed", 1, "ko")
+        live = synthetic_transcript("seed", 360, "en", punctuated=False)
+        self.assertEqual(short, synthetic_transcript("seed", 1, "ko"))
+        self.assertNotEqual(short, synthetic_transcript("other", 1, "ko"))
+        self.assertGreaterEqual(len(short), CHARS_PER_MINUTE["ko"])
+        self.assertLess(len(short), CHARS_PER_MINUTE["ko"] + 200)
+        self.assertGreaterEqual(len(live), 360 * CHARS_PER_MINUTE["en"])
+        self.assertIn(".", short)
+        self.assertFalse(any(mark in live for mark in ".!?,"))
+
+    def test_segments_rejoin_to_the_transcript(self) -> None:
+        text = synthetic_transcript("seed", 10, "mixed")
+        segments = synthetic_segments(text, 10)
+        self.assertGreaterEqual(len(segments), 150)
+        self.assertEqual(_transcript_segments_to_text(segments), text)
+
+    def test_spec_parsing(self) -> None:
+        spec = CorpusSpec.parse("lang=en, minutes=1-360, punct=mixed")
+        self.assertEqual((spec.language, spec.min_minutes, spec.max_minutes, spec.punctuation), ("en", 1, 360, "mixed"))
+        self.assertEqual(CorpusSpec.parse("minutes=5").max_minutes, 5)
+        with self.assertRaises(ValueError):
+            CorpusSpec.parse("lang=jp")
+
+    def test_pipeline_mock_corpus_varies_per_video(self) -> None:
+        spec = "lang=ko,minutes=1-60,punct=yes"
+        urls = [f"https://www.youtube.com/watch?v=c{index:010d}" for index in range(6)]
+        batch = run_pipeline(urls, Settings(mock_transcript_corpus=spec))
+        self.assertEqual(len({item.transcript_chars for item in batch.results}), 6)
+        self.assertEqual(
+            [item.transcript_chars for item in batch.results],
+            [len(transcript_for_video(item.video.video_id, CorpusSpec.parse(spec))) for item in batch.results],
+        )
+        self.assertTrue(all(item.status != ProcessingStatus.UNAVAILABLE for item in batch.results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import pipeline, youtube
+from economic_youtube_headline_skill.models import ProcessingStatus
+from economic_youtube_headline_skill.settings import Settings
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 30
+
+
+class TransientRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.original_default = youtube._fetch_transcript_default
+        self.calls = 0
+
+    def tearDown(self) -> None:
+        youtube._fetch_transcript_default = self.original_default
+
+    def _stub(self, failures: list[Exception]) -> None:
+        def fetch(_video_id, _languages, proxy_config=None, **_kwargs):  # noqa: ANN001, ANN202
+            self.calls += 1
+            if failures:
+                raise failures.pop(0)
+            return "transcript"
+
+        youtube._fetch_transcript_default = fetch
+
+    def test_transient_errors_are_retried(self) -> None:
+        self._stub([requests.ConnectionError("Connection reset by peer"), requests.ReadTimeout("read timed out")])
+        transcript, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], retries=2, backoff_s=0)
+        self.assertEqual((transcript, self.calls), ("transcript", 3))
+        self.assertEqual(warnings, ["Transcript fetch succeeded after 2 retries."])
+
+    def test_blocked_and_exhausted_requests_are_not_retried_further(self) -> None:
+        self._stub([RuntimeError("429 Client Error: Too Many Requests")])
+        transcript, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], retries=3, backoff_s=0)
+        self.assertIsNone(transcript)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(any("blocked/rate-limited" in item for item in warnings))
+
+        self.calls = 0
+        self._stub([RuntimeError("503 Server Error: Service Unavailable")] * 3)
+        transcript, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], retries=1, backoff_s=0)
+        self.assertIsNone(transcript)
+        self.assertEqual(self.calls, 2)
+        self.assertIn("503 Server Error", warnings[-1])
+
+    def test_hung_fetch_is_cut_off_by_the_video_timeout(self) -> None:
+        released = threading.Event()
+        youtube._fetch_transcript_default = lambda *_args, **_kwargs: released.wait(5) and "late"
+        try:
+            started = time.perf_counter()
+            transcript, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], timeout_s=0.1)
+        finally:
+            released.set()
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertIsNone(transcript)
+        self.assertEqual(warnings, ["Transcript fetch timed out after 0.1s."])
+
+
+class FaultIsolationTest(unittest.TestCase):
+    def test_bad_url_becomes_an_error_result(self) -> None:
+        events: list[str] = []
+        batch = pipeline.run_pipeline(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "not a youtube url", "https://youtu.be/aqz-KE-bpKQ"],
+            Settings(mock_transcript_text=TRANSCRIPT),
+            log_event=lambda event, _payload: events.append(event),
+        )
+        self.assertEqual(
+            [item.status for item in batch.results],
+            [ProcessingStatus.COMPLETE, ProcessingStatus.ERROR, ProcessingStatus.COMPLETE],
+        )
+        failed = batch.results[1]
+        self.assertEqual((failed.video.url, failed.error), ("not a youtube url", "processing_error"))
+        self.assertTrue(failed.warnings[0].startswith("Processing failed: ValueError"))
+        self.assertIn("video_error", events)
+
+    def test_bad_url_past_the_deadline_is_skipped(self) -> None:
+        batch = pipeline.run_pipeline(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "not a youtube url"],
+            Settings(mock_transcript_text=TRANSCRIPT),
+            deadline=time.monotonic() - 1,
+        )
+        self.assertEqual([item.status for item in batch.results], [ProcessingStatus.SKIPPED] * 2)
+        self.assertEqual(batch.results[1].video.url, "not a youtube url")
+
+    def test_analysis_exception_is_isolated(self) -> None:
+        original = pipeline._analyze_transcript
+
+        def flaky(transcript, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            if transcript.startswith("boom"):
+                raise RuntimeError("extractor crashed")
+            return original(transcript, *args, **kwargs)
+
+        original_resolve = pipeline._resolve_transcript
+        try:
+            pipeline._analyze_transcript = flaky
+            pipeline._resolve_transcript = lambda video, *_args, **_kwargs: (
+                ("boom " if video.video_id == "oHg5SJYRHA0" else "") + TRANSCRIPT,
+                [],
+            )
+            batch = pipeline.run_pipeline(
+                ["https://www.youtube.com/watch?v=oHg5SJYRHA0", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+                Settings(),
+            )
+        finally:
+            pipeline._analyze_transcript = original
+            pipeline._resolve_transcript = original_resolve
+        self.assertEqual([item.status for item in batch.results], [ProcessingStatus.ERROR, ProcessingStatus.COMPLETE])
+        self.assertEqual(batch.results[0].warnings, ["Processing failed: RuntimeError: extractor crashed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
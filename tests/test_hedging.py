@@ -0,0 +1,91 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import youtube
+from economic_youtube_headline_skill.hedging import Hedger
+from economic_youtube_headline_skill.metrics import TRANSCRIPT_HEDGES
+
+
+class HedgedFetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.original_default = youtube._fetch_transcript_default
+        self.calls: list[object] = []
+        self.released = threading.Event()
+
+        def fetch(_video_id, _languages, proxy_config=None, **_kwargs):  # noqa: ANN001, ANN202
+            self.calls.append(proxy_config)
+            if proxy_config == "slow-proxy":
+                self.released.wait(5)
+                return "primary transcript"
+            return "hedged transcript"
+
+        youtube._fetch_transcript_default = fetch
+
+    def tearDown(self) -> None:
+        self.released.set()
+        youtube._fetch_transcript_default = self.original_default
+
+    def test_slow_primary_is_hedged_through_the_alternate_path(self) -> None:
+        hedger = Hedger(max_extra=1, proxy_config=None, initial_delay_s=0.05)
+        won = TRANSCRIPT_HEDGES.value(outcome="hedge_won")
+        started = time.perf_counter()
+        transcript, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], proxy_config="slow-proxy", hedger=hedger)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual((transcript, warnings), ("hedged transcript", []))
+        self.assertEqual(self.calls, ["slow-proxy", None])
+        self.assertEqual(TRANSCRIPT_HEDGES.value(outcome="hedge_won"), won + 1)
+
+    def test_budget_caps_extra_requests(self) -> None:
+        hedger = Hedger(max_extra=0, initial_delay_s=0.05)
+        exhausted = TRANSCRIPT_HEDGES.value(outcome="budget_exhausted")
+        threading.Timer(0.2, self.released.set).start()
+        transcript, _ = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], proxy_config="slow-proxy", hedger=hedger)
+        self.assertEqual(transcript, "primary transcript")
+        self.assertEqual(self.calls, ["slow-proxy"])
+        self.assertEqual(hedger.extra_sent, 0)
+        self.assertEqual(TRANSCRIPT_HEDGES.value(outcome="budget_exhausted"), exhausted + 1)
+
+    def test_failed_first_finisher_falls_back_to_the_other_attempt(self) -> None:
+        hedger = Hedger(max_extra=1, initial_delay_s=0.01)
+
+        def primary() -> str:
+            time.sleep(0.1)
+            return "primary transcript"
+
+        def hedge() -> str:
+            raise ConnectionError("reset")
+
+        self.assertEqual(hedger.run(primary, hedge), "primary transcript")
+
+    def test_hedge_win_records_the_primary_latency_from_its_start(self) -> None:
+        hedger = Hedger(max_extra=1, initial_delay_s=0.1)
+
+        def primary() -> str:
+            self.released.wait(5)
+            return "primary transcript"
+
+        def hedge() -> str:
+            time.sleep(0.05)
+            return "hedged transcript"
+
+        self.assertEqual(hedger.run(primary, hedge), "hedged transcript")
+        self.assertGreaterEqual(hedger._samples[-1], 0.15)
+
+    def test_delay_tracks_the_latency_percentile(self) -> None:
+        hedger = Hedger(hedge_percentile=90, initial_delay_s=3.0, min_delay_s=0.0, min_samples=10)
+        self.assertEqual(hedger.delay(), 3.0)
+        for index in range(1, 11):
+            hedger.observe(index / 10)
+        self.assertAlmostEqual(hedger.delay(), 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import ssl
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import metrics, pipeline, youtube
+from economic_youtube_headline_skill.metrics import MetricsRegistry, TextfileExporter
+from economic_youtube_headline_skill.settings import Settings
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 30
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_renders_prometheus_text_format(self) -> None:
+        registry = MetricsRegistry()
+        fetches = registry.counter("eyt_fetch_total", "Fetches.", ("outcome",))
+        fetches.inc(outcome="ok")
+        fetches.inc(2, outcome="blocked")
+        registry.gauge("eyt_run_videos", "Videos.").set(3)
+        latency = registry.histogram("eyt_fetch_seconds", "Latency.", buckets=(0.1, 1.0))
+        latency.observe(0.05)
+        latency.observe(0.5)
+
+        self.assertEqual(
+            registry.render().splitlines(),
+            [
+                "# HELP eyt_fetch_seconds Latency.",
+                "# TYPE eyt_fetch_seconds histogram",
+                'eyt_fetch_seconds_bucket{le="0.1"} 1',
+                'eyt_fetch_seconds_bucket{le="1"} 2',
+                'eyt_fetch_seconds_bucket{le="+Inf"} 2',
+                "eyt_fetch_seconds_sum 0.55",
+                "eyt_fetch_seconds_count 2",
+                "# HELP eyt_fetch_total Fetches.",
+                "# TYPE eyt_fetch_total counter",
+                'eyt_fetch_total{outcome="blocked"} 2',
+                'eyt_fetch_total{outcome="ok"} 1',
+                "# HELP eyt_run_videos Videos.",
+                "# TYPE eyt_run_videos gauge",
+                "eyt_run_videos 3",
+            ],
+        )
+        with self.assertRaises(ValueError):
+            fetches.inc(status="ok")
+
+    def test_metric_base_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            metrics._Metric("eyt_base", "Base.", (), threading.Lock())  # type: ignore[abstract]
+
+    def test_textfile_is_replaced_atomically(self) -> None:
+        registry = MetricsRegistry()
+        runs = registry.counter("eyt_runs_total", "Runs.")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "textfile" / "eyt.prom"
+            exporter = TextfileExporter(registry, str(path), interval_s=3600)
+            exporter.tick()
+            self.assertFalse(path.exists())
+            runs.inc()
+            exporter.write()
+            runs.inc()
+            exporter.write()
+            self.assertIn("eyt_runs_total 2", path.read_text(encoding="utf-8"))
+            self.assertEqual([item.name for item in path.parent.iterdir()], ["eyt.prom"])
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        metrics.REGISTRY.reset()
+
+    def test_fetch_transcript_counts_blocked_and_ssl_fallback(self) -> None:
+        original_default = youtube._fetch_transcript_default
+        original_insecure = youtube._fetch_transcript_insecure
+
+        def fail_ssl(_video_id: str, _languages: list[str], proxy_config=None, **_kwargs) -> str | None:
+            raise ssl.SSLError("[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed")
+
+        def blocked(_video_id: str, _languages: list[str], proxy_config=None, **_kwargs) -> str | None:
+            raise RuntimeError("429 Too Many Requests")
+
+        try:
+            youtube._fetch_transcript_default = fail_ssl
+            youtube._fetch_transcript_insecure = (
+                lambda _video_id, _languages, proxy_config=None, **_kwargs: "fallback"
+            )
+            youtube.fetch_transcript("dQw4w9WgXcQ", ["en"])
+            youtube._fetch_transcript_default = blocked
+            youtube.fetch_transcript("dQw4w9WgXcQ", ["en"])
+        finally:
+            youtube._fetch_transcript_default = original_default
+            youtube._fetch_transcript_insecure = original_insecure
+
+        self.assertEqual(metrics.TRANSCRIPT_FETCHES.value(outcome="ok"), 1)
+        self.assertEqual(metrics.TRANSCRIPT_FETCHES.value(outcome="blocked"), 1)
+        self.assertEqual(metrics.TRANSCRIPT_SSL_FALLBACKS.value(outcome="ok"), 1)
+        self.assertEqual(metrics.TRANSCRIPT_CHARS.value(), len("fallback"))
+        self.assertEqual(metrics.TRANSCRIPT_FETCH_SECONDS.count(), 2)
+
+    def test_pipeline_counts_statuses_and_memo_hits(self) -> None:
+        pipeline.run_pipeline(
+            ["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "https://youtu.be/aqz-KE-bpKQ"],
+            Settings(mock_transcript_text=TRANSCRIPT),
+        )
+        self.assertEqual(metrics.VIDEO_RESULTS.value(status="complete"), 2)
+        self.assertEqual(metrics.MEMO_LOOKUPS.value(result="miss"), 1)
+        self.assertEqual(metrics.MEMO_LOOKUPS.value(result="run_hit"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
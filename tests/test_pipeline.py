@@ -0,0 +1,172 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import pipeline
+from economic_youtube_headline_skill.models import BatchResult
+from economic_youtube_headline_skill.processor import extract_headlines
+from economic_youtube_headline_skill.settings import Settings
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 30
+URLS = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/live/oHg5SJYRHA0",
+    "https://youtu.be/aqz-KE-bpKQ",
+]
+
+
+class PipelineOffloadTest(unittest.TestCase):
+    def test_process_pool_matches_inline_results(self) -> None:
+        inline = pipeline.run_pipeline(
+            URLS,
+            Settings(mock_transcript_text=TRANSCRIPT),
+            run_id="inline",
+        )
+        pooled = pipeline.run_pipeline(
+            URLS,
+            Settings(mock_transcript_text=TRANSCRIPT, extract_workers=2, extract_queue_size=1),
+            run_id="pooled",
+        )
+        self.assertEqual(
+            [item.video.video_id for item in pooled.results],
+            ["dQw4w9WgXcQ", "oHg5SJYRHA0", "aqz-KE-bpKQ"],
+        )
+        self.assertEqual(
+            [(item.status, item.headlines, item.warnings) for item in pooled.results],
+            [(item.status, item.headlines, item.warnings) for item in inline.results],
+        )
+
+    def test_inline_mode_finishes_each_video_before_next_fetch(self) -> None:
+        events: list[str] = []
+        pipeline.run_pipeline(
+            URLS[:2],
+            Settings(mock_transcript_text=TRANSCRIPT),
+            log_event=lambda event, _payload: events.append(event),
+            run_id="inline",
+        )
+        self.assertEqual(events, ["video_start", "video_done", "video_start", "video_done"])
+
+    def test_bounded_queue_limits_videos_in_flight(self) -> None:
+        events: list[str] = []
+        pipeline.run_pipeline(
+            URLS,
+            Settings(mock_transcript_text=TRANSCRIPT, extract_workers=1, extract_queue_size=1),
+            log_event=lambda event, _payload: events.append(event),
+            run_id="pooled",
+        )
+        self.assertEqual(
+            events,
+            ["video_start", "video_start", "video_done", "video_start", "video_done", "video_done"],
+        )
+
+
+class PipelineDedupeTest(unittest.TestCase):
+    def _run(self, transcripts: dict[str, str], settings: Settings) -> BatchResult:
+        original_fetch = pipeline.fetch_transcript
+        calls: list[str] = []
+
+        def fake_fetch(video_id, _languages, allow_insecure_ssl_fallback=True, proxy_config=None, **_kwargs):
+            calls.append(video_id)
+            return transcripts[video_id], []
+
+        original_extract = pipeline.extract_headlines_incremental
+        extracted: list[int] = []
+
+        def counting_extract(text, max_headlines, state=None):
+            extracted.append(len(text))
+            return original_extract(text, max_headlines, state)
+
+        try:
+            pipeline.fetch_transcript = fake_fetch
+            pipeline.extract_headlines_incremental = counting_extract
+            batch = pipeline.run_pipeline(URLS, settings, run_id="dedupe")
+        finally:
+            pipeline.fetch_transcript = original_fetch
+            pipeline.extract_headlines_incremental = original_extract
+        self.extract_calls = len(extracted)
+        return batch
+
+    def test_identical_transcripts_reuse_first_extraction(self) -> None:
+        batch = self._run(
+            {
+                "dQw4w9WgXcQ": TRANSCRIPT,
+                "oHg5SJYRHA0": "  " + TRANSCRIPT.replace(" ", "\n  "),
+                "aqz-KE-bpKQ": "다른 영상의 자막입니다. 주가 지수가 상승했습니다. " * 30,
+            },
+            Settings(),
+        )
+        self.assertEqual(self.extract_calls, 2)
+        first, duplicate, other = batch.results
+        self.assertIsNone(first.duplicate_of)
+        self.assertEqual(duplicate.duplicate_of, "dQw4w9WgXcQ")
+        self.assertEqual(duplicate.headlines, first.headlines)
+        self.assertIsNot(duplicate.headlines, first.headlines)
+        self.assertIsNone(other.duplicate_of)
+
+    def test_memo_file_is_reused_across_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = Settings(transcript_memo_path=str(Path(temp_dir) / "memo.json"))
+            transcripts = {video_id: TRANSCRIPT for video_id in ["dQw4w9WgXcQ", "oHg5SJYRHA0", "aqz-KE-bpKQ"]}
+            self._run(transcripts, settings)
+            self.assertEqual(self.extract_calls, 1)
+
+            batch = self._run(transcripts, settings)
+        self.assertEqual(self.extract_calls, 0)
+        self.assertIsNone(batch.results[0].duplicate_of)
+        self.assertEqual(batch.results[1].duplicate_of, "dQw4w9WgXcQ")
+        self.assertTrue(batch.results[0].headlines)
+
+
+class PipelineIncrementalTest(unittest.TestCase):
+    def test_grown_transcript_only_segments_new_tail(self) -> None:
+        early = "첫 번째 문장은 금리 이야기입니다. 두 번째 문장은 환율 이야기입니다. 세 번째 문장은 미완"
+        grown = early + "성 상태였고 이제 끝났습니다. 네 번째 문장은 유가 이야기입니다. " + "추가 설명이 이어집니다. " * 60
+        url = ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = Settings(
+                incremental_state_path=str(Path(temp_dir) / "progress.json"),
+                max_headlines=4,
+            )
+            first = pipeline.run_pipeline(url, _with_mock(settings, early), run_id="r1")
+            events: list[dict] = []
+            second = pipeline.run_pipeline(
+                url,
+                _with_mock(settings, grown),
+                log_event=lambda event, payload: events.append(payload) if event == "video_done" else None,
+                run_id="r2",
+            )
+
+        self.assertEqual(first.results[0].status.value, "partial")
+        self.assertEqual(second.results[0].status.value, "complete")
+        self.assertEqual(second.results[0].headlines, extract_headlines(grown, 4))
+        self.assertEqual(events[0]["resumed_chars"], early.rindex(".") + 1)
+
+    def test_rewritten_transcript_is_extracted_from_scratch(self) -> None:
+        url = ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = Settings(incremental_state_path=str(Path(temp_dir) / "progress.json"))
+            pipeline.run_pipeline(url, _with_mock(settings, "이전 자막 내용이 길게 있습니다. 그리고 끝."), run_id="r1")
+            events: list[dict] = []
+            batch = pipeline.run_pipeline(
+                url,
+                _with_mock(settings, TRANSCRIPT),
+                log_event=lambda event, payload: events.append(payload) if event == "video_done" else None,
+                run_id="r2",
+            )
+        self.assertEqual(events[0]["resumed_chars"], 0)
+        self.assertEqual(batch.results[0].headlines, extract_headlines(TRANSCRIPT, 5))
+
+
+def _with_mock(settings: Settings, transcript: str) -> Settings:
+    return replace(settings, mock_transcript_text=transcript)
+
+
+if __name__ == "__main__":
+    unittest.main()
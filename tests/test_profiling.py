@@ -0,0 +1,38 @@
+import io
+import pstats
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.processor import extract_headlines
+from economic_youtube_headline_skill.profiling import print_summary, profile_run
+
+
+class ProfileRunTest(unittest.TestCase):
+    def test_writes_cpu_and_allocation_artifacts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with profile_run(tmp, "headline-20260216-abc123", top_n=5) as artifacts:
+                extract_headlines("금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 200, 5)
+                _blob = [bytearray(4096) for _ in range(64)]
+
+            self.assertEqual(artifacts.cpu_path.name, "headline-20260216-abc123.prof")
+            names = {item[2] for item in pstats.Stats(str(artifacts.cpu_path)).stats}
+            self.assertIn("extract_headlines", names)
+            alloc_text = artifacts.alloc_path.read_text(encoding="utf-8")
+            self.assertTrue(alloc_text.startswith("peak_bytes "))
+            self.assertGreaterEqual(artifacts.peak_bytes, 64 * 4096)
+
+            stream = io.StringIO()
+            print_summary(artifacts, stream)
+            self.assertIn("[profile] peak traced memory:", stream.getvalue())
+            self.assertIn("cumulative", stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
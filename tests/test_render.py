@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 import unittest
 from pathlib import Path
 import sys
@@ -14,38 +17,97 @@ from economic_youtube_headline_skill.models import (
     ProcessingStatus,
     VideoDescriptor,
 )
-from economic_youtube_headline_skill.render import render_markdown
+from economic_youtube_headline_skill.render import (
+    render_json,
+    render_markdown,
+    write_csv,
+    write_json,
+    write_ndjson,
+)
+
+
+def _sample_batch() -> BatchResult:
+    return BatchResult(
+        run_id="abc",
+        generated_at="2026-02-16T00:00:00+00:00",
+        results=[
+            HeadlineResult(
+                status=ProcessingStatus.COMPLETE,
+                video=VideoDescriptor(
+                    video_id="dQw4w9WgXcQ",
+                    url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    channel_name="Sample Channel",
+                    title="Sample Title",
+                    was_live=False,
+                ),
+                transcript_chars=1200,
+                partial=PartialInfo(is_partial=False),
+                headlines=["헤드라인 A", "헤드라인 B"],
+                warnings=[],
+                error=None,
+            )
+        ],
+    )
 
 
 class RenderTest(unittest.TestCase):
     def test_render_markdown_groups_by_channel_title_link(self) -> None:
-        batch = BatchResult(
-            run_id="abc",
-            generated_at="2026-02-16T00:00:00+00:00",
-            results=[
-                HeadlineResult(
-                    status=ProcessingStatus.COMPLETE,
-                    video=VideoDescriptor(
-                        video_id="dQw4w9WgXcQ",
-                        url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                        channel_name="Sample Channel",
-                        title="Sample Title",
-                        was_live=False,
-                    ),
-                    transcript_chars=1200,
-                    partial=PartialInfo(is_partial=False),
-                    headlines=["헤드라인 A", "헤드라인 B"],
-                    warnings=[],
-                    error=None,
-                )
-            ],
-        )
-
+        batch = _sample_batch()
         markdown = render_markdown(batch)
         self.assertIn("Sample Channel", markdown)
         self.assertIn("Sample Title", markdown)
         self.assertIn("https://www.youtube.com/watch?v=dQw4w9WgXcQ", markdown)
         self.assertIn("- 헤드라인 A", markdown)
+        self.assertTrue(markdown.startswith("# Economic YouTube Headline Brief (abc)\n\n## 1. Sample Channel\n"))
+
+    def test_duplicates_collapse_only_onto_an_earlier_result(self) -> None:
+        batch = _sample_batch()
+        origin = batch.results[0]
+        batch.results = [
+            HeadlineResult(
+                status=ProcessingStatus.COMPLETE,
+                video=VideoDescriptor(video_id="oHg5SJYRHA0", url="https://youtu.be/oHg5SJYRHA0"),
+                headlines=["헤드라인 C"],
+                duplicate_of="aqz-KE-bpKQ",
+            ),
+            origin,
+            HeadlineResult(
+                status=ProcessingStatus.COMPLETE,
+                video=VideoDescriptor(video_id="9bZkp7q19f0", url="https://youtu.be/9bZkp7q19f0"),
+                headlines=list(origin.headlines),
+                duplicate_of=origin.video.video_id,
+            ),
+        ]
+        markdown = render_markdown(batch)
+        self.assertIn("- 헤드라인 C", markdown)
+        self.assertNotIn("aqz-KE-bpKQ", markdown)
+        self.assertEqual(markdown.count("- 헤드라인 A"), 1)
+        self.assertIn("(중복 자막: dQw4w9WgXcQ 영상과 동일하여 생략)", markdown)
+
+    def test_write_json_streams_same_document_as_render_json(self) -> None:
+        for batch in [_sample_batch(), BatchResult(run_id="empty", generated_at="t", results=[])]:
+            buffer = io.StringIO()
+            write_json(batch, buffer)
+            self.assertEqual(buffer.getvalue(), render_json(batch) + "\n")
+
+    def test_write_ndjson_emits_one_result_per_line(self) -> None:
+        buffer = io.StringIO()
+        batch = _sample_batch()
+        write_ndjson(batch.results, buffer, batch.run_id)
+        rows = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["run_id"], "abc")
+        self.assertEqual(rows[0]["video"]["video_id"], "dQw4w9WgXcQ")
+        self.assertEqual(rows[0]["headlines"], ["헤드라인 A", "헤드라인 B"])
+
+    def test_write_csv_has_header_and_flat_rows(self) -> None:
+        buffer = io.StringIO()
+        batch = _sample_batch()
+        write_csv(batch.results, buffer, batch.run_id)
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["status"], "complete")
+        self.assertEqual(rows[0]["headlines"].split("\n"), ["헤드라인 A", "헤드라인 B"])
 
 
 if __name__ == "__main__":
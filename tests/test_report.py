@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.archive import compact_daily_files
+from economic_youtube_headline_skill.models import BatchResult, HeadlineResult, ProcessingStatus, VideoDescriptor
+from economic_youtube_headline_skill.report import iter_daily_batches, merge_latest_results
+from economic_youtube_headline_skill.result_store import append_daily_result
+
+
+def _result(video_id: str, status: ProcessingStatus, headlines: list[str]) -> HeadlineResult:
+    return HeadlineResult(
+        status=status,
+        video=VideoDescriptor(video_id=video_id, url=f"https://www.youtube.com/watch?v={video_id}"),
+        headlines=headlines,
+    )
+
+
+def _append(result_dir: str, run_id: str, results: list[HeadlineResult]) -> None:
+    append_daily_result(
+        result_dir=result_dir,
+        date_key="20260216",
+        skill_slug="headline",
+        payload=BatchResult(run_id=run_id, generated_at="2026-02-16T00:00:00+00:00", results=results),
+    )
+
+
+class ReportTest(unittest.TestCase):
+    def _write_runs(self, result_dir: str) -> None:
+        _append(
+            result_dir,
+            "run-a",
+            [
+                _result("dQw4w9WgXcQ", ProcessingStatus.PARTIAL, ["초기 헤드라인"]),
+                _result("oHg5SJYRHA0", ProcessingStatus.COMPLETE, ["완료 헤드라인"]),
+            ],
+        )
+        _append(
+            result_dir,
+            "run-b",
+            [
+                _result("dQw4w9WgXcQ", ProcessingStatus.COMPLETE, ["갱신 헤드라인"]),
+                _result("oHg5SJYRHA0", ProcessingStatus.UNAVAILABLE, []),
+                _result("aqz-KE-bpKQ", ProcessingStatus.ENDED_LIVE, []),
+            ],
+        )
+
+    def test_merge_keeps_latest_unless_it_is_worse(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_runs(temp_dir)
+            merged = merge_latest_results(iter_daily_batches(temp_dir, "20260216"))
+
+        self.assertEqual([item.video.video_id for item in merged], ["dQw4w9WgXcQ", "oHg5SJYRHA0", "aqz-KE-bpKQ"])
+        self.assertEqual(merged[0].headlines, ["갱신 헤드라인"])
+        self.assertEqual(merged[1].status, ProcessingStatus.COMPLETE)
+        self.assertEqual(merged[1].headlines, ["완료 헤드라인"])
+
+    def test_report_reads_compacted_day_from_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_runs(temp_dir)
+            compact_daily_files(temp_dir, older_than_days=1, today=date(2026, 2, 20))
+            batches = list(iter_daily_batches(temp_dir, "20260216"))
+
+        self.assertEqual([batch["run_id"] for batch in batches], ["run-a", "run-b"])
+        self.assertEqual(batches[0]["results"][0]["status"], "partial")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.result_index import index_batch, index_daily_files, query_results
+from economic_youtube_headline_skill.result_store import append_daily_result
+
+
+def _payload(run_id: str, generated_at: str, items: list[tuple[str, str, str, list[str]]]) -> dict:
+    return {
+        "run_id": run_id,
+        "generated_at": generated_at,
+        "results": [
+            {
+                "status": status,
+                "video": {
+                    "video_id": video_id,
+                    "url": f"https://www.youtube.com/watch?v={video_id}",
+                    "channel_name": channel,
+                    "title": f"Title {video_id}",
+                    "was_live": False,
+                },
+                "transcript_chars": 900,
+                "partial": {"is_partial": False, "coverage_ratio": None, "reason": None},
+                "headlines": headlines,
+                "warnings": [],
+                "error": None,
+                "duplicate_of": None,
+            }
+            for video_id, channel, status, headlines in items
+        ],
+        "repo": "economic-youtube-headline-skill",
+    }
+
+
+class ResultIndexTest(unittest.TestCase):
+    def test_query_by_video_channel_and_date(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "index.sqlite3"
+            index_batch(
+                db_path,
+                _payload(
+                    "run-a",
+                    "2026-02-16T01:00:00+00:00",
+                    [
+                        ("dQw4w9WgXcQ", "채널A", "complete", ["첫 헤드라인", "둘째 헤드라인"]),
+                        ("oHg5SJYRHA0", "채널B", "unavailable", []),
+                    ],
+                ),
+                "20260216",
+            )
+            index_batch(
+                db_path,
+                _payload("run-b", "2026-02-17T01:00:00+00:00", [("dQw4w9WgXcQ", "채널A", "partial", ["갱신"])]),
+                "20260217",
+            )
+
+            by_video = query_results(db_path, video_id="dQw4w9WgXcQ")
+            by_channel = query_results(db_path, channel_name="채널B")
+            by_date = query_results(db_path, since="20260217", until="20260217")
+
+        self.assertEqual([row["run_id"] for row in by_video], ["run-b", "run-a"])
+        self.assertEqual(by_video[1]["headlines"], ["첫 헤드라인", "둘째 헤드라인"])
+        self.assertEqual([row["video"]["video_id"] for row in by_channel], ["oHg5SJYRHA0"])
+        self.assertEqual([row["status"] for row in by_date], ["partial"])
+
+    def test_reindexing_a_run_replaces_its_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result_dir = Path(temp_dir) / "results"
+            payload = _payload("run-a", "2026-02-16T01:00:00+00:00", [("dQw4w9WgXcQ", "채널A", "complete", ["A"])])
+            path = append_daily_result(
+                result_dir=str(result_dir),
+                date_key="20260216",
+                skill_slug="headline",
+                payload=payload,
+            )
+            db_path = Path(temp_dir) / "index.sqlite3"
+            index_batch(db_path, payload, "20260216")
+            self.assertEqual(index_daily_files(db_path, [path]), 1)
+            rows = query_results(db_path)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["date_key"], "20260216")
+
+    def test_limit_applies_to_videos_and_headlines_keep_rank_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "index.sqlite3"
+            items = [(f"video{n:06d}", "채널A", "complete", [f"{n}-{rank}" for rank in range(3)]) for n in range(4)]
+            index_batch(db_path, _payload("run-a", "2026-02-16T01:00:00+00:00", items), "20260216")
+            rows = query_results(db_path, limit=2)
+
+        self.assertEqual([row["headlines"] for row in rows], [["0-0", "0-1", "0-2"], ["1-0", "1-1", "1-2"]])
+
+    def test_query_does_not_create_a_missing_index(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "typo" / "index.sqlite3"
+            with self.assertRaises(FileNotFoundError):
+                query_results(db_path)
+            self.assertFalse(db_path.parent.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import json
+import multiprocessing
 import tempfile
 import unittest
 from pathlib import Path
@@ -31,6 +32,34 @@ class ResultStoreTest(unittest.TestCase):
             rows = [json.loads(line) for line in Path(p1).read_text(encoding="utf-8").splitlines()]
             self.assertEqual([row["run_id"] for row in rows], ["run-a", "run-b"])
 
+    def test_locked_appends_from_many_processes_keep_lines_intact(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workers = [
+                multiprocessing.Process(target=_append_many, args=(temp_dir, f"writer-{index}"))
+                for index in range(8)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            lines = (Path(temp_dir) / "headline-20260217.jsonl").read_text(encoding="utf-8").splitlines()
+
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 8 * 5)
+        self.assertEqual({row["run_id"] for row in rows}, {f"writer-{index}" for index in range(8)})
+        self.assertTrue(all(len(row["blob"]) == 300_000 for row in rows))
+
+
+def _append_many(result_dir: str, run_id: str) -> None:
+    for _ in range(5):
+        append_daily_result(
+            result_dir=result_dir,
+            date_key="20260217",
+            skill_slug="headline",
+            payload={"run_id": run_id, "blob": run_id[-1] * 300_000},
+            lock=True,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
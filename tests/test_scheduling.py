@@ -0,0 +1,86 @@
+import sys
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import pipeline
+from economic_youtube_headline_skill.models import ProcessingStatus
+from economic_youtube_headline_skill.report import merge_latest_results
+from economic_youtube_headline_skill.scheduling import interleave_channels, parse_deadline
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 30
+
+
+def _feed(prefix: str, count: int, day: int) -> str:
+    entries = "".join(
+        f"<entry><yt:videoId>{prefix}{index:09d}</yt:videoId>"
+        f"<published>2026-02-{day:02d}T{23 - index:02d}:00:00+00:00</published></entry>"
+        for index in range(count)
+    )
+    return f"<feed>{entries}</feed>"
+
+
+class ChannelFairSchedulingTest(unittest.TestCase):
+    def test_channels_are_interleaved_newest_first(self) -> None:
+        feeds = {"UCaaaaaaaaaaaaaaaaaaaaaa": _feed("aa", 5, 15), "UCbbbbbbbbbbbbbbbbbbbbbb": _feed("bb", 2, 16)}
+
+        def fake_fetch(url: str) -> str | None:
+            return feeds.get(url.rsplit("=", 1)[-1])
+
+        urls, warnings = collect_video_urls_from_channels(list(feeds), 5, fetch_text=fake_fetch)
+        self.assertEqual(warnings, [])
+        self.assertEqual(
+            [url.rsplit("=", 1)[-1] for url in urls],
+            ["bb000000000", "aa000000000", "bb000000001", "aa000000001", "aa000000002", "aa000000003", "aa000000004"],
+        )
+
+    def test_entries_without_published_dates_keep_feed_order(self) -> None:
+        groups = [[("a1", None), ("a2", None)], [("b1", None)], [("a1", None)]]
+        self.assertEqual(interleave_channels(groups), ["a1", "b1", "a2"])
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_parse_deadline(self) -> None:
+        now = datetime(2026, 2, 16, 6, 0, tzinfo=timezone.utc)
+        self.assertEqual(parse_deadline("07:30", now), 5400.0)
+        self.assertEqual(parse_deadline("05:00", now), 23 * 3600.0)
+        self.assertEqual(parse_deadline("06:00", now), 24 * 3600.0)
+        self.assertEqual(parse_deadline("07:30", datetime(2026, 2, 16, 23, 0, tzinfo=timezone.utc)), 8.5 * 3600)
+        self.assertEqual(parse_deadline("25m", now), 1500.0)
+        self.assertEqual(parse_deadline("90", now), 90.0)
+        self.assertIsNone(parse_deadline("", now))
+        for raw in ("25:00", "soon"):
+            with self.assertRaises(ValueError):
+                parse_deadline(raw, now)
+
+    def test_expired_deadline_skips_videos_not_yet_started(self) -> None:
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=oHg5SJYRHA0",
+        ]
+        events: list[str] = []
+        batch = pipeline.run_pipeline(
+            urls,
+            Settings(mock_transcript_text=TRANSCRIPT),
+            log_event=lambda event, _payload: events.append(event),
+            deadline=time.monotonic() - 1,
+        )
+        self.assertEqual([item.status for item in batch.results], [ProcessingStatus.SKIPPED] * 2)
+        self.assertEqual(events, ["video_skipped", "video_skipped"])
+        self.assertEqual(batch.to_dict()["results"][0]["status"], "skipped")
+
+        done = pipeline.run_pipeline(urls[:1], Settings(mock_transcript_text=TRANSCRIPT))
+        merged = merge_latest_results([done.to_dict(), batch.to_dict()])
+        self.assertEqual(merged[0].status, ProcessingStatus.COMPLETE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.models import (
+    BatchResult,
+    HeadlineResult,
+    PartialInfo,
+    ProcessingStatus,
+    VideoDescriptor,
+)
+from economic_youtube_headline_skill.serialize import encode_batch, encode_batch_line
+
+
+def _sample_batch() -> BatchResult:
+    return BatchResult(
+        run_id="abc",
+        generated_at="2026-02-16T00:00:00+00:00",
+        results=[
+            HeadlineResult(
+                status=ProcessingStatus.PARTIAL,
+                video=VideoDescriptor(
+                    video_id="dQw4w9WgXcQ",
+                    url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    channel_name='Sample "Channel"\\',
+                    title="제목\n줄바꿈   ✓",
+                    was_live=True,
+                ),
+                transcript_chars=240,
+                partial=PartialInfo(is_partial=True, coverage_ratio=0.343, reason="below_min_chars"),
+                headlines=["헤드라인 A", "tab\there"],
+                warnings=["Partial transcript detected."],
+                error=None,
+            ),
+            HeadlineResult(
+                status=ProcessingStatus.UNAVAILABLE,
+                video=VideoDescriptor(video_id="oHg5SJYRHA0", url="https://youtu.be/oHg5SJYRHA0"),
+                error="processing_error",
+                duplicate_of="dQw4w9WgXcQ",
+            ),
+        ],
+    )
+
+
+class SerializeTest(unittest.TestCase):
+    def test_to_dict_matches_dataclass_asdict(self) -> None:
+        batch = _sample_batch()
+        legacy = asdict(batch)
+        for item in legacy["results"]:
+            item["status"] = item["status"].value
+        self.assertEqual(batch.to_dict(), legacy)
+        self.assertEqual(list(batch.to_dict()), list(legacy))
+
+    def test_encode_batch_matches_json_dumps(self) -> None:
+        batch = _sample_batch()
+        self.assertEqual(encode_batch(batch), json.dumps(batch.to_dict(), ensure_ascii=False))
+
+    def test_encode_batch_line_is_one_json_line(self) -> None:
+        line = encode_batch_line(_sample_batch())
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(json.loads(line), _sample_batch().to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
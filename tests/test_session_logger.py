@@ -1,5 +1,8 @@
+import contextlib
+import io
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 import sys
@@ -9,6 +12,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from economic_youtube_headline_skill import session_logger
 from economic_youtube_headline_skill.session_logger import SessionLogger
 
 
@@ -37,6 +41,100 @@ class SessionLoggerTest(unittest.TestCase):
             self.assertEqual({row["run_id"] for row in lines}, {"run-a", "run-b"})
             self.assertEqual({row["session_id"] for row in lines}, {"shared-session"})
 
+    def test_buffered_logger_drains_all_events_on_close(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "nested" / "buffered.log"
+            logger = SessionLogger(
+                repo="economic-youtube-headline-skill",
+                run_id="run-a",
+                session_id="buffered",
+                log_path=log_path,
+                buffered=True,
+                flush_interval_ms=1000,
+                flush_max_events=7,
+                queue_size=16,
+            )
+
+            def emit(worker: int) -> None:
+                for index in range(50):
+                    logger.info("video_done", {"worker": worker, "index": index})
+
+            threads = [threading.Thread(target=emit, args=(worker,)) for worker in range(4)]
+            with logger:
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                logger.warn("run_complete")
+
+            lines = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(len(lines), 201)
+        self.assertEqual(lines[-1]["event"], "run_complete")
+        for worker in range(4):
+            indexes = [row["payload"]["index"] for row in lines if row["payload"].get("worker") == worker]
+            self.assertEqual(indexes, list(range(50)))
+
+    def _buffered(self, log_path: Path) -> SessionLogger:
+        return SessionLogger(
+            repo="economic-youtube-headline-skill",
+            run_id="run-a",
+            session_id="buffered",
+            log_path=log_path,
+            buffered=True,
+            flush_interval_ms=0,
+            flush_max_events=1,
+            queue_size=4,
+        )
+
+    def _emit_with_timeout(self, emit) -> str:  # noqa: ANN001
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            worker = threading.Thread(target=emit, daemon=True)
+            worker.start()
+            worker.join(10)
+        self.assertFalse(worker.is_alive(), "buffered logger blocked")
+        return stderr.getvalue()
+
+    def test_unserializable_payload_is_dropped_without_stalling(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "buffered.log"
+            logger = self._buffered(log_path)
+
+            def emit() -> None:
+                with logger:
+                    logger.info("bad", {"value": object()})
+                    for index in range(20):
+                        logger.info("video_done", {"index": index})
+
+            errors = self._emit_with_timeout(emit)
+            lines = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([row["payload"]["index"] for row in lines], list(range(20)))
+        self.assertIn("dropped event 'bad'", errors)
+
+    def test_dead_writer_falls_back_to_synchronous_writes(self) -> None:
+        original = session_logger.write_appending
+
+        def broken(*_args, **_kwargs) -> None:  # noqa: ANN002, ANN003
+            raise OSError("disk went away")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "buffered.log"
+            session_logger.write_appending = broken
+            try:
+                logger = self._buffered(log_path)
+
+                def emit() -> None:
+                    with logger:
+                        for index in range(20):
+                            logger.info("video_done", {"index": index})
+
+                errors = self._emit_with_timeout(emit)
+            finally:
+                session_logger.write_appending = original
+            lines = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+        self.assertIn("falling back to synchronous writes", errors)
+        self.assertEqual([row["payload"]["index"] for row in lines], list(range(20)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+BENCHMARKS = ROOT / "benchmarks"
+for path in (SRC, BENCHMARKS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from economic_youtube_headline_skill.models import ProcessingStatus
+from economic_youtube_headline_skill.pipeline import run_pipeline
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.youtube import collect_video_urls_from_channels
+from standin_server import Faults, StandinServer, standin_fetch_text, standin_session
+
+
+class StandinPipelineTest(unittest.TestCase):
+    def _run(self, faults: Faults) -> list:
+        with StandinServer(faults, videos_per_channel=2) as server, tempfile.TemporaryDirectory() as tmp:
+            urls, warnings = collect_video_urls_from_channels(
+                ["@bench_a", "@bench_b"],
+                2,
+                fetch_text=standin_fetch_text(server.base_url),
+            )
+            self.assertEqual((len(urls), warnings), (4, []))
+            batch = run_pipeline(
+                urls,
+                Settings(transcript_languages="ko", log_dir=tmp, result_dir=tmp),
+                http_client=standin_session(server.base_url, faults.tls_fail_every),
+            )
+        return batch.results
+
+    def test_real_fetch_path_runs_against_the_standin(self) -> None:
+        results = self._run(Faults())
+        self.assertEqual([item.status for item in results], [ProcessingStatus.COMPLETE] * 4)
+        self.assertTrue(all(item.headlines for item in results))
+
+    def test_tls_failures_use_the_insecure_fallback(self) -> None:
+        results = self._run(Faults(tls_fail_every=1))
+        self.assertEqual([item.status for item in results], [ProcessingStatus.COMPLETE] * 4)
+        self.assertTrue(all(any("insecure SSL fallback" in w for w in item.warnings) for item in results))
+
+    def test_throttled_requests_surface_as_blocked_warnings(self) -> None:
+        # 4 feed/channel requests, then every transcript request is throttled.
+        results = self._run(Faults(burst_every=1000, burst_length=996))
+        self.assertEqual([item.status for item in results], [ProcessingStatus.UNAVAILABLE] * 4)
+        self.assertTrue(all(any("blocked/rate-limited" in w for w in item.warnings) for item in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
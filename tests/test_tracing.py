@@ -0,0 +1,64 @@
+import unittest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import pipeline
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.tracing import collect_spans, percentile, span, stage_stats
+
+TRANSCRIPT = "금리 동결 전망이 우세합니다. 환율 변동성이 커지고 있습니다. " * 30
+
+
+class TracingTest(unittest.TestCase):
+    def test_spans_are_noops_unless_collecting(self) -> None:
+        with span("idle"):
+            pass
+        with collect_spans(False) as disabled:
+            with span("idle"):
+                pass
+        self.assertIsNone(disabled)
+
+        with collect_spans() as spans:
+            with span("stage"):
+                pass
+            with span("stage"):
+                pass
+        self.assertEqual(list(spans), ["stage"])
+        self.assertGreaterEqual(spans["stage"], 0.0)
+
+    def test_pipeline_logs_stage_spans_only_when_enabled(self) -> None:
+        def run(trace: bool) -> list[dict]:
+            payloads: list[dict] = []
+            pipeline.run_pipeline(
+                ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+                Settings(mock_transcript_text=TRANSCRIPT, trace=trace),
+                log_event=lambda event, payload: payloads.append(payload) if event == "video_done" else None,
+            )
+            return payloads
+
+        self.assertNotIn("spans_ms", run(False)[0])
+        spans = run(True)[0]["spans_ms"]
+        self.assertEqual(
+            set(spans),
+            {"build_video", "transcript", "classify", "extract", "analysis_wait"},
+        )
+
+    def test_stage_stats_uses_nearest_rank_percentiles(self) -> None:
+        rows = [{"payload": {"spans_ms": {"extract": float(value)}}} for value in range(1, 101)]
+        rows.append({"payload": {"video_id": "untraced"}})
+        stats = stage_stats(rows)
+        self.assertEqual(stats["extract"]["count"], 100)
+        self.assertEqual(stats["extract"]["p50"], 50.0)
+        self.assertEqual(stats["extract"]["p95"], 95.0)
+        self.assertEqual(stats["extract"]["p99"], 99.0)
+        self.assertEqual(stats["extract"]["max"], 100.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
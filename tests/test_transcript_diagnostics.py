@@ -21,13 +21,14 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
             _video_id: str,
             _languages: list[str],
             proxy_config=None,
+            **_kwargs,
         ) -> str | None:
             raise ssl.SSLError("[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed")
 
         try:
             youtube._fetch_transcript_default = fail_ssl
             youtube._fetch_transcript_insecure = (
-                lambda _video_id, _languages, proxy_config=None: "fallback transcript"
+                lambda _video_id, _languages, proxy_config=None, **_kwargs: "fallback transcript"
             )
             transcript, warnings = youtube.fetch_transcript(
                 "dQw4w9WgXcQ",
@@ -48,6 +49,7 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
             _video_id: str,
             _languages: list[str],
             proxy_config=None,
+            **_kwargs,
         ) -> str | None:
             raise ssl.SSLError("[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed")
 
@@ -73,6 +75,7 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
             _video_id: str,
             _languages: list[str],
             proxy_config=None,
+            **_kwargs,
         ) -> str | None:
             raise RuntimeError("boom happened")
 
@@ -126,6 +129,7 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
             _video_id: str,
             _languages: list[str],
             proxy_config=None,
+            **_kwargs,
         ) -> str | None:
             raise RuntimeError("RequestBlocked: status 429")
 
@@ -143,7 +147,7 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
         original_fetch = pipeline.fetch_transcript
         try:
             pipeline.fetch_transcript = (
-                lambda _video_id, _languages, allow_insecure_ssl_fallback=True, proxy_config=None: (
+                lambda _video_id, _languages, allow_insecure_ssl_fallback=True, proxy_config=None, **_kwargs: (
                     None,
                     ["Transcript fetch failed: SSLError: certificate verify failed"],
                 )
@@ -167,7 +171,7 @@ class TranscriptDiagnosticsTest(unittest.TestCase):
         sleep_calls: list[float] = []
         try:
             pipeline.fetch_transcript = (
-                lambda _video_id, _languages, allow_insecure_ssl_fallback=True, proxy_config=None: (
+                lambda _video_id, _languages, allow_insecure_ssl_fallback=True, proxy_config=None, **_kwargs: (
                     "a" * 800,
                     [],
                 )
@@ -0,0 +1,144 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from youtube_transcript_api import NoTranscriptFound
+
+from economic_youtube_headline_skill import youtube
+from economic_youtube_headline_skill.transcript_probe import (
+    DOOMED_AFTER,
+    ChannelLanguageMemo,
+    TranscriptProber,
+)
+from economic_youtube_headline_skill.warning_codes import warning
+
+CHANNEL_ID = "UC1234567890123456789012"
+TEXT_XML = '<?xml version="1.0" encoding="utf-8" ?><transcript><text start="0" dur="1">금리 동결</text></transcript>'
+EMPTY_XML = '<?xml version="1.0" encoding="utf-8" ?><transcript></transcript>'
+
+
+class _Response:
+    def __init__(self, body: str = "", payload: dict | None = None) -> None:
+        self.status_code = 200
+        self.text = body
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self._payload or {}
+
+
+class _Session:
+    def __init__(self, tracks: dict[str, str]) -> None:
+        # tracks: "kind:lang" -> timedtext body
+        self.tracks = tracks
+        self.headers: dict[str, str] = {}
+        self.hooks: dict[str, list] = {"response": []}
+        self.requests: list[str] = []
+
+    def get(self, url: str, **_kwargs) -> _Response:  # noqa: ANN003
+        if "/watch" in url:
+            self.requests.append("watch")
+            return _Response('<script>ytcfg.set({"INNERTUBE_API_KEY": "standin"});</script>')
+        label = url.rsplit("track=", 1)[-1]
+        self.requests.append(f"timedtext:{label}")
+        return _Response(self.tracks[label])
+
+    def post(self, url: str, json: dict, **_kwargs) -> _Response:  # noqa: A002, ANN003
+        self.requests.append("player")
+        captions = [
+            {
+                "baseUrl": f"https://www.youtube.com/api/timedtext?v={json['videoId']}&track={label}",
+                "name": {"runs": [{"text": label}]},
+                "languageCode": label.split(":", 1)[1],
+                **({"kind": "asr"} if label.startswith("auto:") else {}),
+            }
+            for label in self.tracks
+        ]
+        return _Response(
+            payload={
+                "playabilityStatus": {"status": "OK"},
+                "videoDetails": {"videoId": json["videoId"], "channelId": CHANNEL_ID},
+                "captions": {"playerCaptionsTracklistRenderer": {"captionTracks": captions}},
+            }
+        )
+
+
+class _RenamedInternalsApi:
+    # Stands in for a library release whose fetcher internals moved.
+    def __init__(self) -> None:
+        self._fetcher = object()
+        self.public_fetches = 0
+
+    def fetch(self, _video_id: str, languages: list[str]) -> list[dict[str, str]]:
+        self.public_fetches += 1
+        return [{"text": "금리 동결"}]
+
+
+def _fetch(session: _Session, prober: TranscriptProber, languages: list[str]) -> str | None:
+    session.requests.clear()
+    return youtube._fetch_transcript_default("dQw4w9WgXcQ", languages, http_client=session, prober=prober)
+
+
+class TranscriptProbeTest(unittest.TestCase):
+    def test_later_probes_skip_the_watch_page(self) -> None:
+        session = _Session({"auto:ko": TEXT_XML})
+        prober = TranscriptProber()
+        self.assertEqual(_fetch(session, prober, ["ko"]), "금리 동결")
+        self.assertEqual(session.requests, ["watch", "player", "timedtext:auto:ko"])
+        _fetch(session, prober, ["ko"])
+        self.assertEqual(session.requests, ["player", "timedtext:auto:ko"])
+
+    def test_missing_language_stops_after_the_probe(self) -> None:
+        session = _Session({"manual:ja": TEXT_XML})
+        prober = TranscriptProber()
+        with self.assertRaises(NoTranscriptFound):
+            _fetch(session, prober, ["ko", "en"])
+        self.assertEqual(session.requests, ["watch", "player"])
+        self.assertEqual(prober.memo.entries[CHANNEL_ID]["manual:ja"].seen, 1)
+
+    def test_channel_memo_requests_the_working_track_first(self) -> None:
+        session = _Session({"manual:ko": EMPTY_XML, "auto:en": TEXT_XML})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "channel-languages.json"
+            prober = TranscriptProber(ChannelLanguageMemo.load(path))
+            self.assertEqual(_fetch(session, prober, ["ko", "en"]), "금리 동결")
+            self.assertEqual(session.requests[-2:], ["timedtext:manual:ko", "timedtext:auto:en"])
+            prober.memo.save()
+
+            # A new run learns the key again but goes straight to the track that worked.
+            prober = TranscriptProber(ChannelLanguageMemo.load(path))
+            self.assertEqual(_fetch(session, prober, ["ko", "en"]), "금리 동결")
+            self.assertEqual(session.requests, ["watch", "player", "timedtext:auto:en"])
+
+    def test_doomed_tracks_are_skipped(self) -> None:
+        session = _Session({"manual:ko": EMPTY_XML})
+        prober = TranscriptProber()
+        for _ in range(DOOMED_AFTER):
+            self.assertIsNone(_fetch(session, prober, ["ko"]))
+        session.requests.clear()
+        text, warnings = youtube.fetch_transcript("dQw4w9WgXcQ", ["ko"], http_client=session, prober=prober)
+        self.assertEqual(session.requests, ["player"])
+        # The memo, not YouTube, suppressed this fetch; the result says so.
+        self.assertIsNone(text)
+        self.assertEqual(warnings, [warning("transcript_memo_skipped", tracks="manual:ko")])
+
+    def test_changed_library_internals_fall_back_to_the_public_fetch(self) -> None:
+        api = _RenamedInternalsApi()
+        prober = TranscriptProber()
+        self.assertEqual(prober.fetch(api, "dQw4w9WgXcQ", ["ko"]), "금리 동결")
+        self.assertEqual(prober.fetch(api, "dQw4w9WgXcQ", ["ko"]), "금리 동결")
+        self.assertEqual(api.public_fetches, 2)
+        self.assertTrue(prober._disabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
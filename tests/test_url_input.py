@@ -0,0 +1,103 @@
+import gzip
+import io
+import itertools
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill import generate, youtube
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.url_input import dedupe_video_urls, iter_input_lines
+
+LINES = [
+    "# archived 2026-02",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "",
+    "  https://youtu.be/dQw4w9WgXcQ?si=share  ",
+    "https://www.youtube.com/live/oHg5SJYRHA0?feature=share",
+    "not a url",
+    "not a url",
+]
+EXPECTED = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/live/oHg5SJYRHA0?feature=share",
+    "not a url",
+]
+
+
+class UrlInputTest(unittest.TestCase):
+    def test_plain_and_gzip_files_stream_and_dedupe_by_video_id(self) -> None:
+        payload = "\n".join(LINES).encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = Path(tmp) / "urls.txt"
+            packed = Path(tmp) / "urls.archive"
+            plain.write_bytes(payload)
+            packed.write_bytes(gzip.compress(payload))
+            for path in (plain, packed):
+                self.assertEqual(list(dedupe_video_urls(iter_input_lines(str(path)), batch_size=2)), EXPECTED)
+
+    def test_gzip_input_closes_the_underlying_file(self) -> None:
+        opened: list[io.BufferedReader] = []
+        original_open = Path.open
+
+        def track(path: Path, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            handle = original_open(path, *args, **kwargs)
+            opened.append(handle)
+            return handle
+
+        with tempfile.TemporaryDirectory() as tmp:
+            packed = Path(tmp) / "urls.gz"
+            packed.write_bytes(gzip.compress("\n".join(LINES).encode("utf-8")))
+            with mock.patch.object(Path, "open", track):
+                self.assertEqual(len(list(iter_input_lines(str(packed)))), 5)
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+    def test_stdin_input(self) -> None:
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(gzip.compress("\n".join(LINES).encode("utf-8")))))
+        with mock.patch.object(sys, "stdin", stdin):
+            urls, warnings = generate._collect_urls(Settings(), video_urls=[], input_file="-")
+        self.assertEqual((urls, warnings), (EXPECTED, []))
+        self.assertFalse(stdin.closed)
+
+    def test_dedupe_is_lazy(self) -> None:
+        endless = (f"https://youtu.be/{index:011d}" for index in itertools.count())
+        head = list(itertools.islice(dedupe_video_urls(endless, batch_size=16), 3))
+        self.assertEqual(head, [f"https://youtu.be/{index:011d}" for index in range(3)])
+
+    def test_fast_path_agrees_with_urlparse(self) -> None:
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10",
+            "https://m.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/live/dQw4w9WgXcQ?v=oHg5SJYRHA0",
+            "https://youtu.be/dQw4w9WgXcQ/x?a=1&v=oHg5SJYRHA0",
+            "https://www.youtube.com/watch?feature=share&v=aqz-KE-bpKQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ/",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ?x=1",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ#t=10",
+        ]
+
+        def parse(url: str) -> str | None:
+            try:
+                return youtube.parse_video_id(url)
+            except ValueError:
+                return None
+
+        fast = [parse(url) for url in urls]
+        with mock.patch.object(youtube, "_VIDEO_ID_FAST_RE", re.compile(r"(?!)")):
+            slow = [parse(url) for url in urls]
+        self.assertEqual(fast, slow)
+        self.assertEqual(fast[2], "oHg5SJYRHA0")
+        self.assertEqual(fast[5:7], [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import argparse
+import csv
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from economic_youtube_headline_skill.cli_support import wants_compact_warnings
+from economic_youtube_headline_skill.models import (
+    BatchResult,
+    HeadlineResult,
+    ProcessingStatus,
+    VideoDescriptor,
+)
+from economic_youtube_headline_skill.render import render_json, write_csv, write_json
+from economic_youtube_headline_skill.serialize import encode_batch, encode_result
+from economic_youtube_headline_skill.settings import Settings
+from economic_youtube_headline_skill.warning_codes import SPECS, compact_warnings, spec_for, warning
+
+BLOCKED = warning("transcript_blocked")
+
+
+def _batch() -> BatchResult:
+    return BatchResult(
+        run_id="abc",
+        generated_at="2026-02-16T00:00:00+00:00",
+        results=[
+            HeadlineResult(
+                status=ProcessingStatus.UNAVAILABLE,
+                video=VideoDescriptor(video_id="dQw4w9WgXcQ", url="https://youtu.be/dQw4w9WgXcQ"),
+                warnings=[BLOCKED, warning("transcript_unavailable"), "custom note"],
+            ),
+            HeadlineResult(
+                status=ProcessingStatus.UNAVAILABLE,
+                video=VideoDescriptor(video_id="oHg5SJYRHA0", url="https://youtu.be/oHg5SJYRHA0"),
+                warnings=[warning("transcript_fetch_failed", error="RuntimeError: boom")],
+            ),
+        ],
+    )
+
+
+class WarningCodesTest(unittest.TestCase):
+    def test_codes_are_recovered_from_formatted_messages(self) -> None:
+        for spec in SPECS.values():
+            text = spec.template.format(error="ValueError: x", retries="2 retries", seconds=0.5, tracks="manual:ko")
+            self.assertIs(spec_for(text), spec)
+        self.assertIsNone(spec_for("custom note"))
+        self.assertEqual(
+            compact_warnings([BLOCKED, "custom note"])[1],
+            ["transcript_blocked", "other"],
+        )
+
+    def test_unknown_warning_format_is_rejected(self) -> None:
+        self.assertTrue(wants_compact_warnings(argparse.Namespace(warning_format=None), Settings(warning_format="compact")))
+        self.assertFalse(wants_compact_warnings(argparse.Namespace(warning_format="full"), Settings()))
+        with self.assertRaises(ValueError):
+            wants_compact_warnings(argparse.Namespace(warning_format=None), Settings(warning_format="compcat"))
+
+    def test_compact_round_trip_restores_interned_full_warnings(self) -> None:
+        batch = _batch()
+        payload = json.loads(json.dumps(batch.to_dict(compact=True)))
+        self.assertEqual(payload["results"][0]["warning_codes"], ["transcript_blocked", "transcript_unavailable", "other"])
+        self.assertLess(len(payload["results"][0]["warnings"][0]), len(BLOCKED))
+        self.assertEqual(payload["warning_catalog"], {"transcript_blocked": BLOCKED})
+
+        restored = [HeadlineResult.from_dict(item) for item in payload["results"]]
+        self.assertEqual([item.warnings for item in restored], [item.warnings for item in batch.results])
+        self.assertIs(restored[0].warnings[0], BLOCKED)
+
+        legacy = HeadlineResult.from_dict(json.loads(json.dumps(batch.results[0].to_dict())))
+        self.assertIs(legacy.warnings[0], BLOCKED)
+
+    def test_full_format_is_unchanged(self) -> None:
+        batch = _batch()
+        self.assertNotIn("warning_catalog", batch.to_dict())
+        self.assertNotIn("warning_codes", batch.results[0].to_dict())
+
+    def test_encoders_match_json_dumps_in_compact_mode(self) -> None:
+        batch = _batch()
+        for item in batch.results:
+            self.assertEqual(encode_result(item, True), json.dumps(item.to_dict(True), ensure_ascii=False))
+        self.assertEqual(encode_batch(batch, True), json.dumps(batch.to_dict(True), ensure_ascii=False))
+
+        buffer = io.StringIO()
+        write_json(batch, buffer, True)
+        self.assertEqual(buffer.getvalue(), render_json(batch, True) + "\n")
+
+    def test_csv_adds_warning_codes_column(self) -> None:
+        buffer = io.StringIO()
+        write_csv(_batch().results, buffer, "abc", compact=True)
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        self.assertEqual(rows[1]["warning_codes"], "transcript_fetch_failed")
+        self.assertEqual(rows[1]["warnings"], "Transcript fetch failed: RuntimeError: boom")
+
+
+if __name__ == "__main__":
+    unittest.main()